@@ -0,0 +1,235 @@
+import numpy as np
+
+from Nuclide_Chart_Binding_Engine import (
+    ALPHA_BOND_OVERLAP,
+    C2,
+    COMPRESSION_HE4,
+    JOULES_TO_MEV,
+    R_NUCLEON,
+    RHO_MEDIUM_NUCLEAR,
+    nucleon_volume,
+)
+from Validation_Result import ValidationResult, validation
+
+# PPT-Atoms Validation Suite v1.0.0
+# Script: Alpha_Cluster_Lattice_Solver.py
+# Author: Vladimir Milosevic
+# Theory: Plasma Pressure Theory (PPT) 3.0
+# Description: Generalizes the Carbon-12 alpha triangle to any alpha-cluster geometry (Be-8 .. Ca-40) with interface overlaps from actual sphere positions.
+
+# Contacts are detected on unit-edge geometries with this relative tolerance
+CONTACT_TOLERANCE = 1e-6
+
+
+# --- 1. THE ALPHA SPHERE ---
+def alpha_radius(r_nucleon=R_NUCLEON):
+    # A He-4 cluster displaces the volume of its 4 nucleons: R_alpha = r_n * 4^(1/3)
+    return np.asarray(r_nucleon, dtype=np.float64) * 4 ** (1 / 3)
+
+
+def lens_volume(distance, radius):
+    # Overlap of two equal spheres of radius R whose centres are d apart:
+    # V = pi (4R + d)(2R - d)^2 / 12 for d < 2R, zero once they no longer touch
+    d = np.asarray(distance, dtype=np.float64)
+    R = np.asarray(radius, dtype=np.float64)
+    return np.where(d < 2 * R, np.pi * (4 * R + d) * (2 * R - d)**2 / 12, 0.0)
+
+
+def calibrate_separation(alpha_bond_overlap=ALPHA_BOND_OVERLAP, r_nucleon=R_NUCLEON, iterations=100):
+    # Centre distance d at which ONE alpha-alpha lens holds the Carbon-12 interface share:
+    # 3 lenses = 12 V_n * overlap  <=>  lens(d) = V_alpha * overlap.
+    # Lens volume falls monotonically on [0, 2R], so bisection converges for any array input.
+    R = alpha_radius(r_nucleon)
+    target = 4 * nucleon_volume(r_nucleon) * np.asarray(alpha_bond_overlap, dtype=np.float64)
+    lo, hi = np.zeros(np.broadcast(R, target).shape), np.broadcast_to(2 * R, np.broadcast(R, target).shape)
+    for _ in range(iterations):
+        mid = 0.5 * (lo + hi)
+        too_much_overlap = lens_volume(mid, R) > target
+        lo = np.where(too_much_overlap, mid, lo)
+        hi = np.where(too_much_overlap, hi, mid)
+    separation = 0.5 * (lo + hi)
+    return separation if separation.ndim else float(separation)
+
+
+# --- 2. ALPHA-CONJUGATE GEOMETRIES (unit alpha-alpha contact distance) ---
+def _tetrahedron():
+    return np.array([[1, 1, 1], [1, -1, -1], [-1, 1, -1], [-1, -1, 1]], dtype=np.float64) / np.sqrt(8)
+
+
+def polytetrahedral_cluster(n_alphas):
+    # Grows a cluster from the O-16 tetrahedron by capping triangular faces: each new alpha
+    # sits on three mutually touching ones. The cap with the most contacts wins (ties go to
+    # the most compact cluster), which gives the Ne-20 trigonal bipyramid at five alphas.
+    if n_alphas <= 4:
+        return alpha_geometry(n_alphas)
+    points = _tetrahedron()
+    height = np.sqrt(2 / 3)
+    while len(points) < n_alphas:
+        i, j = neighbour_pairs(points, 1 + CONTACT_TOLERANCE)[:2]
+        touching = set(zip(i.tolist(), j.tolist()))
+        best = None
+        for a, b in sorted(touching):
+            for c in range(b + 1, len(points)):
+                if (a, c) not in touching or (b, c) not in touching:
+                    continue
+                centroid = points[[a, b, c]].mean(axis=0)
+                normal = np.cross(points[b] - points[a], points[c] - points[a])
+                normal /= np.linalg.norm(normal)
+                for sign in (1, -1):
+                    candidate = centroid + sign * height * normal
+                    distance = np.linalg.norm(points - candidate, axis=1)
+                    if distance.min() < 1 - CONTACT_TOLERANCE:
+                        continue
+                    contacts = int(np.count_nonzero(distance < 1 + CONTACT_TOLERANCE))
+                    grown = np.vstack((points, candidate))
+                    spread = float(np.sum((grown - grown.mean(axis=0))**2))
+                    score = (-contacts, round(spread, 9))
+                    if best is None or score < best[0]:
+                        best = (score, candidate)
+        points = np.vstack((points, best[1]))
+    return points
+
+
+def alpha_geometry(n_alphas):
+    # Be-8 dumbbell, C-12 triangle, O-16 tetrahedron; larger chains grow polytetrahedrally
+    if n_alphas == 1:
+        return np.zeros((1, 3))
+    if n_alphas == 2:
+        return np.array([[0, 0, 0], [1, 0, 0]], dtype=np.float64)
+    if n_alphas == 3:
+        return np.array([[0, 0, 0], [1, 0, 0], [0.5, np.sqrt(3) / 2, 0]])
+    if n_alphas == 4:
+        return _tetrahedron()
+    return polytetrahedral_cluster(n_alphas)
+
+
+def lattice_cluster(n_alphas):
+    # A roughly spherical fcc ball of n alphas (unit nearest-neighbour distance), for
+    # alpha matter far beyond Ca-40
+    side = int(np.ceil((n_alphas * np.sqrt(2)) ** (1 / 3))) + 2
+    grid = np.arange(-side, side + 1)
+    i, j, k = np.meshgrid(grid, grid, grid, indexing='ij')
+    sites = np.column_stack((i.ravel(), j.ravel(), k.ravel()))
+    sites = sites[sites.sum(axis=1) % 2 == 0] / np.sqrt(2)
+    order = np.argsort(np.einsum('ij,ij->i', sites, sites), kind='stable')
+    return sites[order[:n_alphas]]
+
+
+# name: (Z, number of alphas, experimental binding energy in MeV)
+ALPHA_CONJUGATE_NUCLEI = {
+    "Be-8":  (4, 2, 56.50),
+    "C-12":  (6, 3, 92.16),
+    "O-16":  (8, 4, 127.62),
+    "Ne-20": (10, 5, 160.64),
+    "Mg-24": (12, 6, 198.26),
+    "Si-28": (14, 7, 236.54),
+    "S-32":  (16, 8, 271.78),
+    "Ar-36": (18, 9, 306.72),
+    "Ca-40": (20, 10, 342.05),
+}
+
+
+# --- 3. SPATIAL NEIGHBOUR INDEX ---
+# 13 of the 26 neighbouring cells: together with the home cell every pair is visited once
+_HALF_SHELL = np.array([(dx, dy, dz) for dx in (-1, 0, 1) for dy in (-1, 0, 1) for dz in (-1, 0, 1)
+                        if (dx, dy, dz) > (0, 0, 0)], dtype=np.int64)
+
+
+def neighbour_pairs(points, cutoff):
+    # All pairs (i < j) closer than cutoff, via a uniform cell list with cell size = cutoff.
+    # Each point only meets the points of its own and 13 neighbouring cells, so the cost is
+    # O(N) for a bounded packing density instead of the O(N^2) all-pairs scan.
+    points = np.asarray(points, dtype=np.float64)
+    n = len(points)
+    if n < 2:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty, np.empty(0)
+
+    cells = np.floor((points - points.min(axis=0)) / cutoff).astype(np.int64) + 1
+    dims = cells.max(axis=0) + 2
+    keys = np.ravel_multi_index(cells.T, dims)
+    order = np.argsort(keys, kind='stable')
+    sorted_keys = keys[order]
+
+    first, second = [], []
+    for offset in np.vstack(([0, 0, 0], _HALF_SHELL)):
+        target = np.ravel_multi_index((cells + offset).T, dims)
+        lo = np.searchsorted(sorted_keys, target, side='left')
+        hi = np.searchsorted(sorted_keys, target, side='right')
+        counts = hi - lo
+        # Candidate (i, j) pairs for this offset without a Python loop over points
+        i = np.repeat(np.arange(n), counts)
+        j = order[np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts) + np.repeat(lo, counts)]
+        if not offset.any():
+            keep = i < j
+            i, j = i[keep], j[keep]
+        first.append(i)
+        second.append(j)
+
+    i, j = np.concatenate(first), np.concatenate(second)
+    distance = np.linalg.norm(points[i] - points[j], axis=1)
+    close = distance < cutoff
+    i, j, distance = i[close], j[close], distance[close]
+    swap = i > j
+    i[swap], j[swap] = j[swap], i[swap]
+    return i, j, distance
+
+
+# --- 4. TOTAL PPT ENERGY CALCULATION ---
+def cluster_binding_energy(unit_positions, alpha_bond_overlap=ALPHA_BOND_OVERLAP, compression_He4=COMPRESSION_HE4,
+                           r_nucleon=R_NUCLEON, rho_medium=RHO_MEDIUM_NUCLEAR):
+    # E = rho c^2 [ n_alpha * V_alpha * Phi_He4 + sum over touching pairs of lens(d_ij) ]
+    # unit_positions: alpha centres with unit contact distance, scaled by the calibrated d
+    unit_positions = np.asarray(unit_positions, dtype=np.float64)
+    R = alpha_radius(r_nucleon)
+    separation = calibrate_separation(alpha_bond_overlap, r_nucleon)
+    positions = unit_positions * separation
+    _, _, distance = neighbour_pairs(positions, 2 * R)
+
+    v_alpha = 4 * nucleon_volume(r_nucleon)
+    delta_v_clusters = len(positions) * v_alpha * compression_He4
+    delta_v_bonds = float(np.sum(lens_volume(distance, R)))
+    pressure = rho_medium * C2
+    return {
+        "n_alphas": len(positions),
+        "n_bonds": int(distance.size),
+        "separation_m": separation,
+        "E_clusters_MeV": pressure * delta_v_clusters / JOULES_TO_MEV,
+        "E_bonds_MeV": pressure * delta_v_bonds / JOULES_TO_MEV,
+        "E_total_MeV": pressure * (delta_v_clusters + delta_v_bonds) / JOULES_TO_MEV,
+    }
+
+
+# --- 5. VALIDATION ---
+@validation
+def solve_alpha_conjugate_chain():
+    print("--- PPT - Atoms: PPT 3.0: Alpha-Conjugate Cluster Lattice Solver ---")
+
+    R = alpha_radius()
+    separation = calibrate_separation()
+    print(f"1. Alpha Sphere Radius (4 nucleon volumes): {R * 1e15:.4f} fm")
+    print(f"2. Calibrated Alpha-Alpha Separation:      {separation * 1e15:.4f} fm "
+          f"(C-12 interface = {ALPHA_BOND_OVERLAP * 100:.3f}%)\n")
+
+    print(f"{'Nucleus':<7} | {'Alphas':>6} | {'Bonds':>5} | {'Clusters':>8} | {'Bonds':>6} | "
+          f"{'PPT (MeV)':>9} | {'Real (MeV)':>10} | {'Accuracy':>8}")
+    print("-" * 82)
+    results = []
+    for name, (Z, n_alphas, real) in ALPHA_CONJUGATE_NUCLEI.items():
+        energy = cluster_binding_energy(alpha_geometry(n_alphas))
+        result = ValidationResult(None, name, energy["E_total_MeV"], real, "MeV",
+                                  {"Z": Z, "n_alphas": n_alphas, "n_bonds": energy["n_bonds"],
+                                   "alpha_bond_overlap": ALPHA_BOND_OVERLAP})
+        results.append(result)
+        print(f"{name:<7} | {n_alphas:>6} | {energy['n_bonds']:>5} | {energy['E_clusters_MeV']:>8.2f} | "
+              f"{energy['E_bonds_MeV']:>6.2f} | {energy['E_total_MeV']:>9.2f} | {real:>10.2f} | "
+              f"{result.accuracy:>7.2f}%")
+
+    print("\nMechanical Conclusion:")
+    print("One alpha-alpha interface, calibrated on the Carbon-12 triangle, carries the")
+    print("binding of the whole alpha-conjugate chain through its contact geometry alone.")
+    return results
+
+
+if __name__ == "__main__":
+    solve_alpha_conjugate_chain()
@@ -0,0 +1,240 @@
+import math
+from statistics import NormalDist
+
+import numpy as np
+
+# PPT-Atoms Validation Suite v1.0.0
+# Module: Anisotropy_Statistics_Engine.py
+# Author: Vladimir Milosevic
+# Theory: Plasma Pressure Theory (PPT) 3.0
+# Description: Streaming spherical-harmonic anisotropy tests that separate tetrahedral cleavage from isotropic emission.
+
+# Directions read from disk per batch (~25 MB of float64)
+DEFAULT_CHUNK_SIZE = 2**20
+
+# Under isotropy E[(xyz)^2] = 1/105 on the unit sphere
+TETRAHEDRAL_VARIANCE = 1 / 105
+
+_STANDARD_NORMAL = NormalDist()
+
+
+# --- 1. REAL SPHERICAL HARMONICS ---
+def harmonic_modes(lmax):
+    # (l, m) ordering used by every moment vector in this module (the l=0 monopole is skipped)
+    return [(l, m) for l in range(1, lmax + 1) for m in range(-l, l + 1)]
+
+
+def real_spherical_harmonics(directions, lmax=4):
+    # Orthonormal real Y_lm evaluated at unit vectors -> (n_events, n_modes)
+    x, y, z = directions[:, 0], directions[:, 1], directions[:, 2]
+    phi = np.arctan2(y, x)
+    sintheta = np.sqrt(np.clip(1 - z**2, 0, None))
+
+    # Associated Legendre P_l^m(z) by the standard upward recurrence
+    legendre = {}
+    p_mm = np.ones_like(z)
+    for m in range(lmax + 1):
+        if m > 0:
+            p_mm = -(2 * m - 1) * sintheta * p_mm
+        legendre[(m, m)] = p_mm
+        if m < lmax:
+            legendre[(m + 1, m)] = (2 * m + 1) * z * p_mm
+        for l in range(m + 2, lmax + 1):
+            legendre[(l, m)] = ((2 * l - 1) * z * legendre[(l - 1, m)]
+                                - (l + m - 1) * legendre[(l - 2, m)]) / (l - m)
+
+    modes = harmonic_modes(lmax)
+    values = np.empty((directions.shape[0], len(modes)))
+    for k, (l, m) in enumerate(modes):
+        a = abs(m)
+        norm = math.sqrt((2 * l + 1) / (4 * math.pi) * math.factorial(l - a) / math.factorial(l + a))
+        if m == 0:
+            values[:, k] = norm * legendre[(l, 0)]
+        elif m > 0:
+            values[:, k] = math.sqrt(2) * norm * legendre[(l, a)] * np.cos(a * phi)
+        else:
+            values[:, k] = math.sqrt(2) * norm * legendre[(l, a)] * np.sin(a * phi)
+    return values
+
+
+# --- 2. STREAMING MOMENT ACCUMULATION ---
+def iter_npy_chunks(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    # Memory-mapped (n, 3) direction file; only one chunk is ever resident
+    directions = np.load(path, mmap_mode='r')
+    if directions.ndim != 2 or directions.shape[1] != 3:
+        raise ValueError(f"{path} must hold an (n_events, 3) array of directions, got {directions.shape}")
+    for start in range(0, directions.shape[0], chunk_size):
+        yield np.asarray(directions[start:start + chunk_size], dtype=np.float64)
+
+
+def write_directions_npy(path, directions_stream, n_events):
+    # Writes a generated stream (e.g. Fasifiable_Cleavage_And_Alpha_Decay.stream_emission_directions)
+    # straight into a memory-mapped .npy file without holding it in RAM
+    out = np.lib.format.open_memmap(path, mode='w+', dtype=np.float64, shape=(int(n_events), 3))
+    cursor = 0
+    for chunk in directions_stream:
+        out[cursor:cursor + len(chunk)] = chunk
+        cursor += len(chunk)
+    out.flush()
+    del out
+    return path
+
+
+def accumulate_moments(directions_stream, lmax=4):
+    # Running sums of every Y_lm and of the tetrahedral invariant xyz.
+    # Each chunk is re-normalised so slightly off-sphere detector data is accepted.
+    n_modes = len(harmonic_modes(lmax))
+    n_events = 0
+    harmonic_sums = np.zeros(n_modes)
+    xyz_sum = 0.0
+    for directions in directions_stream:
+        directions = directions / np.linalg.norm(directions, axis=1, keepdims=True)
+        n_events += directions.shape[0]
+        harmonic_sums += real_spherical_harmonics(directions, lmax).sum(axis=0)
+        xyz_sum += float(np.sum(directions[:, 0] * directions[:, 1] * directions[:, 2]))
+    return {"lmax": lmax, "n_events": n_events, "harmonic_sums": harmonic_sums, "xyz_sum": xyz_sum}
+
+
+def merge_moments(*moments):
+    # Moments from independent chunks, files or workers add up exactly
+    lmax = moments[0]["lmax"]
+    return {
+        "lmax": lmax,
+        "n_events": sum(m["n_events"] for m in moments),
+        "harmonic_sums": np.sum([m["harmonic_sums"] for m in moments], axis=0),
+        "xyz_sum": sum(m["xyz_sum"] for m in moments),
+    }
+
+
+# --- 3. SIGNIFICANCE ARITHMETIC ---
+def chi2_survival(x, dof):
+    # Closed-form chi-square tail for odd degrees of freedom (every 2l+1 power statistic)
+    if dof % 2 != 1:
+        raise ValueError("chi2_survival is only defined here for odd degrees of freedom")
+    if x <= 0:
+        return 1.0
+    tail = math.erfc(math.sqrt(x / 2))
+    term = math.sqrt(2 * x / math.pi) * math.exp(-x / 2)
+    for j in range(1, (dof - 1) // 2 + 1):
+        tail += term
+        term *= x / (2 * j + 1)
+    return min(tail, 1.0)
+
+
+def sigma_from_p(p_value, statistic=None, dof=None):
+    # One-sided Gaussian-equivalent significance; Wilson-Hilferty once the tail underflows
+    if p_value > 0:
+        return max(-_STANDARD_NORMAL.inv_cdf(min(p_value, 1 - 1e-16)), 0.0)
+    k = dof
+    return ((statistic / k) ** (1 / 3) - (1 - 2 / (9 * k))) / math.sqrt(2 / (9 * k))
+
+
+def anisotropy_statistics(moments):
+    # Per-multipole power S_l = (4 pi / N) * sum_m (sum_i Y_lm)^2 ~ chi2(2l+1) under isotropy
+    lmax, n = moments["lmax"], moments["n_events"]
+    modes = harmonic_modes(lmax)
+    sums = moments["harmonic_sums"]
+
+    multipoles = []
+    for l in range(1, lmax + 1):
+        idx = [k for k, (ll, _) in enumerate(modes) if ll == l]
+        power = 4 * math.pi / n * float(np.sum(sums[idx]**2))
+        dof = 2 * l + 1
+        p_value = chi2_survival(power, dof)
+        multipoles.append({
+            "l": l,
+            "statistic": power,
+            "dof": dof,
+            "p_value": p_value,
+            "sigma": sigma_from_p(p_value, power, dof),
+        })
+
+    # Tetrahedral order: mean of xyz in the lattice frame (zero-mean, variance 1/105 if isotropic)
+    z_tetra = moments["xyz_sum"] / math.sqrt(n * TETRAHEDRAL_VARIANCE)
+    p_tetra = math.erfc(abs(z_tetra) / math.sqrt(2))
+
+    return {
+        "n_events": n,
+        "multipoles": multipoles,
+        "dipole": multipoles[0],
+        "quadrupole": multipoles[1] if lmax >= 2 else None,
+        "tetrahedral": {
+            "order": moments["xyz_sum"] / n * 3 * math.sqrt(3),  # 1.0 for perfect vertex emission
+            "z_score": z_tetra,
+            "p_value": p_tetra,
+            "sigma": abs(z_tetra),
+        },
+    }
+
+
+def significance_curve(moments, event_counts):
+    # Expected (Asimov) significance vs. event count for a signal whose per-event
+    # moments are estimated from `moments`: E[S_l](N) = (2l+1) + 4 pi N sum_m <Y_lm>^2
+    lmax, n = moments["lmax"], moments["n_events"]
+    modes = harmonic_modes(lmax)
+    mean_harmonics = moments["harmonic_sums"] / n
+    mean_xyz = moments["xyz_sum"] / n
+
+    event_counts = np.asarray(event_counts, dtype=np.float64)
+    curves = {f"l={l}": np.empty(event_counts.size) for l in range(1, lmax + 1)}
+    curves["tetrahedral"] = np.abs(mean_xyz) * np.sqrt(event_counts / TETRAHEDRAL_VARIANCE)
+
+    for l in range(1, lmax + 1):
+        idx = [k for k, (ll, _) in enumerate(modes) if ll == l]
+        signal_power = 4 * math.pi * float(np.sum(mean_harmonics[idx]**2))
+        dof = 2 * l + 1
+        for i, events in enumerate(event_counts):
+            expected = dof + signal_power * events
+            curves[f"l={l}"][i] = sigma_from_p(chi2_survival(expected, dof), expected, dof)
+
+    return event_counts, curves
+
+
+def events_for_significance(event_counts, curve, target_sigma=5.0):
+    # First event count on the curve that reaches the target significance (log-interpolated)
+    above = np.nonzero(curve >= target_sigma)[0]
+    if above.size == 0:
+        return None
+    i = above[0]
+    if i == 0:
+        return float(event_counts[0])
+    f = (target_sigma - curve[i - 1]) / (curve[i] - curve[i - 1])
+    return float(np.exp(np.log(event_counts[i - 1]) + f * (np.log(event_counts[i]) - np.log(event_counts[i - 1]))))
+
+
+def analyze_npy_anisotropy(path, lmax=4, chunk_size=DEFAULT_CHUNK_SIZE):
+    # Full falsification test of a detector-sized direction file
+    return anisotropy_statistics(accumulate_moments(iter_npy_chunks(path, chunk_size), lmax))
+
+
+def run_anisotropy_falsification(n_events=200000, seed=2026):
+    from Fasifiable_Cleavage_And_Alpha_Decay import stream_emission_directions
+
+    print("--- PPT - Atoms: PPT 3.0: Cleavage vs. Isotropic Anisotropy Test ---")
+
+    print(f"\n{'Model':<10} | {'Dipole (sig)':<12} | {'Quadrupole (sig)':<16} | {'l=3 (sig)':<10} | {'Tetra Order':<11} | {'Tetra z':<8}")
+    print("-" * 84)
+
+    results = {}
+    for model in ("isotropic", "ppt"):
+        moments = accumulate_moments(stream_emission_directions(n_events, model, seed=seed))
+        stats = anisotropy_statistics(moments)
+        results[model] = (moments, stats)
+        l3 = stats["multipoles"][2]
+        print(f"{model:<10} | {stats['dipole']['sigma']:<12.2f} | {stats['quadrupole']['sigma']:<16.2f} | "
+              f"{l3['sigma']:<10.2f} | {stats['tetrahedral']['order']:<11.4f} | {stats['tetrahedral']['z_score']:<8.2f}")
+
+    counts, curves = significance_curve(results["ppt"][0], np.logspace(1, 6, 51))
+    print("\nEvents required for a 5-sigma rejection of isotropy:")
+    for name, curve in curves.items():
+        needed = events_for_significance(counts, curve)
+        print(f"   {name:<12}: {needed:,.0f} events" if needed else f"   {name:<12}: > {counts[-1]:,.0f} events")
+
+    print("\nMechanical Conclusion:")
+    print("Tetrahedral cleavage leaves its signature in the l=3 multipole (the xyz invariant),")
+    print("which a few dozen emission events already separate from isotropic tunnelling.")
+    return results
+
+
+if __name__ == "__main__":
+    run_anisotropy_falsification()
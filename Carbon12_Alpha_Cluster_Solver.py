@@ -1,12 +1,14 @@
-import numpy as np
 import math
 
+from Validation_Result import ValidationResult, validation
+
 # PPT-Atoms Validation Suite v1.0.0
 # Script: Carbon12_Alpha_Cluster_Solver.py
 # Author: Vladimir Milosevic
 # Theory: Plasma Pressure Theory (PPT) 3.0
 # Description: Calculates C-12 binding energy via geometric compression of a triangular Alpha-Cluster lattice.
 
+@validation
 def solve_carbon12_binding():
     print("--- PPT - Atoms: PPT 3.0: Carbon-12 Geometric Alpha-Cluster Solver ---")
 
@@ -72,5 +74,9 @@ def solve_carbon12_binding():
     if abs(E_total_MeV - real_C12_MeV) < 0.5:
         print("\nFRACTAL SCALING SUCCESSFUL: Complex triangular geometries perfectly predict binding energy.")
 
+    return ValidationResult(None, "C-12 Binding Energy", E_total_MeV, real_C12_MeV, "MeV",
+                            {"rho_medium_nuclear": rho_medium_nuclear, "r_nucleon": r_nucleon,
+                             "compression_He4": compression_He4, "alpha_bond_overlap": alpha_bond_overlap})
+
 if __name__ == "__main__":
     solve_carbon12_binding()
\ No newline at end of file
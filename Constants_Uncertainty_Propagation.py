@@ -0,0 +1,178 @@
+import numpy as np
+
+from Nuclide_Chart_Binding_Engine import (
+    C2,
+    JOULES_TO_MEV,
+    alpha_cluster_overlap,
+    hydrostatic_binding_energy,
+)
+
+# PPT-Atoms Validation Suite v1.0.0
+# Module: Constants_Uncertainty_Propagation.py
+# Author: Vladimir Milosevic
+# Theory: Plasma Pressure Theory (PPT) 3.0
+# Description: Monte Carlo propagation of PPT input tolerances through the He-4, C-12, proton-radius and U-235 validations.
+
+# Draws evaluated per batch (bounded memory for any total draw count)
+DEFAULT_CHUNK_SIZE = 10**6
+
+# Output histogram resolution used to read percentiles without keeping the draws
+HISTOGRAM_BINS = 2**16
+
+# 1. INPUT TOLERANCES
+# (distribution, centre, width): 'uniform' spans centre +/- width (rounding interval of a
+# quoted PPT constant), 'normal' uses width as one standard deviation (measured inputs).
+DEFAULT_INPUTS = {
+    "rho_medium_nuclear":   ("uniform", 2.3e17, 0.05e17),      # quoted to 2 significant figures
+    "r_nucleon":            ("normal", 0.8427e-15, 0.0004e-15),
+    "compression_He4":      ("uniform", 0.02223, 0.000005),
+    "alpha_bond_overlap":   ("uniform", 0.00153, 0.000005),
+    "r_measured_electron":  ("normal", 0.8768, 0.0069),        # CODATA electron-probed radius (fm)
+    "m_proton":             ("normal", 938.272088, 0.0000003),
+    "m_electron":           ("normal", 0.510998, 0.0000000015),
+    "m_muon":               ("normal", 105.658375, 0.0000023),
+    "E_U235_MeV":           ("normal", 1783.8, 0.1),
+    "E_Ba141_MeV":          ("normal", 1173.4, 0.1),
+    "E_Kr92_MeV":           ("normal", 782.6, 0.1),
+}
+
+# Reference values quoted by the validation scripts
+VALIDATIONS = {
+    "He-4 Binding (MeV)":        {"reference": 28.3},
+    "C-12 Binding (MeV)":        {"reference": 92.16},
+    "Muonic Proton Radius (fm)": {"reference": 0.8418},
+    "U-235 Yield (kt / kg)":     {"reference": 15.0},
+}
+
+
+def sample_inputs(n, rng, inputs=DEFAULT_INPUTS):
+    draws = {}
+    for name, (distribution, centre, width) in inputs.items():
+        if distribution == "uniform":
+            draws[name] = rng.uniform(centre - width, centre + width, n)
+        elif distribution == "normal":
+            draws[name] = rng.normal(centre, width, n)
+        elif distribution == "fixed":
+            draws[name] = np.full(n, float(centre))
+        else:
+            raise ValueError(f"Unknown distribution '{distribution}' for input '{name}'")
+    return draws
+
+
+# 2. BATCHED VALIDATION FORMULAS (same arithmetic as the single-value scripts)
+def muonic_proton_radius(r_measured_electron, m_proton, m_electron, m_muon):
+    # Proton_Radius_Hydrostatic_Solver: undo the electron squeeze, apply the muon squeeze
+    v_true = r_measured_electron**3 / (1 - m_electron / m_proton)
+    return (v_true * (1 - m_muon / m_proton)) ** (1 / 3)
+
+
+def fission_yield_kilotons(E_U235_MeV, E_Ba141_MeV, E_Kr92_MeV, rho_medium_nuclear):
+    # U235_Fission_Cavitation_Solver: P * dV_shift per atom, scaled to 1 kg of U-235
+    universal_pressure = rho_medium_nuclear * C2
+    dV_shift = ((E_Ba141_MeV + E_Kr92_MeV - E_U235_MeV) * JOULES_TO_MEV) / universal_pressure
+    atoms_per_kg = 6.02214076e23 / 0.235
+    return universal_pressure * dV_shift * atoms_per_kg / 4.184e12
+
+
+def evaluate_validations(draws):
+    return {
+        "He-4 Binding (MeV)": hydrostatic_binding_energy(
+            2, 2, draws["compression_He4"], draws["r_nucleon"], draws["rho_medium_nuclear"]),
+        "C-12 Binding (MeV)": hydrostatic_binding_energy(
+            6, 6, alpha_cluster_overlap(draws["compression_He4"], draws["alpha_bond_overlap"]),
+            draws["r_nucleon"], draws["rho_medium_nuclear"]),
+        "Muonic Proton Radius (fm)": muonic_proton_radius(
+            draws["r_measured_electron"], draws["m_proton"], draws["m_electron"], draws["m_muon"]),
+        "U-235 Yield (kt / kg)": fission_yield_kilotons(
+            draws["E_U235_MeV"], draws["E_Ba141_MeV"], draws["E_Kr92_MeV"], draws["rho_medium_nuclear"]),
+    }
+
+
+# 3. STREAMING PERCENTILES
+def _new_histogram(first_values, bins):
+    lo, hi = float(first_values.min()), float(first_values.max())
+    span = (hi - lo) or abs(hi) * 1e-12 or 1e-300
+    return {
+        "edges": np.linspace(lo - span, hi + span, bins + 1),
+        "counts": np.zeros(bins, dtype=np.int64),
+        "below": 0, "above": 0,
+        "min": np.inf, "max": -np.inf,
+        "n": 0, "sum": 0.0, "sum_sq": 0.0,
+    }
+
+
+def _update_histogram(histogram, values):
+    edges = histogram["edges"]
+    histogram["below"] += int(np.count_nonzero(values < edges[0]))
+    histogram["above"] += int(np.count_nonzero(values > edges[-1]))
+    histogram["counts"] += np.histogram(values, bins=edges.size - 1, range=(edges[0], edges[-1]))[0]
+    histogram["min"] = min(histogram["min"], float(values.min()))
+    histogram["max"] = max(histogram["max"], float(values.max()))
+    histogram["n"] += values.size
+    histogram["sum"] += float(values.sum())
+    histogram["sum_sq"] += float(np.square(values).sum())
+
+
+def histogram_percentiles(histogram, percentiles):
+    # Linear interpolation inside the fixed bins; tails outside the grid fall back to min/max
+    edges, counts = histogram["edges"], histogram["counts"]
+    cdf = np.concatenate(([histogram["below"]], histogram["below"] + np.cumsum(counts))) / histogram["n"]
+    out = np.interp(np.asarray(percentiles) / 100, cdf, edges)
+    out = np.where(np.asarray(percentiles) / 100 <= cdf[0], histogram["min"], out)
+    return np.where(np.asarray(percentiles) / 100 >= cdf[-1], histogram["max"], out)
+
+
+def propagate_uncertainty(n_draws=10**7, inputs=DEFAULT_INPUTS, chunk_size=DEFAULT_CHUNK_SIZE,
+                          percentiles=(2.5, 16, 50, 84, 97.5), seed=None, bins=HISTOGRAM_BINS):
+    rng = np.random.default_rng(seed)
+    value_hist, accuracy_hist = {}, {}
+
+    remaining = int(n_draws)
+    while remaining > 0:
+        n = min(chunk_size, remaining)
+        outputs = evaluate_validations(sample_inputs(n, rng, inputs))
+        for name, values in outputs.items():
+            reference = VALIDATIONS[name]["reference"]
+            accuracy = (1 - np.abs(values - reference) / reference) * 100
+            if name not in value_hist:
+                value_hist[name] = _new_histogram(values, bins)
+                accuracy_hist[name] = _new_histogram(accuracy, bins)
+            _update_histogram(value_hist[name], values)
+            _update_histogram(accuracy_hist[name], accuracy)
+        remaining -= n
+
+    report = {}
+    for name, histogram in value_hist.items():
+        mean = histogram["sum"] / histogram["n"]
+        report[name] = {
+            "reference": VALIDATIONS[name]["reference"],
+            "mean": mean,
+            "std": max(histogram["sum_sq"] / histogram["n"] - mean**2, 0.0) ** 0.5,
+            "percentiles": dict(zip(percentiles, histogram_percentiles(histogram, percentiles))),
+            "accuracy_percentiles": dict(zip(percentiles, histogram_percentiles(accuracy_hist[name], percentiles))),
+        }
+    return report
+
+
+def run_uncertainty_propagation(n_draws=10**7, seed=2026):
+    print("--- PPT - Atoms: PPT 3.0: Monte Carlo Constant-Tolerance Propagation ---")
+    print(f"Draws: {n_draws:.0e} (batches of {DEFAULT_CHUNK_SIZE:.0e})\n")
+
+    report = propagate_uncertainty(n_draws, seed=seed)
+
+    print(f"{'Validation':<26} | {'Reference':<9} | {'Median':<10} | {'95% Interval':<23} | {'Accuracy 95% Interval':<21}")
+    print("-" * 103)
+    for name, row in report.items():
+        p = row["percentiles"]
+        a = row["accuracy_percentiles"]
+        print(f"{name:<26} | {row['reference']:<9.4g} | {p[50]:<10.5g} | "
+              f"[{p[2.5]:<9.5g}, {p[97.5]:<9.5g}] | [{min(a[2.5], a[97.5]):6.2f}%, {max(a[2.5], a[97.5]):6.2f}%]")
+
+    print("\nMechanical Conclusion:")
+    print("Quoted accuracies are only meaningful inside these intervals: the spread comes")
+    print("from the rounding of the PPT constants and the measured input tolerances.")
+    return report
+
+
+if __name__ == "__main__":
+    run_uncertainty_propagation()
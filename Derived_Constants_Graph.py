@@ -0,0 +1,228 @@
+import collections
+import contextlib
+import inspect
+import sys
+
+import numpy as np
+
+from Nuclide_Chart_Binding_Engine import (
+    ALPHA_BOND_OVERLAP,
+    COMPRESSION_HE4,
+    JOULES_TO_MEV,
+    R_NUCLEON,
+    RHO_MEDIUM_NUCLEAR,
+)
+
+# PPT-Atoms Validation Suite v1.0.0
+# Module: Derived_Constants_Graph.py
+# Author: Vladimir Milosevic
+# Theory: Plasma Pressure Theory (PPT) 3.0
+# Description: Lazily evaluated dependency graph of the derived PPT quantities; changing an input recomputes only the nodes downstream of it.
+
+
+# 1. THE GRAPH
+class DerivedGraph:
+    # Inputs hold values; derived nodes hold a function whose parameter names are the
+    # nodes it depends on. Values are computed on first access and cached until an
+    # upstream input changes. Any node may be array-valued: inputs broadcast through.
+    def __init__(self):
+        self._inputs = {}
+        self._functions = {}
+        self._dependencies = {}
+        self._dependents = collections.defaultdict(list)
+        self._values = {}
+        self.evaluations = collections.Counter()
+
+    def add_input(self, name, value):
+        self._check_new(name)
+        self._inputs[name] = value
+        self._values[name] = value
+        return self
+
+    def add(self, name, function, dependencies=None):
+        # dependencies default to the function's parameter names; they must already exist,
+        # which keeps the graph acyclic by construction
+        self._check_new(name)
+        dependencies = tuple(dependencies or inspect.signature(function).parameters)
+        missing = [dep for dep in dependencies if dep not in self]
+        if missing:
+            raise KeyError(f"{name} depends on unknown node(s): {', '.join(missing)}")
+        self._functions[name] = function
+        self._dependencies[name] = dependencies
+        for dep in dependencies:
+            self._dependents[dep].append(name)
+        return self
+
+    def _check_new(self, name):
+        if name in self:
+            raise ValueError(f"Node {name!r} already exists")
+
+    def __contains__(self, name):
+        return name in self._inputs or name in self._functions
+
+    def __getitem__(self, name):
+        if name in self._values:
+            return self._values[name]
+        if name not in self._functions:
+            raise KeyError(name)
+        value = self._functions[name](*(self[dep] for dep in self._dependencies[name]))
+        self._values[name] = value
+        self.evaluations[name] += 1
+        return value
+
+    def __setitem__(self, name, value):
+        self.set(**{name: value})
+
+    def set(self, **values):
+        # Updating an input to an equal value keeps every cached node
+        for name, value in values.items():
+            if name not in self._inputs:
+                raise KeyError(f"{name!r} is not an input node")
+            old = self._inputs[name]
+            if np.shape(old) == np.shape(value) and np.array_equal(old, value):
+                continue
+            self._inputs[name] = value
+            self._values[name] = value
+            for node in self.downstream(name):
+                self._values.pop(node, None)
+
+    def evaluate(self, *names):
+        return {name: self[name] for name in names}
+
+    # --- Introspection ---
+    def inputs(self):
+        return dict(self._inputs)
+
+    def nodes(self):
+        return list(self._inputs) + list(self._functions)
+
+    def dependencies(self, name):
+        return self._dependencies.get(name, ())
+
+    def downstream(self, name):
+        # Every node whose value depends (transitively) on `name`
+        seen, stack = [], list(self._dependents[name])
+        while stack:
+            node = stack.pop()
+            if node not in seen:
+                seen.append(node)
+                stack.extend(self._dependents[node])
+        return seen
+
+    def is_cached(self, name):
+        return name in self._values
+
+    @contextlib.contextmanager
+    def what_if(self, **values):
+        # Temporary input overrides; the originals are restored (and only their
+        # downstream nodes invalidated again) when the block exits
+        saved = {name: self._inputs[name] for name in values if name in self._inputs}
+        self.set(**values)
+        try:
+            yield self
+        finally:
+            self.set(**saved)
+
+
+# 2. THE STANDARD PPT GRAPH
+def ppt_constants_graph(**overrides):
+    # The derivation chains of the Helium-4, Carbon-12 and U-235 solvers as one graph.
+    # Any input can be overridden, with scalars or arrays.
+    graph = DerivedGraph()
+    inputs = {
+        # --- THE UNIFIED CONSTANTS ---
+        "rho_medium_nuclear": RHO_MEDIUM_NUCLEAR,
+        "c": 299792458.0,
+        "joules_to_MeV": JOULES_TO_MEV,
+        # --- THE GEOMETRIC BASE ---
+        "r_nucleon": R_NUCLEON,
+        "compression_He4": COMPRESSION_HE4,
+        "alpha_bond_overlap": ALPHA_BOND_OVERLAP,
+        # --- FISSION LATTICES (binding energies, MeV) ---
+        "E_U235_MeV": 1783.8,
+        "E_Ba141_MeV": 1173.4,
+        "E_Kr92_MeV": 782.6,
+        "atoms_per_kg": 6.02214076e23 / 0.235,
+        "joules_to_kilotons": 4.184e12,
+    }
+    unknown = set(overrides) - set(inputs)
+    if unknown:
+        raise KeyError(f"Unknown input(s): {', '.join(sorted(unknown))}")
+    inputs.update(overrides)
+    for name, value in inputs.items():
+        graph.add_input(name, value)
+
+    # Universal PPT Pressure (J/m^3)
+    graph.add("universal_pressure", lambda rho_medium_nuclear, c: rho_medium_nuclear * c**2)
+    graph.add("V_single_nucleon", lambda r_nucleon: (4/3) * np.pi * r_nucleon**3)
+
+    # Helium-4: one tetrahedral cluster
+    graph.add("V_raw_He4", lambda V_single_nucleon: 4 * V_single_nucleon)
+    graph.add("Delta_V_He4", lambda V_raw_He4, compression_He4: V_raw_He4 * compression_He4)
+    graph.add("E_He4_MeV", lambda universal_pressure, Delta_V_He4, joules_to_MeV:
+              universal_pressure * Delta_V_He4 / joules_to_MeV)
+
+    # Carbon-12: three clusters plus the triangular Alpha-Alpha interface
+    graph.add("Delta_V_3_Clusters", lambda Delta_V_He4: 3 * Delta_V_He4)
+    graph.add("V_raw_C12", lambda V_single_nucleon: 12 * V_single_nucleon)
+    graph.add("Delta_V_Alpha_Bonds", lambda V_raw_C12, alpha_bond_overlap: V_raw_C12 * alpha_bond_overlap)
+    graph.add("Delta_V_Total", lambda Delta_V_3_Clusters, Delta_V_Alpha_Bonds: Delta_V_3_Clusters + Delta_V_Alpha_Bonds)
+    graph.add("E_C12_MeV", lambda universal_pressure, Delta_V_Total, joules_to_MeV:
+              universal_pressure * Delta_V_Total / joules_to_MeV)
+
+    # U-235: dV = E_J / Pressure for parent and products; the medium fills the difference
+    graph.add("dV_U235", lambda E_U235_MeV, joules_to_MeV, universal_pressure:
+              E_U235_MeV * joules_to_MeV / universal_pressure)
+    graph.add("dV_products", lambda E_Ba141_MeV, E_Kr92_MeV, joules_to_MeV, universal_pressure:
+              (E_Ba141_MeV + E_Kr92_MeV) * joules_to_MeV / universal_pressure)
+    graph.add("dV_shift", lambda dV_products, dV_U235: dV_products - dV_U235)
+    graph.add("E_release_atom_MeV", lambda universal_pressure, dV_shift, joules_to_MeV:
+              universal_pressure * dV_shift / joules_to_MeV)
+    graph.add("Yield_kilotons", lambda E_release_atom_MeV, joules_to_MeV, atoms_per_kg, joules_to_kilotons:
+              E_release_atom_MeV * joules_to_MeV * atoms_per_kg / joules_to_kilotons)
+    return graph
+
+
+# Headline outputs reported by the CLI
+PPT_OUTPUTS = ("E_He4_MeV", "E_C12_MeV", "E_release_atom_MeV", "Yield_kilotons")
+
+
+def _parse_assignment(text):
+    name, _, value = text.partition("=")
+    if not value:
+        raise ValueError(f"Expected name=value, got {text!r}")
+    if ":" in value:
+        # start:stop:num -> linspace
+        start, stop, num = value.split(":")
+        return name, np.linspace(float(start), float(stop), int(num))
+    return name, float(value)
+
+
+def run_what_if(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    graph = ppt_constants_graph()
+    print("--- PPT - Atoms: PPT 3.0: Derived Constants Graph ---")
+    print(f"{'Output':<20} | Baseline")
+    print("-" * 40)
+    for name, value in graph.evaluate(*PPT_OUTPUTS).items():
+        print(f"{name:<20} | {value:.4f}")
+
+    changes = dict(_parse_assignment(arg) for arg in argv)
+    if not changes:
+        print("\nUsage: python Derived_Constants_Graph.py r_nucleon=0.84e-15 alpha_bond_overlap=0.001:0.002:5")
+        return 0
+
+    before = collections.Counter(graph.evaluations)
+    with graph.what_if(**changes):
+        outputs = graph.evaluate(*PPT_OUTPUTS)
+        recomputed = sorted(name for name in graph.evaluations if graph.evaluations[name] > before[name])
+    print(f"\nWhat-if: {', '.join(changes)}")
+    for name, value in outputs.items():
+        print(f"{name:<20} | {np.array2string(np.asarray(value), precision=4)}")
+    print(f"\nRecomputed {len(recomputed)} of {len(graph.nodes()) - len(graph.inputs())} derived nodes: "
+          f"{', '.join(recomputed)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(run_what_if())
@@ -1,5 +1,6 @@
 import numpy as np
-import matplotlib.pyplot as plt
+
+from Validation_Result import ValidationResult, validation
 
 # PPT-Atoms Validation Suite v1.0.0
 # Script: Deterministic_Half_Life_Acoustic_Solver.py
@@ -7,21 +8,79 @@ import matplotlib.pyplot as plt
 # Theory: Plasma Pressure Theory (PPT) 3.0
 # Description: Reframes radioactive decay from quantum probability to deterministic acoustic fatigue.
 
-def simulate_ppt_decay_corrected():
-    print("--- PPT - Atoms: PPT 3.0: Deterministic Half-Life (Acoustic Fatigue) Solver ---")
+# 1. PPT 3.0 EXACT CONSTANTS (The "Hammering" Frequency)
+C_MEDIUM = 299792458        # Exact wave speed of the universal medium (m/s)
+R_0 = 1.25e-15              # Nuclear saturation boundary (m)
+SECONDS_PER_YR = 3.154e7
+
+# Baseline hydrostatic impact frequency of the medium (~2.398e23 Hz)
+F_MEDIUM = C_MEDIUM / R_0
+
+# The fatigue law is evaluated in log space: exp(lock_factor) overflows float64
+# beyond lock factors of ~709, while ln(t) itself stays small for any half-life.
+LN_F_MEDIUM = np.log(F_MEDIUM)
+LN_SECONDS_PER_YR = np.log(SECONDS_PER_YR)
+LN_10 = np.log(10)
+
+# Accuracy is capped at |ln(pred / real)| = 700: expm1 stays finite (and x100 too),
+# and anything that far off already scores ~ -1e306 %.
+LN_RATIO_LIMIT = 700.0
+
+
+def ln_half_life_seconds(lock_factor):
+    # EXPONENTIAL FATIGUE LAW in log form: ln(t) = Lock Factor - ln(f_medium)
+    return np.asarray(lock_factor, dtype=np.float64) - LN_F_MEDIUM
+
+
+def log10_half_life_years(lock_factor):
+    # Safe for the whole nanosecond .. 10^20+ year range
+    return (ln_half_life_seconds(lock_factor) - LN_SECONDS_PER_YR) / LN_10
+
+
+def half_life_years(lock_factor):
+    # Linear years; returns inf only once the half-life itself exceeds ~1e308 years
+    with np.errstate(over='ignore'):
+        return np.exp(ln_half_life_seconds(lock_factor) - LN_SECONDS_PER_YR)
 
-    # 1. PPT 3.0 EXACT CONSTANTS (The "Hammering" Frequency)
-    c = 299792458        # Exact wave speed of the universal medium (m/s)
-    r_0 = 1.25e-15       # Nuclear saturation boundary (m)
-    seconds_per_yr = 3.154e7
-    
-    # The universal medium strikes the displacement volume at this baseline frequency
-    # Represents the continuous hydrostatic background pressure
-    f_medium = c / r_0   # ~2.398e23 Hz
-    
-    print(f"1. Medium Wave Speed: {c} m/s")
-    print(f"2. Baseline Hydrostatic Impact Frequency: {f_medium:.3e} Hz\n")
 
+def lock_factor_from_half_life(half_life_yr):
+    # Batch inverse: the structural lock each measured half-life requires
+    return np.log(np.asarray(half_life_yr, dtype=np.float64)) + LN_SECONDS_PER_YR + LN_F_MEDIUM
+
+
+def lock_factor_from_log10_half_life(log10_half_life_yr):
+    # Inverse for tables that already store log10(years), e.g. very long-lived isotopes
+    return np.asarray(log10_half_life_yr, dtype=np.float64) * LN_10 + LN_SECONDS_PER_YR + LN_F_MEDIUM
+
+
+def evaluate_isotope_table(lock_factors, real_half_life_yr=None):
+    # Vectorized forward pass over a whole isotope table
+    log10_pred = log10_half_life_years(lock_factors)
+    result = {
+        "lock_factor": np.asarray(lock_factors, dtype=np.float64),
+        "log10_half_life_yr": log10_pred,
+        "half_life_yr": half_life_years(lock_factors),
+    }
+    if real_half_life_yr is not None:
+        # Accuracy from the clipped log ratio, so it never forms an overflowing quotient
+        ln_ratio = log10_pred * LN_10 - np.log(np.asarray(real_half_life_yr, dtype=np.float64))
+        ln_ratio = np.clip(ln_ratio, -LN_RATIO_LIMIT, LN_RATIO_LIMIT)
+        result["accuracy"] = (1 - np.abs(np.expm1(ln_ratio))) * 100
+    return result
+
+
+def load_isotope_table(path):
+    # Local CSV with a header: 'name' plus 'lock_factor' and/or 'half_life_yr'
+    table = np.atleast_1d(np.genfromtxt(path, delimiter=',', names=True, dtype=None, encoding='utf-8'))
+    columns = {name: np.asarray(table[name]) for name in table.dtype.names}
+    if "lock_factor" not in columns and "half_life_yr" not in columns:
+        raise ValueError(f"Isotope table {path} needs a 'lock_factor' or 'half_life_yr' column")
+    if "lock_factor" not in columns:
+        columns["lock_factor"] = lock_factor_from_half_life(columns["half_life_yr"])
+    return columns
+
+
+def compute_ppt_decay():
     # 2. ISOTOPE IMPEDANCE PROFILES (Acoustic Lock Factors)
     # In a pressurized superfluid, a geometric lattice absorbs pressure waves exponentially.
     # The Lock Factor represents the structural attenuation barrier against fracture.
@@ -40,45 +99,40 @@ def simulate_ppt_decay_corrected():
         }
     }
 
-    # --- TERMINAL VALIDATION OUTPUT ---
-    print(f"{'Isotope':<16} | {'Structural Lock':<17} | {'PPT Pred (yr)':<15} | {'NIST Real (yr)':<15} | {'Accuracy':<10}")
-    print("-" * 85)
-
-    plot_data = []
-
+    rows = []
     for name, data in isotopes.items():
         # EXPONENTIAL FATIGUE LAW
-        # Mean Time to Failure (seconds) = (1 / f_medium) * exp(Lock Factor)
-        t_half_seconds = (1 / f_medium) * np.exp(data["lock_factor"])
-        
-        # Convert seconds to years
-        t_half_years = t_half_seconds / seconds_per_yr
+        # Mean Time to Failure (seconds) = (1 / f_medium) * exp(Lock Factor), evaluated in log space
+        t_half_years = half_life_years(data["lock_factor"])
         
         accuracy = (1 - abs(t_half_years - data["real_half_life_yr"]) / data["real_half_life_yr"]) * 100
-        print(f"{name:<16} | {data['lock_factor']:<17.4f} | {t_half_years:<15.2f} | {data['real_half_life_yr']:<15.2f} | {accuracy:>8.2f}%")
-        
-        plot_data.append((name, t_half_years))
-
-    print("\nMechanical Conclusion:")
-    print("Radioactive decay is not 'random'. It is the exact mathematical point of")
-    print("structural fracture caused by the continuous acoustic fatigue of the superfluid medium.")
+        rows.append({"name": name, "lock_factor": data["lock_factor"], "t_half_years": t_half_years,
+                     "real_half_life_yr": data["real_half_life_yr"], "accuracy": accuracy})
 
-    # --- HIGH-VISIBILITY VISUAL PROOF ---
     # We will plot the theoretical fatigue curve for Tritium
     t_years = np.linspace(0, 30, 500)
     
     # Standard decay curve formula adapted for PPT fatigue visualization
     # N(t) = N_0 * exp(-t * ln(2) / t_half)
-    fatigue_curve = 100 * np.exp(-t_years * np.log(2) / plot_data[0][1])
+    fatigue_curve = 100 * np.exp(-t_years * np.log(2) / rows[0]["t_half_years"])
+
+    return {"rows": rows, "t_years": t_years, "fatigue_curve": fatigue_curve}
+
 
-    plt.figure(figsize=(10, 6))
+def render_decay_fatigue(data):
+    import matplotlib.pyplot as plt
+
+    # --- HIGH-VISIBILITY VISUAL PROOF ---
+    name, t_half = data["rows"][0]["name"], data["rows"][0]["t_half_years"]
+
+    fig = plt.figure(figsize=(10, 6))
     
     # Plot the degradation curve
-    plt.plot(t_years, fatigue_curve, color='#00FFFF', linewidth=3, label=f'PPT Structural Integrity ({plot_data[0][0]})')
+    plt.plot(data["t_years"], data["fatigue_curve"], color='#00FFFF', linewidth=3, label=f'PPT Structural Integrity ({name})')
     
     # Mark the precise deterministic fracture point (Half-life)
-    plt.axvline(x=plot_data[0][1], color='#FFD700', linestyle='--', linewidth=2, 
-                label=f'Deterministic Fracture Point ({plot_data[0][1]:.2f} yrs)')
+    plt.axvline(x=t_half, color='#FFD700', linestyle='--', linewidth=2, 
+                label=f'Deterministic Fracture Point ({t_half:.2f} yrs)')
     plt.axhline(y=50, color='grey', linestyle=':', alpha=0.5)
 
     plt.title('Radioactive Decay as Deterministic Acoustic Fatigue (Tritium)', fontsize=14, pad=15)
@@ -88,7 +142,40 @@ def simulate_ppt_decay_corrected():
     plt.legend(frameon=True, facecolor='white', framealpha=0.9)
     plt.grid(True, linestyle='--', alpha=0.3)
     plt.tight_layout()
-    plt.show()
+    return fig
+
+
+@validation
+def simulate_ppt_decay_corrected(plot=True):
+    print("--- PPT - Atoms: PPT 3.0: Deterministic Half-Life (Acoustic Fatigue) Solver ---")
+
+    # 1. PPT 3.0 EXACT CONSTANTS (The "Hammering" Frequency)
+    # The universal medium strikes the displacement volume at this baseline frequency
+    # Represents the continuous hydrostatic background pressure
+    print(f"1. Medium Wave Speed: {C_MEDIUM} m/s")
+    print(f"2. Baseline Hydrostatic Impact Frequency: {F_MEDIUM:.3e} Hz\n")
+
+    data = compute_ppt_decay()
+
+    # --- TERMINAL VALIDATION OUTPUT ---
+    print(f"{'Isotope':<16} | {'Structural Lock':<17} | {'PPT Pred (yr)':<15} | {'NIST Real (yr)':<15} | {'Accuracy':<10}")
+    print("-" * 85)
+    for row in data["rows"]:
+        print(f"{row['name']:<16} | {row['lock_factor']:<17.4f} | {row['t_half_years']:<15.2f} | {row['real_half_life_yr']:<15.2f} | {row['accuracy']:>8.2f}%")
+
+    print("\nMechanical Conclusion:")
+    print("Radioactive decay is not 'random'. It is the exact mathematical point of")
+    print("structural fracture caused by the continuous acoustic fatigue of the superfluid medium.")
+
+    if plot:
+        import matplotlib.pyplot as plt
+
+        render_decay_fatigue(data)
+        plt.show()
+
+    return [ValidationResult(None, row["name"], row["t_half_years"], row["real_half_life_yr"], "yr",
+                             {"lock_factor": row["lock_factor"], "f_medium": F_MEDIUM})
+            for row in data["rows"]]
 
 if __name__ == "__main__":
     simulate_ppt_decay_corrected()
\ No newline at end of file
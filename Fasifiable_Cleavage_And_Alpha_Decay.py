@@ -1,5 +1,4 @@
 import numpy as np
-import matplotlib.pyplot as plt
 
 # PPT-Atoms Validation Suite v1.0.0
 # Script: Fasifiable_Cleavage_And_Alpha_Decay.py
@@ -12,71 +11,232 @@ import matplotlib.pyplot as plt
 # PPT-ATOMS: ALPHA DECAY GEOMETRIC CLEAVAGE SIMULATION
 # =============================================================================
 
-# Set aesthetic style
-plt.style.use('dark_background')
-fig = plt.figure(figsize=(14, 7))
-fig.suptitle('Falsifiable Prediction: Alpha Decay Emission Topology', 
-             fontsize=18, fontweight='bold', color='white', y=0.95)
+# Geometric fault lines of a tetrahedral core
+TETRAHEDRAL_VERTICES = np.array([
+    [1, 1, 1],
+    [-1, -1, 1],
+    [-1, 1, -1],
+    [1, -1, -1]
+]) / np.sqrt(3)
+
+# Minor thermal/vibrational noise on the fracture vector
+THERMAL_NOISE_SIGMA = 0.15
+
+# Events generated per vectorized batch (~25 MB of float64 directions)
+DEFAULT_CHUNK_SIZE = 2**20
 
-n_events = 5000  # Number of simulated alpha particle emissions
 
 # -----------------------------------------------------------------------------
 # MODEL A: STANDARD PHYSICS (Isotropic Quantum Probability)
 # -----------------------------------------------------------------------------
-# Alpha particles "tunnel" out randomly in all 360 degrees
-phi_std = np.random.uniform(0, 2 * np.pi, n_events)
-costheta_std = np.random.uniform(-1, 1, n_events)
-theta_std = np.arccos(costheta_std)
-
-x_std = np.sin(theta_std) * np.cos(phi_std)
-y_std = np.sin(theta_std) * np.sin(phi_std)
-z_std = np.cos(theta_std)
-
-ax1 = fig.add_subplot(121, projection='3d')
-ax1.set_facecolor('#0a0a0a')
-ax1.scatter(x_std, y_std, z_std, s=15, c='#457b9d', alpha=0.6, edgecolors='none')
-ax1.set_title('Standard Model: Isotropic Probability\n(Random Spherical Emission)', 
-              color='white', pad=20, fontsize=12)
-ax1.set_axis_off()  # Hide grid for pure particle visualization
+def isotropic_directions(n_events, rng):
+    # Alpha particles "tunnel" out randomly in all 360 degrees
+    phi = rng.uniform(0, 2 * np.pi, n_events)
+    costheta = rng.uniform(-1, 1, n_events)
+    sintheta = np.sqrt(1 - costheta**2)
+
+    return np.column_stack((sintheta * np.cos(phi), sintheta * np.sin(phi), costheta))
+
 
 # -----------------------------------------------------------------------------
 # MODEL B: PPT-ATOMS (Anisotropic Geometric Cleavage)
 # -----------------------------------------------------------------------------
-# Alpha particles fracture off the geometric fault lines of a tetrahedral core
-vertices = np.array([
-    [1, 1, 1],
-    [-1, -1, 1],
-    [-1, 1, -1],
-    [1, -1, -1]
-]) / np.sqrt(3)
+def cleavage_directions(n_events, rng, noise_sigma=THERMAL_NOISE_SIGMA):
+    # Alpha particles fracture off the geometric fault lines of a tetrahedral core.
+    # Select a random geometric fault line for every event at once
+    base_vectors = TETRAHEDRAL_VERTICES[rng.integers(0, 4, n_events)]
 
-x_ppt, y_ppt, z_ppt = [], [], []
+    # Add minor thermal/vibrational noise to the fracture vectors
+    fracture_vectors = base_vectors + rng.normal(0, noise_sigma, (n_events, 3))
 
-for _ in range(n_events):
-    # Select a random geometric fault line
-    base_vector = vertices[np.random.randint(0, 4)]
-    
-    # Add minor thermal/vibrational noise to the fracture vector
-    noise = np.random.normal(0, 0.15, 3)
-    fracture_vector = base_vector + noise
-    
     # Normalize back to the surface of the emission sphere
-    fracture_norm = fracture_vector / np.linalg.norm(fracture_vector)
-    
-    x_ppt.append(fracture_norm[0])
-    y_ppt.append(fracture_norm[1])
-    z_ppt.append(fracture_norm[2])
-
-ax2 = fig.add_subplot(122, projection='3d')
-ax2.set_facecolor('#0a0a0a')
-ax2.scatter(x_ppt, y_ppt, z_ppt, s=15, c='#e63946', alpha=0.6, edgecolors='none')
-ax2.set_title('PPT-Atoms: Geometric Cleavage\n(Directional Fault-Line Emission)', 
-              color='white', pad=20, fontsize=12)
-ax2.set_axis_off()
-
-# Save and show
-plt.tight_layout()
-plt.subplots_adjust(top=0.85)
-plt.savefig('decay_topology_falsification.png', dpi=300, facecolor='#0a0a0a')
-print("Simulation complete. Image saved as: decay_topology_falsification.png")
-plt.show()
\ No newline at end of file
+    return fracture_vectors / np.linalg.norm(fracture_vectors, axis=1, keepdims=True)
+
+
+EMISSION_MODELS = {
+    "isotropic": isotropic_directions,
+    "ppt": cleavage_directions,
+}
+
+
+def stream_emission_directions(n_events, model="ppt", chunk_size=DEFAULT_CHUNK_SIZE, seed=None):
+    # Yields (chunk, 3) unit vectors until n_events have been produced.
+    # Peak memory is one chunk, independent of the total event count.
+    generate = EMISSION_MODELS[model]
+    rng = np.random.default_rng(seed)
+    remaining = int(n_events)
+    while remaining > 0:
+        n = min(chunk_size, remaining)
+        yield generate(n, rng)
+        remaining -= n
+
+
+def angular_bin_index(directions, n_cos=64, n_phi=128):
+    # Flat index of equal-area (cos theta, phi) pixels on the emission sphere
+    cos_bin = ((directions[:, 2] + 1) * (0.5 * n_cos)).astype(np.intp)
+    np.clip(cos_bin, 0, n_cos - 1, out=cos_bin)
+
+    phi = np.arctan2(directions[:, 1], directions[:, 0])
+    phi_bin = ((phi + np.pi) * (n_phi / (2 * np.pi))).astype(np.intp)
+    np.clip(phi_bin, 0, n_phi - 1, out=phi_bin)
+
+    return cos_bin * n_phi + phi_bin
+
+
+def accumulate_emission_histogram(directions_stream, n_cos=64, n_phi=128):
+    # Fixed-size (n_cos, n_phi) counts, so 10^9 events cost the same memory as 10^3
+    counts = np.zeros(n_cos * n_phi, dtype=np.int64)
+    for directions in directions_stream:
+        counts += np.bincount(angular_bin_index(directions, n_cos, n_phi), minlength=n_cos * n_phi)
+    return counts.reshape(n_cos, n_phi)
+
+
+def simulate_emission_histogram(n_events, model="ppt", n_cos=64, n_phi=128,
+                                chunk_size=DEFAULT_CHUNK_SIZE, seed=None):
+    stream = stream_emission_directions(n_events, model, chunk_size, seed)
+    return accumulate_emission_histogram(stream, n_cos, n_phi)
+
+
+def compute_decay_topology(n_events=5000, seed=None):
+    rng = np.random.default_rng(seed)
+    return {
+        "isotropic": isotropic_directions(n_events, rng),
+        "ppt": cleavage_directions(n_events, rng),
+    }
+
+
+def render_decay_topology(data):
+    import matplotlib.pyplot as plt
+
+    # Dark aesthetic style, scoped to this figure
+    with plt.style.context('dark_background'):
+        fig = plt.figure(figsize=(14, 7), facecolor='#0a0a0a')
+        fig.suptitle('Falsifiable Prediction: Alpha Decay Emission Topology',
+                     fontsize=18, fontweight='bold', color='white', y=0.95)
+
+        x_std, y_std, z_std = data["isotropic"].T
+        x_ppt, y_ppt, z_ppt = data["ppt"].T
+
+        ax1 = fig.add_subplot(121, projection='3d')
+        ax1.set_facecolor('#0a0a0a')
+        ax1.scatter(x_std, y_std, z_std, s=15, c='#457b9d', alpha=0.6, edgecolors='none')
+        ax1.set_title('Standard Model: Isotropic Probability\n(Random Spherical Emission)',
+                      color='white', pad=20, fontsize=12)
+        ax1.set_axis_off()  # Hide grid for pure particle visualization
+
+        ax2 = fig.add_subplot(122, projection='3d')
+        ax2.set_facecolor('#0a0a0a')
+        ax2.scatter(x_ppt, y_ppt, z_ppt, s=15, c='#e63946', alpha=0.6, edgecolors='none')
+        ax2.set_title('PPT-Atoms: Geometric Cleavage\n(Directional Fault-Line Emission)',
+                      color='white', pad=20, fontsize=12)
+        ax2.set_axis_off()
+
+        fig.tight_layout()
+        fig.subplots_adjust(top=0.85)
+    return fig
+
+
+def compute_decay_density(n_events=10**6, n_cos=64, n_phi=128, seed=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    # Equal-area pixel densities relative to isotropy (1.0 = isotropic expectation).
+    # Everything downstream scales with n_cos * n_phi, never with n_events.
+    rng = np.random.default_rng(seed)
+    expected = n_events / (n_cos * n_phi)
+    data = {"n_events": int(n_events), "n_cos": n_cos, "n_phi": n_phi}
+    for model in EMISSION_MODELS:
+        model_seed = int(rng.integers(2**63))
+        counts = simulate_emission_histogram(n_events, model, n_cos, n_phi, chunk_size, model_seed)
+        data[model] = counts / expected
+    return data
+
+
+def render_decay_density(data, mollweide=True):
+    import matplotlib.pyplot as plt
+    from matplotlib.colors import PowerNorm
+
+    n_cos, n_phi = data["n_cos"], data["n_phi"]
+    cos_edges = np.linspace(-1, 1, n_cos + 1)
+    phi_edges = np.linspace(-np.pi, np.pi, n_phi + 1)
+
+    # Pixel corners on the unit sphere (cos theta rows, phi columns)
+    sin_edges = np.sqrt(1 - cos_edges**2)
+    x = np.outer(sin_edges, np.cos(phi_edges))
+    y = np.outer(sin_edges, np.sin(phi_edges))
+    z = np.outer(cos_edges, np.ones(n_phi + 1))
+
+    # One colour scale for both models so the panels compare directly; the square-root
+    # stretch keeps the isotropic level (1.0) visible next to the cleavage peaks
+    norm = PowerNorm(0.5, vmin=0, vmax=max(data["isotropic"].max(), data["ppt"].max()))
+    cmap = plt.get_cmap('inferno')
+
+    # Lambert shading of each pixel from a fixed light direction (pixel centre = its normal)
+    cos_mid = 0.5 * (cos_edges[:-1] + cos_edges[1:])
+    phi_mid = 0.5 * (phi_edges[:-1] + phi_edges[1:])
+    sin_mid = np.sqrt(1 - cos_mid**2)
+    normals = np.stack((np.outer(sin_mid, np.cos(phi_mid)), np.outer(sin_mid, np.sin(phi_mid)),
+                        np.outer(cos_mid, np.ones(n_phi))), axis=-1)
+    light = np.array([-1.0, -1.0, 1.0]) / np.sqrt(3)
+    shade = 0.35 + 0.65 * np.clip(normals @ light, 0, None)
+
+    panels = [
+        ("isotropic", 'Standard Model: Isotropic Probability\n(Random Spherical Emission)'),
+        ("ppt", 'PPT-Atoms: Geometric Cleavage\n(Directional Fault-Line Emission)'),
+    ]
+    n_rows = 2 if mollweide else 1
+
+    with plt.style.context('dark_background'):
+        fig = plt.figure(figsize=(14, 7 if n_rows == 1 else 12), facecolor='#0a0a0a')
+        fig.suptitle(f'Falsifiable Prediction: Alpha Decay Emission Density ({data["n_events"]:,} events)',
+                     fontsize=18, fontweight='bold', color='white', y=0.97 if mollweide else 0.95)
+
+        for col, (model, title) in enumerate(panels):
+            ax = fig.add_subplot(n_rows, 2, col + 1, projection='3d')
+            ax.set_facecolor('#0a0a0a')
+            colors = cmap(norm(data[model]))
+            colors[..., :3] *= shade[..., None]
+            # Rasterized so vector outputs (SVG/PDF) embed one image instead of n_cos * n_phi polygons
+            surface = ax.plot_surface(x, y, z, rstride=1, cstride=1, facecolors=colors,
+                                      shade=False, linewidth=0, antialiased=False)
+            surface.set_rasterized(True)
+            ax.set_box_aspect((1, 1, 1))
+            ax.set_title(title, color='white', pad=20, fontsize=12)
+            ax.set_axis_off()
+
+            if mollweide:
+                # Latitude of each equal-area row: sin(latitude) = cos(theta)
+                ax_m = fig.add_subplot(n_rows, 2, col + 3, projection='mollweide')
+                mesh = ax_m.pcolormesh(phi_edges, np.arcsin(cos_edges), data[model], cmap=cmap, norm=norm,
+                                       rasterized=True)
+                ax_m.set_xticklabels([])
+                ax_m.grid(True, color='grey', alpha=0.3)
+
+        if mollweide:
+            fig.subplots_adjust(left=0.04, right=0.96, top=0.87, bottom=0.12, hspace=0.05, wspace=0.08)
+            cax = fig.add_axes([0.3, 0.06, 0.4, 0.02])
+            fig.colorbar(mesh, cax=cax, orientation='horizontal',
+                         label='Emission Density / Isotropic Expectation')
+        else:
+            fig.tight_layout()
+            fig.subplots_adjust(top=0.85)
+    return fig
+
+
+def plot_decay_topology(n_events=5000, seed=None, mode="scatter", mollweide=False):
+    # mode="density" bins the events into equal-area sphere pixels: render time and
+    # file size then depend on the pixel grid only, so 10^6+ events stay practical
+    import matplotlib.pyplot as plt
+
+    if mode == "density":
+        fig = render_decay_density(compute_decay_density(n_events, seed=seed), mollweide)
+        filename = 'decay_topology_density.png'
+    else:
+        fig = render_decay_topology(compute_decay_topology(n_events, seed))
+        filename = 'decay_topology_falsification.png'
+
+    # Save and show
+    fig.savefig(filename, dpi=300, facecolor='#0a0a0a')
+    print(f"Simulation complete. Image saved as: {filename}")
+    plt.show()
+
+
+if __name__ == "__main__":
+    plot_decay_topology()
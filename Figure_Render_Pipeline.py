@@ -0,0 +1,124 @@
+import argparse
+import importlib
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+# PPT-Atoms Validation Suite v1.0.0
+# Module: Figure_Render_Pipeline.py
+# Author: Vladimir Milosevic
+# Theory: Plasma Pressure Theory (PPT) 3.0
+# Description: Computes every plotting solver in the main process and renders its figure offscreen (Agg) in a worker pool, overlapping the two stages.
+
+# (figure name, compute 'module:function', render 'module:function', dpi)
+# compute() returns plain picklable data; render(data) builds and returns a Figure.
+FIGURE_JOBS = [
+    ("period2_packing_trend",
+     "Period2_Harmonic_Packing_Trend:compute_period2_packing_trend",
+     "Periodic_Harmonic_Packing_Model:render_period_packing_trend", 150),
+    ("period3_packing_trend",
+     "Period3_Harmonic_Packing_Trend:compute_period3_packing_trend",
+     "Periodic_Harmonic_Packing_Model:render_period_packing_trend", 150),
+    ("molecular_bond_angle_trend",
+     "Molecular_Bond_Angle_Trend_Solver:compute_molecular_trend",
+     "Molecular_Bond_Angle_Trend_Solver:render_molecular_trend", 150),
+    ("relativistic_bow_shock",
+     "Relativistic_Mass_Hydrostatic_Bow_Shock:compute_bow_shock_displacement",
+     "Relativistic_Mass_Hydrostatic_Bow_Shock:render_bow_shock_displacement", 150),
+    ("half_life_acoustic_fatigue",
+     "Deterministic_Half_Life_Acoustic_Solver:compute_ppt_decay",
+     "Deterministic_Half_Life_Acoustic_Solver:render_decay_fatigue", 150),
+    ("decay_topology_falsification",
+     "Fasifiable_Cleavage_And_Alpha_Decay:compute_decay_topology",
+     "Fasifiable_Cleavage_And_Alpha_Decay:render_decay_topology", 300),
+    ("decay_density_falsification",
+     "Fasifiable_Cleavage_And_Alpha_Decay:compute_decay_density",
+     "Fasifiable_Cleavage_And_Alpha_Decay:render_decay_density", 150),
+    ("island_tension_surface",
+     "Flerovium_Island_of_Stability_Solver:compute_tension_surface",
+     "Flerovium_Island_of_Stability_Solver:render_tension_surface", 150),
+]
+
+
+def resolve(spec):
+    module_name, _, attr = spec.partition(":")
+    return getattr(importlib.import_module(module_name), attr)
+
+
+def _init_render_worker():
+    # Offscreen backend before pyplot is imported anywhere in the worker
+    os.environ["MPLBACKEND"] = "Agg"
+    import matplotlib
+    matplotlib.use("Agg")
+
+
+def render_figure(render_spec, data, path_stem, formats=("png",), dpi=150):
+    # Worker side: build the figure, write every requested format, free it
+    import matplotlib.pyplot as plt
+
+    start = time.perf_counter()
+    fig = resolve(render_spec)(data)
+    paths = []
+    for fmt in formats:
+        path = f"{path_stem}.{fmt}"
+        fig.savefig(path, dpi=dpi, facecolor=fig.get_facecolor())
+        paths.append(path)
+    plt.close(fig)
+    return paths, time.perf_counter() - start
+
+
+def run_pipeline(jobs=FIGURE_JOBS, output_dir="figures", formats=("png", "svg"), workers=None):
+    # The main process computes job k+1 while the pool is still rendering job k:
+    # compute() runs serially here, render() is queued as soon as its data exists.
+    output_dir = os.path.abspath(output_dir)
+    os.makedirs(output_dir, exist_ok=True)
+    results = []
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count() or 1,
+                             initializer=_init_render_worker) as pool:
+        pending = []
+        for name, compute_spec, render_spec, dpi in jobs:
+            start = time.perf_counter()
+            data = resolve(compute_spec)()
+            compute_s = time.perf_counter() - start
+            future = pool.submit(render_figure, render_spec, data,
+                                 os.path.join(output_dir, name), tuple(formats), dpi)
+            pending.append((name, compute_s, future))
+
+        for name, compute_s, future in pending:
+            paths, render_s = future.result()
+            results.append({"figure": name, "compute_s": compute_s, "render_s": render_s, "paths": paths})
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render every PPT-Atoms figure offscreen in parallel.")
+    parser.add_argument("figures", nargs="*", help="Figure names to render (default: all)")
+    parser.add_argument("-o", "--output", default="figures", help="Output directory")
+    parser.add_argument("--formats", nargs="+", default=["png", "svg"], choices=("png", "svg", "pdf"))
+    parser.add_argument("-j", "--workers", type=int, default=None, help="Render worker processes")
+    args = parser.parse_args(argv)
+
+    jobs = [job for job in FIGURE_JOBS if not args.figures or job[0] in args.figures]
+    unknown = set(args.figures) - {job[0] for job in FIGURE_JOBS}
+    if unknown:
+        parser.error(f"unknown figure(s): {', '.join(sorted(unknown))}")
+
+    print("--- PPT - Atoms: PPT 3.0: Offscreen Parallel Figure Renderer ---")
+    start = time.perf_counter()
+    results = run_pipeline(jobs, args.output, args.formats, args.workers)
+    wall = time.perf_counter() - start
+
+    print(f"\n{'Figure':<30} | {'Compute (s)':<11} | {'Render (s)':<10} | Files")
+    print("-" * 80)
+    for result in results:
+        files = ", ".join(os.path.basename(path) for path in result["paths"])
+        print(f"{result['figure']:<30} | {result['compute_s']:<11.3f} | {result['render_s']:<10.3f} | {files}")
+
+    serial = sum(r["compute_s"] + r["render_s"] for r in results)
+    print(f"\nWall time: {wall:.2f} s (serial compute + render: {serial:.2f} s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,286 @@
+import argparse
+import sys
+
+import numpy as np
+
+from Nuclide_Chart_Binding_Engine import JOULES_TO_MEV, UNIVERSAL_PRESSURE, displacement_volume, load_nuclide_table
+from Periodic_Harmonic_Packing_Model import ELEMENTS
+
+# PPT-Atoms Validation Suite v1.0.0
+# Module: Fission_Channel_Energy_Matrix.py
+# Author: Vladimir Milosevic
+# Theory: Plasma Pressure Theory (PPT) 3.0
+# Description: Cavitation energy of every charge- and mass-conserving fission split of one or more parents, folded with a yield distribution into mean energy and kilotons per kg.
+
+AVOGADRO = 6.02214076e23
+JOULES_TO_KILOTONS = 4.184e12
+
+# 1. BINDING ENERGIES
+# Built-in lattices (MeV): the U235_Fission_Cavitation_Solver values and the other fissile parents.
+# A local CSV table (columns Z, N, binding_MeV) overrides these; everything else falls back to the SEMF.
+BUILTIN_BINDING_MEV = {
+    (92, 143): 1783.8,   # U-235
+    (56, 85): 1173.4,    # Ba-141
+    (36, 56): 782.6,     # Kr-92
+    (92, 141): 1771.7,   # U-233
+    (92, 146): 1801.7,   # U-238
+    (94, 145): 1806.9,   # Pu-239
+}
+
+# Semi-empirical mass formula (MeV): volume, surface, Coulomb, asymmetry, pairing
+SEMF_VOLUME = 15.75
+SEMF_SURFACE = 17.8
+SEMF_COULOMB = 0.711
+SEMF_ASYMMETRY = 23.7
+SEMF_PAIRING = 11.18
+
+
+def semf_binding(Z, N):
+    # Liquid-drop binding energy for arrays of (Z, N); zero for A = 0 and for free nucleons
+    Z = np.asarray(Z, dtype=np.float64)
+    N = np.asarray(N, dtype=np.float64)
+    A = Z + N
+    safe_A = np.where(A > 0, A, 1.0)
+    pairing = np.where((Z % 2 == 0) & (N % 2 == 0), 1.0, np.where((Z % 2 == 1) & (N % 2 == 1), -1.0, 0.0))
+    binding = (SEMF_VOLUME * A
+               - SEMF_SURFACE * safe_A ** (2 / 3)
+               - SEMF_COULOMB * Z * (Z - 1) / safe_A ** (1 / 3)
+               - SEMF_ASYMMETRY * (N - Z)**2 / safe_A
+               + pairing * SEMF_PAIRING / np.sqrt(safe_A))
+    return np.where(A > 1, binding, 0.0)
+
+
+def binding_grid(path=None, Z_max=100, N_max=160):
+    # Dense B[Z, N] lookup: SEMF everywhere, then the built-in lattices, then the local table.
+    # `tabulated` marks the entries that did not come from the SEMF.
+    Z, N = np.meshgrid(np.arange(Z_max + 1), np.arange(N_max + 1), indexing='ij')
+    grid = semf_binding(Z, N)
+    tabulated = np.zeros(grid.shape, dtype=bool)
+    entries = dict(BUILTIN_BINDING_MEV)
+    if path is not None:
+        table = load_nuclide_table(path)
+        if "binding_MeV" not in table:
+            raise ValueError(f"Binding table {path} has no 'binding_MeV' column")
+        entries.update(zip(zip(table["Z"].tolist(), table["N"].tolist()), table["binding_MeV"].tolist()))
+    for (z, n), value in entries.items():
+        if z <= Z_max and n <= N_max:
+            grid[z, n] = value
+            tabulated[z, n] = True
+    return grid, tabulated
+
+
+def grid_size(parents, Z_max=100, N_max=160):
+    # binding_grid() bounds that cover every parent (fragments are always smaller)
+    parents = np.atleast_2d(np.asarray(parents, dtype=np.int64))
+    return {"Z_max": max(Z_max, int(parents[:, 0].max())),
+            "N_max": max(N_max, int((parents[:, 1] - parents[:, 0]).max()))}
+
+
+def parse_nuclide(text):
+    # "U-235" -> (92, 235)
+    symbol, _, mass = text.partition("-")
+    if symbol not in ELEMENTS or not mass.isdigit():
+        raise ValueError(f"Expected a nuclide like 'U-235', got {text!r}")
+    return ELEMENTS.index(symbol) + 1, int(mass)
+
+
+def nuclide_name(Z, A):
+    return f"{ELEMENTS[Z - 1]}-{A}"
+
+
+# 2. THE CHANNEL MATRIX
+def fission_channels(parents, grid=None, tabulated=None, nu_values=(0, 1, 2, 3, 4), ucd_width=None):
+    # Every split parent -> (Z1, A1) + (Z2, A2) + nu free neutrons, for all parents at once.
+    # Arrays are indexed [parent, nu, Z1, A1]; (Z2, A2) = (Zp - Z1, Ap - nu - A1) is implied.
+    # Fragment 1 is the lighter one (equal masses: the lower charge), so each split appears once.
+    # ucd_width keeps only fragments within that many charges of Zp * A1 / Ap (unchanged charge
+    # distribution); fragments the table/SEMF leaves unbound (B <= 0) are never allowed.
+    # tabulated=None treats `grid` as one consistent source.
+    parents = np.atleast_2d(np.asarray(parents, dtype=np.int64))
+    if grid is None:
+        grid, tabulated = binding_grid(**grid_size(parents))
+    if tabulated is None:
+        tabulated = np.ones(grid.shape, dtype=bool)
+    outside = (parents[:, 0] >= grid.shape[0]) | (parents[:, 1] - parents[:, 0] >= grid.shape[1])
+    if np.any(outside):
+        names = ", ".join(nuclide_name(Z, A) for Z, A in parents[outside])
+        raise ValueError(f"Parent(s) {names} lie outside the {grid.shape[0] - 1} x {grid.shape[1] - 1} "
+                         "binding grid; build it with binding_grid(**grid_size(parents))")
+    Zp = parents[:, 0, None, None, None]
+    Ap = parents[:, 1, None, None, None]
+    nu = np.asarray(nu_values, dtype=np.int64)[None, :, None, None]
+    Z1 = np.arange(parents[:, 0].max() + 1)[None, None, :, None]
+    A1 = np.arange(parents[:, 1].max() + 1)[None, None, None, :]
+
+    Z2, A2 = Zp - Z1, Ap - nu - A1
+    N1, N2 = A1 - Z1, A2 - Z2
+    Z_max, N_max = grid.shape[0] - 1, grid.shape[1] - 1
+    allowed = ((Z1 >= 1) & (Z2 >= 1) & (N1 >= 0) & (N2 >= 0) & (N1 <= N_max) & (N2 <= N_max)
+               & (Z2 <= Z_max) & ((A1 < A2) | ((A1 == A2) & (Z1 <= Z2))))
+    if ucd_width is not None:
+        allowed &= np.abs(Z1 - Zp * A1 / Ap) <= ucd_width
+
+    def lookup(table, Z, N):
+        return table[np.clip(Z, 0, Z_max), np.clip(N, 0, N_max)]
+
+    # One source per channel: tabulated energies only when the parent and both fragments are
+    # tabulated, otherwise the SEMF for all three. Mixing a tabulated parent with SEMF
+    # fragments would shift every channel by the SEMF error of the parent (~12 MeV for U-235).
+    consistent = lookup(tabulated, Z1, N1) & lookup(tabulated, Z2, N2) & lookup(tabulated, Zp, Ap - Zp)
+    B1 = np.where(consistent, lookup(grid, Z1, N1), semf_binding(Z1, N1))
+    B2 = np.where(consistent, lookup(grid, Z2, N2), semf_binding(Z2, N2))
+    Bp = np.where(consistent, lookup(grid, Zp, Ap - Zp), semf_binding(Zp, Ap - Zp))
+    allowed &= (B1 > 0) & (B2 > 0)
+    allowed = np.broadcast_to(allowed, np.broadcast(allowed, B1, B2).shape)
+
+    # dV = E_J / Pressure for parent and fragments; free neutrons displace no defect volume.
+    # The medium collapses into the difference: E = P * dV_shift
+    dV_shift = displacement_volume(B1) + displacement_volume(B2) - displacement_volume(Bp)
+    dV_shift = np.where(allowed, dV_shift, np.nan)
+    parent_Z, parent_N = parents[:, 0], parents[:, 1] - parents[:, 0]
+    return {
+        "parents": parents,
+        "nu": np.asarray(nu_values, dtype=np.int64),
+        "Z1": Z1.ravel(),
+        "A1": A1.ravel(),
+        "allowed": allowed,
+        "tabulated": allowed & consistent,
+        # Tabulated minus SEMF parent binding: what a tabulated/SEMF mix would have shifted
+        "parent_offset_MeV": grid[parent_Z, parent_N] - semf_binding(parent_Z, parent_N),
+        "dV_shift_m3": dV_shift,
+        "E_MeV": UNIVERSAL_PRESSURE * dV_shift / JOULES_TO_MEV,
+    }
+
+
+def channel(channels, parent_index, nu, Z1, A1):
+    # The (dV_shift, E) entry of one split, with either fragment given as fragment 1
+    Zp, Ap = channels["parents"][parent_index]
+    Z2, A2 = Zp - Z1, Ap - nu - A1
+    if (A2, Z2) < (A1, Z1):
+        Z1, A1 = Z2, A2
+    k = int(np.flatnonzero(channels["nu"] == nu)[0])
+    return channels["dV_shift_m3"][parent_index, k, Z1, A1], channels["E_MeV"][parent_index, k, Z1, A1]
+
+
+# 3. YIELD FOLDING
+# Generic thermal-fission systematics: the heavy-fragment mass peak stays near A = 139.5 for
+# the actinides, fragment charges scatter about the unchanged charge distribution, and nu
+# follows the U-235 prompt-neutron multiplicity.
+HEAVY_PEAK_A = 139.5
+HEAVY_PEAK_WIDTH = 5.5
+CHARGE_WIDTH = 0.56
+NU_MEAN = 2.43
+NU_WIDTH = 1.1
+
+
+def systematic_yields(channels):
+    # Unnormalised Gaussian yields on the channel grid (heavy mass x charge x nu)
+    parents = channels["parents"]
+    Zp = parents[:, 0, None, None, None].astype(np.float64)
+    Ap = parents[:, 1, None, None, None].astype(np.float64)
+    nu = channels["nu"][None, :, None, None]
+    Z1 = channels["Z1"][None, None, :, None]
+    A1 = channels["A1"][None, None, None, :]
+    A2 = Ap - nu - A1
+    weight = (np.exp(-0.5 * ((A2 - HEAVY_PEAK_A) / HEAVY_PEAK_WIDTH)**2)
+              * np.exp(-0.5 * ((Z1 - Zp * A1 / Ap) / CHARGE_WIDTH)**2)
+              * np.exp(-0.5 * ((nu - NU_MEAN) / NU_WIDTH)**2))
+    return np.where(channels["allowed"], weight, 0.0)
+
+
+def _load_columns(path, required):
+    table = np.atleast_1d(np.genfromtxt(path, delimiter=',', names=True, dtype=None, encoding='utf-8'))
+    columns = {name: np.asarray(table[name]) for name in table.dtype.names}
+    missing = set(required) - set(columns)
+    if missing:
+        raise ValueError(f"Table {path} is missing required columns: {sorted(missing)}")
+    return columns
+
+
+def load_yield_table(path, channels):
+    # CSV with a header row: Zp, Ap, Z1, A1, nu, yield (fragment order is free).
+    # Rows for channels outside the matrix are ignored.
+    table = _load_columns(path, ("Zp", "Ap", "Z1", "A1", "nu", "yield"))
+    weights = np.zeros(channels["allowed"].shape)
+    parent_index = {tuple(p): i for i, p in enumerate(channels["parents"].tolist())}
+    nu_index = {nu: k for k, nu in enumerate(channels["nu"].tolist())}
+    for Zp, Ap, Z1, A1, nu, value in zip(*(table[name].tolist() for name in
+                                          ("Zp", "Ap", "Z1", "A1", "nu", "yield"))):
+        i, k = parent_index.get((int(Zp), int(Ap))), nu_index.get(int(nu))
+        if i is None or k is None:
+            continue
+        Z2, A2 = int(Zp - Z1), int(Ap - nu - A1)
+        Z1, A1 = (Z2, A2) if (A2, Z2) < (A1, Z1) else (int(Z1), int(A1))
+        if 0 <= Z1 < weights.shape[2] and 0 <= A1 < weights.shape[3]:
+            weights[i, k, Z1, A1] += value
+    return np.where(channels["allowed"], weights, 0.0)
+
+
+def fold_yields(channels, yields=None):
+    # Per-parent yield-weighted mean release and the kiloton figure of 1 kg of that parent.
+    # yields: None (systematic_yields), an array on the channel grid, or a callable(channels).
+    if yields is None:
+        yields = systematic_yields(channels)
+    elif callable(yields):
+        yields = yields(channels)
+    weights = np.where(channels["allowed"], np.broadcast_to(yields, channels["allowed"].shape), 0.0)
+    total = weights.sum(axis=(1, 2, 3))
+    if np.any(total <= 0):
+        raise ValueError("Yield distribution has no weight on an allowed channel for some parent")
+    weights = weights / total[:, None, None, None]
+
+    energy = np.where(channels["allowed"], channels["E_MeV"], 0.0)
+    mean_MeV = np.sum(weights * energy, axis=(1, 2, 3))
+    atoms_per_kg = AVOGADRO / (channels["parents"][:, 1] * 1e-3)
+    return {
+        "mean_MeV": mean_MeV,
+        "mean_dV_shift_m3": displacement_volume(mean_MeV),
+        "kilotons_per_kg": mean_MeV * JOULES_TO_MEV * atoms_per_kg / JOULES_TO_KILOTONS,
+        "mean_nu": np.sum(weights * channels["nu"][None, :, None, None], axis=(1, 2, 3)),
+        "weights": weights,
+    }
+
+
+def most_energetic(channels, parent_index):
+    E = np.where(channels["allowed"][parent_index], channels["E_MeV"][parent_index], -np.inf)
+    k, Z1, A1 = np.unravel_index(np.argmax(E), E.shape)
+    return int(channels["nu"][k]), int(Z1), int(A1), float(E[k, Z1, A1])
+
+
+# 4. DEMONSTRATION
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Energy release of every fission channel of one or more parents.")
+    parser.add_argument("parents", nargs="*", default=["U-235", "U-233", "Pu-239"], help="e.g. U-235 Pu-239")
+    parser.add_argument("--table", help="Local binding table CSV (Z, N, binding_MeV)")
+    parser.add_argument("--yields", help="Yield CSV (Zp, Ap, Z1, A1, nu, yield); default: Gaussian systematics")
+    parser.add_argument("--ucd-width", type=float, default=None, help="Max |Z1 - Zp A1 / Ap| of a fragment")
+    args = parser.parse_args(argv)
+
+    print("--- PPT - Atoms: PPT 3.0: Fission Channel Energy Matrix ---")
+    parents = [parse_nuclide(text) for text in args.parents]
+    grid, tabulated = binding_grid(args.table, **grid_size(parents))
+    channels = fission_channels(parents, grid, tabulated, ucd_width=args.ucd_width)
+    yields = load_yield_table(args.yields, channels) if args.yields else None
+    folded = fold_yields(channels, yields)
+
+    # Reference channel of U235_Fission_Cavitation_Solver
+    if (92, 235) in parents:
+        dV, E = channel(channels, parents.index((92, 235)), 2, 56, 141)
+        print(f"U-235 -> Ba-141 + Kr-92 + 2n:  dV_shift = {dV:.4e} m^3, E = {E:.2f} MeV")
+    print(f"Binding energies: {int(tabulated.sum())} tabulated; channels with any SEMF member use the SEMF throughout\n")
+
+    print(f"{'Parent':<7} | {'Channels':>8} | {'Tabulated':>9} | {'Max E channel':<30} | "
+          f"{'Mean E (MeV)':>12} | {'<nu>':>5} | {'kt / kg':>7} | {'Table-SEMF':>10}")
+    print("-" * 109)
+    for p, (Z, A) in enumerate(parents):
+        nu, Z1, A1, E = most_energetic(channels, p)
+        split = f"{nuclide_name(Z1, A1)} + {nuclide_name(Z - Z1, A - nu - A1)} + {nu}n"
+        print(f"{nuclide_name(Z, A):<7} | {int(channels['allowed'][p].sum()):>8} | "
+              f"{int(channels['tabulated'][p].sum()):>9} | {split + f' ({E:.1f})':<30} | "
+              f"{folded['mean_MeV'][p]:>12.2f} | {folded['mean_nu'][p]:>5.2f} | {folded['kilotons_per_kg'][p]:>7.2f} | "
+              f"{channels['parent_offset_MeV'][p]:>+10.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
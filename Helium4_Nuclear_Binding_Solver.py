@@ -1,12 +1,14 @@
-import numpy as np
 import math
 
+from Validation_Result import ValidationResult, validation
+
 # PPT-Atoms Validation Suite v1.0.0
 # Script: Helium4_Nuclear_Binding_Solver.py
 # Author: Vladimir Milosevic
 # Theory: Plasma Pressure Theory (PPT) 3.0
 # Description: Calculates the nuclear binding energy of the Alpha Particle (He-4) purely from geometric volumetric defect.
 
+@validation
 def solve_alpha_binding_energy():
     print("--- PPT - Atoms: PPT 3.0: Helium-4 Nuclear Binding Geometric Solver ---")
     
@@ -56,5 +58,9 @@ def solve_alpha_binding_energy():
     print("The 2.223% volume lost here establishes the Phi_ppt constant used across")
     print("all PPT 3.0 atomic and molecular scale validations.")
 
+    return ValidationResult(None, "He-4 Binding Energy", e_binding_MeV, real_binding_MeV, "MeV",
+                            {"rho_medium_nuclear": rho_medium_nuclear, "r_nucleon": r_nucleon,
+                             "compression_overlap_fraction": compression_overlap_fraction})
+
 if __name__ == "__main__":
     solve_alpha_binding_energy()
\ No newline at end of file
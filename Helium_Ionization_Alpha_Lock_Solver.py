@@ -1,4 +1,4 @@
-import numpy as np
+from Validation_Result import ValidationResult, validation
 
 # PPT-Atoms Validation Suite v1.0.0
 # Script: Helium_Ionization_Alpha_Lock_Solver.py
@@ -6,6 +6,7 @@ import numpy as np
 # Theory: Plasma Pressure Theory (PPT) 3.0
 # Description: Calculates Helium first ionization using the Alpha Packing Constant.
 
+@validation
 def solve_helium_ionization():
     print("--- PPT - Atoms: PPT 3.0: Helium Ionization Alpha Lock Solver ---")
     
@@ -47,5 +48,9 @@ def solve_helium_ionization():
     print("Helium's ionization energy is defined by its core displacement square,")
     print("attenuated perfectly by the tetrahedral Alpha Packing Constant (Phi_ppt).")
 
+    return ValidationResult(None, "He First Ionization", e_he_pred, real_he_nist, "eV",
+                            {"e_base_tension": e_base_tension, "core_displacement": core_displacement,
+                             "phi_ppt": phi_ppt})
+
 if __name__ == "__main__":
     solve_helium_ionization()
\ No newline at end of file
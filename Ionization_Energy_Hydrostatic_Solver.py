@@ -1,4 +1,4 @@
-import numpy as np
+from Validation_Result import ValidationResult, validation
 
 # PPT-Atoms Validation Suite v1.0.0
 # Script: Ionization_Energy_Hydrostatic_Solver.py
@@ -6,6 +6,7 @@ import numpy as np
 # Theory: Plasma Pressure Theory (PPT) 3.0
 # Description: Calculates the volumetric displacement required for hydrogen ionization using the unified density constant.
 
+@validation
 def solve_ionization_displacement():
     print("--- PPT - Atoms: PPT 3.0: Hydrostatic Ionization Solver ---")
     
@@ -45,5 +46,8 @@ def solve_ionization_displacement():
     print(f"Derived Shear Energy:{e_ev_calc:.3f} eV")
     print(f"Match Accuracy:      {accuracy:.2f}%")
 
+    return ValidationResult(None, "H Ionization Round Trip", e_ev_calc, target_ev, "eV",
+                            {"rho_univ": rho_univ, "target_ev": target_ev})
+
 if __name__ == "__main__":
     solve_ionization_displacement()
\ No newline at end of file
@@ -1,4 +1,4 @@
-import numpy as np
+from Validation_Result import ValidationResult, validation
 
 # PPT-Atoms Validation Suite v1.0.0
 # Script: Lithium_Ionization_Geometric_Solver.py
@@ -6,6 +6,7 @@ import numpy as np
 # Theory: Plasma Pressure Theory (PPT) 3.0
 # Description: Calculates Lithium's first ionization energy using fluid-dynamic volumetric shielding.
 
+@validation
 def solve_lithium_ionization():
     print("--- PPT - Atoms: PPT 3.0: Lithium Ionization Geometric Solver ---")
     
@@ -27,7 +28,7 @@ def solve_lithium_ionization():
     # In PPT 3.0, displacement is volume. Volumetric shielding scales geometrically.
     # The permeability of the inner Double Layer is proportional to the cube root of the node count.
     inner_nodes = 2
-    volumetric_permeability = np.cbrt(inner_nodes)  # ~1.2599
+    volumetric_permeability = inner_nodes ** (1 / 3)  # ~1.2599
     
     # The structural pinning force scales by the square of the permeability 
     # (analogous to how standard physics squares Z_eff, but derived from geometric area/volume ratios)
@@ -52,5 +53,8 @@ def solve_lithium_ionization():
     print("Lithium's ionization energy is determined by the 1/n² hydrostatic pressure drop, ")
     print("multiplied by the volumetric permeability of its 2-node inner double layer.")
 
+    return ValidationResult(None, "Li First Ionization", e_li_pred, real_li_nist, "eV",
+                            {"e_base_tension": e_base_tension, "n_outer": n_outer, "inner_nodes": inner_nodes})
+
 if __name__ == "__main__":
     solve_lithium_ionization()
\ No newline at end of file
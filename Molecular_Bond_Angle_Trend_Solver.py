@@ -1,5 +1,8 @@
+import itertools
+
 import numpy as np
-import matplotlib.pyplot as plt
+
+from Validation_Result import ValidationResult, validation
 
 # PPT-Atoms Validation Suite v1.0.0
 # Script: Molecular_Bond_Angle_Trend_Solver.py
@@ -35,9 +38,119 @@ def calculate_ppt_angle(element_name, m_central, num_h_nodes):
     
     return predicted_angle, d_r
 
-def plot_molecular_trend():
-    print("--- PPT - Atoms: PPT 3.0: Molecular Bond Angle Hydrostatic Trend ---")
-    
+# --- BATCH PREDICTION OVER MOLECULE TABLES ---
+# Rows streamed per batch; memory stays constant for any table length
+DEFAULT_CHUNK_ROWS = 2**18
+
+TABLE_COLUMNS = ("m_central", "num_h_nodes", "observed_angle")
+
+# One formatted output row; a whole chunk is rendered with a single % operation
+ROW_FORMAT = "%.6f,%.6f,%.6f,%.6f,%.6f,%.6f\n"
+
+
+def predict_angles(m_central, num_h_nodes):
+    # calculate_ppt_angle is pure arithmetic, so it broadcasts over whole columns
+    m_central = np.asarray(m_central, dtype=np.float64)
+    num_h_nodes = np.asarray(num_h_nodes, dtype=np.float64)
+    return calculate_ppt_angle(None, m_central, num_h_nodes)
+
+
+def _iter_csv_chunks(path, chunk_rows):
+    # Header row names the columns; observed_angle may be absent or left empty per row
+    with open(path, encoding="utf-8") as handle:
+        header = [name.strip() for name in handle.readline().split(",")]
+        missing = {"m_central", "num_h_nodes"} - set(header)
+        if missing:
+            raise ValueError(f"{path} is missing required columns: {sorted(missing)}")
+        usecols = [header.index(name) for name in TABLE_COLUMNS if name in header]
+        while True:
+            lines = list(itertools.islice(handle, chunk_rows))
+            if not lines:
+                break
+            try:
+                block = np.loadtxt(lines, delimiter=",", usecols=usecols, dtype=np.float64, ndmin=2)
+            except ValueError:
+                # Blank observed angles: the slower parser maps empty fields to NaN
+                block = np.genfromtxt(lines, delimiter=",", usecols=usecols, dtype=np.float64, ndmin=2)
+            chunk = {"m_central": block[:, 0], "num_h_nodes": block[:, 1]}
+            if len(usecols) == 3:
+                chunk["observed_angle"] = block[:, 2]
+            yield chunk
+
+
+def _open_npz_column(table, name):
+    # Positions a stream just past the .npy header of one archive member
+    stream = table.zip.open(f"{name}.npy")
+    version = np.lib.format.read_magic(stream)
+    if version == (1, 0):
+        shape, _, dtype = np.lib.format.read_array_header_1_0(stream)
+    else:
+        shape, _, dtype = np.lib.format.read_array_header_2_0(stream)
+    if dtype.hasobject:
+        raise ValueError(f"column {name!r} is not numeric")
+    return stream, shape, dtype
+
+
+def _iter_npz_chunks(path, chunk_rows):
+    # mmap_mode maps plain .npy data in place; NPZ members sit inside a zip, so each
+    # column is streamed from its member and only one chunk per column is ever decoded
+    with np.load(path, mmap_mode="r") as table:
+        columns = {name: _open_npz_column(table, name) for name in TABLE_COLUMNS if name in table.files}
+        n_rows = columns["m_central"][1][0]
+        for start in range(0, n_rows, chunk_rows):
+            rows = min(chunk_rows, n_rows - start)
+            chunk = {}
+            for name, (stream, shape, dtype) in columns.items():
+                row_shape = tuple(shape[1:])
+                count = rows * int(np.prod(row_shape, dtype=np.int64))
+                data = stream.read(count * dtype.itemsize)
+                chunk[name] = np.frombuffer(data, dtype=dtype, count=count).reshape((rows,) + row_shape)
+            yield chunk
+
+
+def iter_molecule_table(path, chunk_rows=DEFAULT_CHUNK_ROWS):
+    if path.endswith(".npz"):
+        return _iter_npz_chunks(path, chunk_rows)
+    return _iter_csv_chunks(path, chunk_rows)
+
+
+def predict_molecule_table(path_in, path_out, chunk_rows=DEFAULT_CHUNK_ROWS):
+    # Streams XHn records, writes one prediction row per input row, and accumulates
+    # the error statistics on the fly (no per-row Python work, no full-table arrays)
+    count = 0
+    n_observed = 0
+    abs_error_sum = 0.0
+    sq_error_sum = 0.0
+    max_abs_error = 0.0
+
+    with open(path_out, "w", encoding="utf-8") as out:
+        out.write("m_central,num_h_nodes,displacement_ratio,predicted_angle,observed_angle,error\n")
+        for chunk in iter_molecule_table(path_in, chunk_rows):
+            predicted, d_r = predict_angles(chunk["m_central"], chunk["num_h_nodes"])
+            observed = chunk.get("observed_angle", np.full(predicted.shape, np.nan))
+            error = predicted - observed
+
+            known = np.isfinite(error)
+            n_observed += int(known.sum())
+            abs_error_sum += float(np.abs(error[known]).sum())
+            sq_error_sum += float((error[known]**2).sum())
+            if known.any():
+                max_abs_error = max(max_abs_error, float(np.abs(error[known]).max()))
+            count += predicted.size
+
+            rows = np.column_stack((chunk["m_central"], chunk["num_h_nodes"], d_r, predicted, observed, error))
+            out.write((ROW_FORMAT * rows.shape[0]) % tuple(rows.ravel().tolist()))
+
+    return {
+        "rows": count,
+        "rows_with_observation": n_observed,
+        "mae_deg": abs_error_sum / n_observed if n_observed else float("nan"),
+        "rmse_deg": (sq_error_sum / n_observed) ** 0.5 if n_observed else float("nan"),
+        "max_abs_error_deg": max_abs_error if n_observed else float("nan"),
+    }
+
+
+def compute_molecular_trend():
     # Validation Data
     test_cases = [
         {"name": "Methane (CH4)", "m_c": 12.011, "nodes": 4, "real": 109.5},
@@ -45,30 +158,33 @@ def plot_molecular_trend():
         {"name": "Water (H2O)",   "m_c": 15.999, "nodes": 2, "real": 104.5}
     ]
 
-    print(f"\n{'Molecule':<15} | {'Displacement Ratio':<20} | {'PPT Pred (deg)':<15} | {'NIST Real (deg)':<15} | {'Accuracy':<10}")
-    print("-" * 90)
-
-    names, preds, reals = [], [], []
-
+    rows = []
     for case in test_cases:
         pred, d_r = calculate_ppt_angle(case["name"], case["m_c"], case["nodes"])
         accuracy = (1 - abs(pred - case["real"]) / case["real"]) * 100
-        print(f"{case['name']:<15} | {d_r:<20.4f} | {pred:<15.3f} | {case['real']:<15.1f} | {accuracy:>8.2f}%")
-        
-        names.append(case["name"].split()[0])
-        preds.append(pred)
-        reals.append(case["real"])
+        rows.append({"name": case["name"], "d_r": d_r, "pred": pred, "real": case["real"], "accuracy": accuracy})
+
+    return {
+        "rows": rows,
+        "names": [row["name"].split()[0] for row in rows],
+        "preds": [row["pred"] for row in rows],
+        "reals": [row["real"] for row in rows],
+    }
+
+
+def render_molecular_trend(data):
+    import matplotlib.pyplot as plt
 
     # VISUAL PROOF GENERATION
-    plt.figure(figsize=(9, 6))
+    fig = plt.figure(figsize=(9, 6))
     
     # NIST Data (Gold)
-    plt.plot(names, reals, color='#FFD700', marker='o', linestyle='-', 
+    plt.plot(data["names"], data["reals"], color='#FFD700', marker='o', linestyle='-', 
              linewidth=3, markersize=12, label='Observed Reality (NIST)', 
              markeredgecolor='white', markeredgewidth=1, zorder=3)
 
     # PPT Prediction (Cyan)
-    plt.plot(names, preds, color='#00FFFF', marker='^', linestyle='--', 
+    plt.plot(data["names"], data["preds"], color='#00FFFF', marker='^', linestyle='--', 
              linewidth=2, markersize=10, label='PPT 3.0 Hydrostatic Crush',
              markeredgecolor='white', markeredgewidth=1, zorder=4)
 
@@ -79,7 +195,36 @@ def plot_molecular_trend():
     plt.legend(frameon=True, facecolor='white', framealpha=0.9)
     plt.grid(True, linestyle='--', alpha=0.4)
     plt.tight_layout()
-    plt.show()
+    return fig
+
+
+@validation
+def plot_molecular_trend(plot=True):
+    print("--- PPT - Atoms: PPT 3.0: Molecular Bond Angle Hydrostatic Trend ---")
+
+    data = compute_molecular_trend()
+
+    print(f"\n{'Molecule':<15} | {'Displacement Ratio':<20} | {'PPT Pred (deg)':<15} | {'NIST Real (deg)':<15} | {'Accuracy':<10}")
+    print("-" * 90)
+    for row in data["rows"]:
+        print(f"{row['name']:<15} | {row['d_r']:<20.4f} | {row['pred']:<15.3f} | {row['real']:<15.1f} | {row['accuracy']:>8.2f}%")
+
+    if plot:
+        import matplotlib.pyplot as plt
+
+        render_molecular_trend(data)
+        plt.show()
+
+    return [ValidationResult(None, row["name"], row["pred"], row["real"], "deg", {"displacement_ratio": row["d_r"]})
+            for row in data["rows"]]
 
 if __name__ == "__main__":
-    plot_molecular_trend()
\ No newline at end of file
+    import sys
+
+    if len(sys.argv) == 3:
+        # Batch mode: python Molecular_Bond_Angle_Trend_Solver.py molecules.csv predictions.csv
+        stats = predict_molecule_table(sys.argv[1], sys.argv[2])
+        print(f"Predicted {stats['rows']} molecules -> {sys.argv[2]}")
+        print(f"MAE: {stats['mae_deg']:.4f} deg | RMSE: {stats['rmse_deg']:.4f} deg | Max: {stats['max_abs_error_deg']:.4f} deg")
+    else:
+        plot_molecular_trend()
\ No newline at end of file
@@ -0,0 +1,138 @@
+import numpy as np
+
+# PPT-Atoms Validation Suite v1.0.0
+# Module: Nuclide_Chart_Binding_Engine.py
+# Author: Vladimir Milosevic
+# Theory: Plasma Pressure Theory (PPT) 3.0
+# Description: Vectorized hydrostatic binding-energy engine (E = rho * c^2 * dV) for whole nuclide charts.
+
+# --- 1. THE UNIFIED CONSTANTS (Exact 3.0 Precision) ---
+RHO_MEDIUM_NUCLEAR = 2.3e17        # kg/m^3 (Universal Medium Density)
+C2 = (299792458)**2                # m^2/s^2 (Exact Maximum Wave Speed)
+JOULES_TO_MEV = 1.602176634e-13
+
+# Universal PPT Pressure (J/m^3)
+UNIVERSAL_PRESSURE = RHO_MEDIUM_NUCLEAR * C2
+
+# --- 2. THE GEOMETRIC NUCLEON BASE ---
+R_NUCLEON = 0.8427e-15             # meters (PPT 3.0 Muonic Proton Radius)
+V_SINGLE_NUCLEON = (4/3) * np.pi * (R_NUCLEON**3)
+
+# The fundamental internal tetrahedral overlap (Phi_ppt = 2.223%)
+COMPRESSION_HE4 = 0.02223
+
+# The secondary Alpha-Alpha interface overlap of the Carbon-12 triangle (0.153%)
+ALPHA_BOND_OVERLAP = 0.00153
+
+
+def nucleon_volume(r_nucleon=R_NUCLEON):
+    # Volume of a single spherical nucleon: V = (4/3) * pi * r^3
+    return (4/3) * np.pi * np.asarray(r_nucleon, dtype=np.float64)**3
+
+
+def hydrostatic_binding_energy(Z, N, overlap_fraction=COMPRESSION_HE4,
+                               r_nucleon=R_NUCLEON, rho_medium=RHO_MEDIUM_NUCLEAR):
+    # Binding energy (MeV) of every (Z, N, overlap) entry in one broadcast pass.
+    # All arguments broadcast against each other, so a whole chart of nuclides,
+    # a sweep of overlap fractions, or both at once are evaluated without a loop.
+    A = np.asarray(Z, dtype=np.float64) + np.asarray(N, dtype=np.float64)
+
+    # Raw, uncompressed displacement volume of all A nucleons
+    v_raw_total = A * nucleon_volume(r_nucleon)
+
+    # The volumetric displacement physically crushed out by the medium
+    delta_v = v_raw_total * np.asarray(overlap_fraction, dtype=np.float64)
+
+    # E = Pressure * Volume Defect, Pressure = rho_univ * c^2
+    return (np.asarray(rho_medium, dtype=np.float64) * C2) * delta_v / JOULES_TO_MEV
+
+
+def displacement_volume(E_MeV, rho_medium=RHO_MEDIUM_NUCLEAR):
+    # Inverse map: geometric defect volume (m^3) of a binding energy, dV = E_J / Pressure
+    return (np.asarray(E_MeV, dtype=np.float64) * JOULES_TO_MEV) / (np.asarray(rho_medium, dtype=np.float64) * C2)
+
+
+def overlap_fraction_from_binding(Z, N, E_MeV, r_nucleon=R_NUCLEON, rho_medium=RHO_MEDIUM_NUCLEAR):
+    # The packing overlap a nucleus needs so that P * dV reproduces its binding energy
+    A = np.asarray(Z, dtype=np.float64) + np.asarray(N, dtype=np.float64)
+    return displacement_volume(E_MeV, rho_medium) / (A * nucleon_volume(r_nucleon))
+
+
+def alpha_cluster_overlap(compression_He4=COMPRESSION_HE4, alpha_bond_overlap=ALPHA_BOND_OVERLAP):
+    # Per-nucleon overlap of an alpha-conjugate lattice (Carbon-12 model):
+    # every nucleon sits in a tetrahedral He-4 cluster AND shares the Alpha-Alpha interface.
+    return np.asarray(compression_He4, dtype=np.float64) + np.asarray(alpha_bond_overlap, dtype=np.float64)
+
+
+def load_nuclide_table(path):
+    # Reads a local CSV table with a header row containing at least 'Z' and 'N'.
+    # Optional columns: 'overlap_fraction' (per-nuclide packing) and 'binding_MeV' (measured reference).
+    table = np.genfromtxt(path, delimiter=',', names=True, dtype=None, encoding='utf-8')
+    table = np.atleast_1d(table)
+    columns = {name: np.asarray(table[name]) for name in table.dtype.names}
+    missing = {'Z', 'N'} - set(columns)
+    if missing:
+        raise ValueError(f"Nuclide table {path} is missing required columns: {sorted(missing)}")
+    return columns
+
+
+def solve_nuclide_chart(Z, N, overlap_fraction=COMPRESSION_HE4, binding_MeV=None):
+    # One broadcast pass over the whole chart. Returns predicted energies and,
+    # when measured energies are supplied, the per-nuclide accuracy (%).
+    predicted = hydrostatic_binding_energy(Z, N, overlap_fraction)
+    result = {
+        "Z": np.asarray(Z, dtype=np.int64),
+        "N": np.asarray(N, dtype=np.int64),
+        "predicted_MeV": predicted,
+    }
+    if binding_MeV is not None:
+        real = np.asarray(binding_MeV, dtype=np.float64)
+        result["real_MeV"] = real
+        result["accuracy"] = (1 - np.abs(predicted - real) / real) * 100
+    return result
+
+
+def run_chart_validation(path=None):
+    print("--- PPT - Atoms: PPT 3.0: Vectorized Nuclide Chart Binding Engine ---")
+
+    if path is not None:
+        table = load_nuclide_table(path)
+        chart = solve_nuclide_chart(table["Z"], table["N"],
+                                    table.get("overlap_fraction", COMPRESSION_HE4),
+                                    table.get("binding_MeV"))
+        print(f"Evaluated {chart['predicted_MeV'].size} nuclides from {path}")
+        if "accuracy" in chart:
+            print(f"Median Predictive Accuracy: {np.median(chart['accuracy']):.2f}%")
+        return chart
+
+    # --- VALIDATION ANCHORS (He-4 tetrahedron, C-12 alpha triangle) ---
+    names = ["He-4", "C-12"]
+    Z = np.array([2, 6])
+    N = np.array([2, 6])
+    real = np.array([28.3, 92.16])
+    overlap = np.array([COMPRESSION_HE4, alpha_cluster_overlap()])
+
+    chart = solve_nuclide_chart(Z, N, overlap, real)
+
+    print(f"\n{'Nuclide':<8} | {'Overlap':<9} | {'PPT (MeV)':<10} | {'Real (MeV)':<10} | {'Accuracy':<10}")
+    print("-" * 60)
+    for name, o, p, r, a in zip(names, overlap, chart["predicted_MeV"], real, chart["accuracy"]):
+        print(f"{name:<8} | {o:<9.5f} | {p:<10.2f} | {r:<10.2f} | {a:>8.2f}%")
+
+    # --- CALIBRATION (not a prediction) ---
+    # U-235 has no hand-set overlap: it is back-solved from the measured 1783.8 MeV, so
+    # reproducing that energy proves nothing and it gets no accuracy figure
+    u235_overlap = overlap_fraction_from_binding(92, 143, 1783.8)
+    chart["calibration"] = {"U-235": u235_overlap}
+    print(f"\nCalibration: U-235 overlap back-solved from 1783.8 MeV = {u235_overlap:.5f} "
+          f"({u235_overlap / COMPRESSION_HE4:.3f} x Phi_ppt)")
+
+    print("\nMechanical Conclusion:")
+    print("A single broadcast of E = rho * c^2 * dV covers every nuclide at once;")
+    print("the chart is limited only by the packing overlap assigned to each lattice.")
+    return chart
+
+
+if __name__ == "__main__":
+    import sys
+    run_chart_validation(sys.argv[1] if len(sys.argv) > 1 else None)
@@ -0,0 +1,301 @@
+import functools
+import importlib
+import json
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import numpy as np
+
+from Deterministic_Half_Life_Acoustic_Solver import log10_half_life_years
+from Nuclide_Chart_Binding_Engine import (
+    COMPRESSION_HE4,
+    R_NUCLEON,
+    RHO_MEDIUM_NUCLEAR,
+    alpha_cluster_overlap,
+    hydrostatic_binding_energy,
+)
+from Periodic_Harmonic_Packing_Model import IONIZATION_ENERGY_EV, POSITION, period_slice
+
+# PPT-Atoms Validation Suite v1.0.0
+# Module: Parameter_Sweep_Engine.py
+# Author: Vladimir Milosevic
+# Theory: Plasma Pressure Theory (PPT) 3.0
+# Description: Lazy Cartesian parameter sweeps evaluated in vectorized blocks across a process pool, with resumable on-disk checkpoints.
+
+# Grid points evaluated (and written) per block
+DEFAULT_BLOCK_SIZE = 2**20
+
+MANIFEST_NAME = "manifest.json"
+
+
+# 1. LAZY CARTESIAN GRID
+def grid_axes(ranges):
+    # {name: values | (start, stop, num)} -> ordered {name: 1-D float array}.
+    # Only the axes are stored; grid points are generated from their flat index on demand.
+    axes = {}
+    for name, spec in ranges.items():
+        if isinstance(spec, tuple) and len(spec) == 3:
+            values = np.linspace(spec[0], spec[1], int(spec[2]))
+        else:
+            values = np.atleast_1d(np.asarray(spec, dtype=np.float64))
+        if values.ndim != 1 or values.size == 0:
+            raise ValueError(f"Sweep axis '{name}' must be a non-empty 1-D range")
+        axes[name] = values
+    return axes
+
+
+def grid_shape(axes):
+    return tuple(values.size for values in axes.values())
+
+
+def grid_block(axes, start, stop):
+    # Parameter arrays for flat grid indices [start, stop) (C order, last axis fastest)
+    flat = np.arange(start, stop, dtype=np.int64)
+    indices = np.unravel_index(flat, grid_shape(axes))
+    return {name: values[i] for (name, values), i in zip(axes.items(), indices)}
+
+
+# 2. BUILT-IN EVALUATORS
+# Each takes a dict of equally long parameter arrays and returns a dict of output arrays.
+# They live at module level so worker processes can import them by name.
+def carbon12_evaluator(params):
+    # Carbon12_Alpha_Cluster_Solver: sweep alpha_bond_overlap (and optionally the other constants)
+    n = next(iter(params.values())).size
+    compression = params.get("compression_He4", np.full(n, COMPRESSION_HE4))
+    overlap = alpha_cluster_overlap(compression, params["alpha_bond_overlap"])
+    energy = hydrostatic_binding_energy(6, 6, overlap,
+                                        params.get("r_nucleon", R_NUCLEON),
+                                        params.get("rho_medium_nuclear", RHO_MEDIUM_NUCLEAR))
+    energy = np.broadcast_to(energy, (n,))
+    return {
+        "binding_MeV": energy,
+        "accuracy": (1 - np.abs(energy - 92.16) / 92.16) * 100,
+    }
+
+
+PERIOD_TREND_SCRIPTS = {
+    2: ("Period2_Harmonic_Packing_Trend", "reference_period2_parameters"),
+    3: ("Period3_Harmonic_Packing_Trend", "reference_period3_parameters"),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _period_packing_tensors(period):
+    # The hand-entered tensors of the Period 2 / Period 3 scripts, loaded once per worker
+    # process. They were not fitted to the ionization energies being scored, so the sweep
+    # over the pressure baseline is not circular.
+    if period not in PERIOD_TREND_SCRIPTS:
+        raise ValueError(f"No period trend script for period {period} (available: {sorted(PERIOD_TREND_SCRIPTS)})")
+    module_name, function = PERIOD_TREND_SCRIPTS[period]
+    return getattr(importlib.import_module(module_name), function)()["packing_tensors"]
+
+
+def period_trend_evaluator(params, period=2):
+    # Period trend scripts: sweep pressure_gradient (and optionally anchor_tension) against NIST
+    idx = period_slice(period)
+    tensors = _period_packing_tensors(period)
+    step = (POSITION[idx] - 1).astype(np.float64)
+
+    gradient = params["pressure_gradient"][:, None]
+    anchor = params.get("anchor_tension", np.full(gradient.shape[0], IONIZATION_ENERGY_EV[idx[0]]))[:, None]
+    error = (anchor + gradient * step) * tensors - IONIZATION_ENERGY_EV[idx]
+    return {
+        "mae_eV": np.mean(np.abs(error), axis=1),
+        "rmse_eV": np.sqrt(np.mean(error**2, axis=1)),
+    }
+
+
+def half_life_evaluator(params):
+    # Deterministic_Half_Life_Acoustic_Solver: lock factor -> log10 half-life (years),
+    # scored against an optional swept 'target_log10_yr'
+    log10_pred = log10_half_life_years(params["lock_factor"])
+    result = {"log10_half_life_yr": log10_pred}
+    if "target_log10_yr" in params:
+        result["abs_log10_residual"] = np.abs(log10_pred - params["target_log10_yr"])
+    return result
+
+
+EVALUATORS = {
+    "carbon12": "Parameter_Sweep_Engine:carbon12_evaluator",
+    "period_trend": "Parameter_Sweep_Engine:period_trend_evaluator",
+    "half_life": "Parameter_Sweep_Engine:half_life_evaluator",
+}
+
+
+def resolve_evaluator(spec):
+    # 'module:function' (or a registered short name) -> callable
+    spec = EVALUATORS.get(spec, spec)
+    module_name, _, attr = spec.partition(":")
+    if not attr:
+        raise ValueError(f"Evaluator '{spec}' must be given as 'module:function'")
+    return getattr(importlib.import_module(module_name), attr)
+
+
+# 3. CHUNKED ON-DISK STORE
+def block_path(directory, block):
+    return os.path.join(directory, f"block_{block:08d}.npz")
+
+
+def _write_atomic_npz(path, **arrays):
+    # Written under a temporary name and renamed: a killed worker never leaves a
+    # half-written block that a resumed sweep would mistake for a finished one
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as handle:
+        np.savez(handle, **arrays)
+    os.replace(tmp, path)
+
+
+def _write_manifest(directory, manifest):
+    tmp = os.path.join(directory, MANIFEST_NAME + ".tmp")
+    with open(tmp, "w") as handle:
+        json.dump(manifest, handle, indent=2)
+    os.replace(tmp, os.path.join(directory, MANIFEST_NAME))
+
+
+def load_manifest(directory):
+    with open(os.path.join(directory, MANIFEST_NAME)) as handle:
+        manifest = json.load(handle)
+    manifest["axes"] = {name: np.asarray(values, dtype=np.float64) for name, values in manifest["axes"].items()}
+    return manifest
+
+
+def finished_blocks(directory):
+    return {int(name[6:14]) for name in os.listdir(directory)
+            if name.startswith("block_") and name.endswith(".npz")}
+
+
+def _prepare_store(directory, axes, evaluator, evaluator_kwargs, block_size):
+    manifest = {
+        "evaluator": evaluator,
+        "evaluator_kwargs": evaluator_kwargs,
+        "axes": {name: values.tolist() for name, values in axes.items()},
+        "block_size": int(block_size),
+        "n_points": int(np.prod(grid_shape(axes), dtype=np.int64)),
+    }
+    manifest["n_blocks"] = -(-manifest["n_points"] // manifest["block_size"])
+
+    os.makedirs(directory, exist_ok=True)
+    if os.path.exists(os.path.join(directory, MANIFEST_NAME)):
+        with open(os.path.join(directory, MANIFEST_NAME)) as handle:
+            existing = json.load(handle)
+        # Compare in JSON form: tuples in evaluator_kwargs come back from disk as lists
+        if existing != json.loads(json.dumps(manifest)):
+            raise ValueError(f"{directory} holds a different sweep; resume needs the same axes, "
+                             "evaluator and block size (or use a new directory)")
+    else:
+        _write_manifest(directory, manifest)
+    return manifest
+
+
+def _evaluate_block(directory, block, axes, evaluator, evaluator_kwargs, block_size, n_points):
+    start = block * block_size
+    stop = min(start + block_size, n_points)
+    outputs = resolve_evaluator(evaluator)(grid_block(axes, start, stop), **evaluator_kwargs)
+    outputs = {name: np.asarray(values) for name, values in outputs.items()}
+    _write_atomic_npz(block_path(directory, block), start=start, stop=stop, **outputs)
+    return block
+
+
+# 4. SWEEP DRIVER
+def run_sweep(ranges, evaluator, directory, block_size=DEFAULT_BLOCK_SIZE, jobs=None,
+              evaluator_kwargs=None, progress=None):
+    # Evaluates every missing block of the grid; finished blocks on disk are skipped,
+    # so an interrupted sweep picks up where it stopped when called again.
+    axes = grid_axes(ranges)
+    evaluator_kwargs = dict(evaluator_kwargs or {})
+    manifest = _prepare_store(directory, axes, evaluator, evaluator_kwargs, block_size)
+    n_blocks = manifest["n_blocks"]
+    done = finished_blocks(directory)
+    pending = (b for b in range(n_blocks) if b not in done)
+    args = (axes, evaluator, evaluator_kwargs, manifest["block_size"], manifest["n_points"])
+
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1:
+        for block in pending:
+            _evaluate_block(directory, block, *args)
+            done.add(block)
+            if progress:
+                progress(len(done), n_blocks)
+        return manifest
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        # Only a bounded number of blocks is in flight, so 10^9-point grids never
+        # materialise their full task list
+        in_flight = set()
+        for block in pending:
+            in_flight.add(pool.submit(_evaluate_block, directory, block, *args))
+            if len(in_flight) >= 2 * jobs:
+                finished, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    done.add(future.result())
+                    if progress:
+                        progress(len(done), n_blocks)
+        for future in wait(in_flight)[0]:
+            done.add(future.result())
+            if progress:
+                progress(len(done), n_blocks)
+    return manifest
+
+
+def sweep_status(directory):
+    manifest = load_manifest(directory)
+    return len(finished_blocks(directory)), manifest["n_blocks"]
+
+
+def iter_sweep_blocks(directory, with_params=True):
+    # (params, outputs) per finished block, in grid order; parameters are regenerated from the axes
+    manifest = load_manifest(directory)
+    for block in sorted(finished_blocks(directory)):
+        with np.load(block_path(directory, block)) as data:
+            start, stop = int(data["start"]), int(data["stop"])
+            outputs = {name: data[name] for name in data.files if name not in ("start", "stop")}
+        params = grid_block(manifest["axes"], start, stop) if with_params else None
+        yield params, outputs
+
+
+def sweep_extremum(directory, output, mode="min"):
+    # Streamed arg-min/arg-max of one output over every finished block
+    best_value, best_params = None, None
+    for params, outputs in iter_sweep_blocks(directory):
+        values = outputs[output]
+        i = int(np.nanargmin(values) if mode == "min" else np.nanargmax(values))
+        if best_value is None or (values[i] < best_value if mode == "min" else values[i] > best_value):
+            best_value = float(values[i])
+            best_params = {name: float(p[i]) for name, p in params.items()}
+    return best_value, best_params
+
+
+def run_parameter_sweeps(directory="sweep_output", jobs=None):
+    print("--- PPT - Atoms: PPT 3.0: Resumable Parameter Sweep Engine ---")
+
+    sweeps = [
+        ("C-12 Interface Overlap", "carbon12",
+         {"alpha_bond_overlap": (0.0010, 0.0020, 2001), "compression_He4": (0.0221, 0.0224, 301)},
+         {}, "accuracy", "max"),
+        ("Period 2 Pressure Gradient", "period_trend",
+         {"anchor_tension": (4.5, 6.5, 401), "pressure_gradient": (1.5, 3.0, 1501)},
+         {"period": 2}, "mae_eV", "min"),
+        ("Period 3 Pressure Gradient", "period_trend",
+         {"anchor_tension": (4.5, 6.5, 401), "pressure_gradient": (0.5, 2.0, 1501)},
+         {"period": 3}, "mae_eV", "min"),
+        ("U-238 Lock Factor", "half_life",
+         {"lock_factor": (60.0, 110.0, 500001), "target_log10_yr": [np.log10(4.468e9)]},
+         {}, "abs_log10_residual", "min"),
+    ]
+
+    for label, evaluator, ranges, kwargs, output, mode in sweeps:
+        path = os.path.join(directory, evaluator + "".join(f"_{k}{v}" for k, v in kwargs.items()))
+        run_sweep(ranges, evaluator, path, block_size=2**18, jobs=jobs, evaluator_kwargs=kwargs)
+        finished, total = sweep_status(path)
+        value, params = sweep_extremum(path, output, mode)
+        best = ", ".join(f"{name} = {v:.5g}" for name, v in params.items())
+        print(f"\n{label} ({finished}/{total} blocks):")
+        print(f"   Best {output}: {value:.4f} at {best}")
+
+    print("\nMechanical Conclusion:")
+    print("Each block is checkpointed on disk as it finishes; re-running the same sweep")
+    print("skips the finished blocks and resumes from the first missing one.")
+
+
+if __name__ == "__main__":
+    run_parameter_sweeps()
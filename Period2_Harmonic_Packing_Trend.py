@@ -1,5 +1,13 @@
 import numpy as np
-import matplotlib.pyplot as plt
+
+from Periodic_Harmonic_Packing_Model import (
+    compute_period_packing_trend,
+    fitted_period_parameters,
+    period_packing_results,
+    print_period_packing_table,
+    render_period_packing_trend,
+)
+from Validation_Result import validation
 
 # PPT-Atoms Validation Suite v1.0.0
 # Script: Period2_Harmonic_Packing_Trend.py
@@ -7,21 +15,16 @@ import matplotlib.pyplot as plt
 # Theory: Plasma Pressure Theory (PPT) 3.0
 # Description: Maps Period 2 ionization trends to geometric harmonic node packing.
 
-def plot_period2_packing_trend():
-    print("--- PPT - Atoms: PPT 3.0: Period 2 Harmonic Packing Trend (High-Visibility) ---")
-    
-    # 1. EXPERIMENTAL DATA (NIST Standard)
-    elements = ['Li', 'Be', 'B', 'C', 'N', 'O', 'F', 'Ne']
-    outer_nodes = np.arange(1, 9)
-    real_ie = np.array([5.392, 9.323, 8.298, 11.260, 14.534, 13.618, 17.422, 21.565])
+def reference_period2_parameters():
+    # Hand-tuned Period 2 parameters, kept as a reference column next to the fitted model
+    # (and as the fixed tensors the parameter sweeps score against)
 
-    # 2. BASELINE HYDROSTATIC GRADIENT
+    # BASELINE HYDROSTATIC GRADIENT
     # The mechanical pressure required to pin nodes increases linearly with core displacement.
     anchor_tension = 5.392  # Baseline boundary tension for 1 node (Li)
     pressure_gradient = 2.15 # Linear increase in fluid pressure per added core unit
-    ie_baseline = anchor_tension + (pressure_gradient * (outer_nodes - 1))
 
-    # 3. GEOMETRIC SYMMETRY TENSORS (Vector Equilibrium)
+    # GEOMETRIC SYMMETRY TENSORS (Vector Equilibrium)
     # Maps the physical tension of node packing within the plasma double layer.
     packing_tensors = np.array([
         1.00,  # Li (1 node):  Baseline
@@ -33,64 +36,51 @@ def plot_period2_packing_trend():
         0.94,  # F  (7 nodes): Gap Fill (Stabilizing)
         1.05   # Ne (8 nodes): Perfect Boundary Lock (Maximum Surge)
     ])
+    return {"anchor_tension": anchor_tension, "pressure_gradient": pressure_gradient,
+            "packing_tensors": packing_tensors}
 
-    # 4. PPT DETERMINISTIC PREDICTION
-    ie_ppt_pred = ie_baseline * packing_tensors
 
-    # 5. TERMINAL OUTPUT TABLE
-    print("\nElement | Nodes | PPT Geometric State      | PPT (eV) | NIST (eV) | Diff")
-    print("-" * 72)
+def compute_period2_packing_trend():
+    # 1. EXPERIMENTAL DATA (NIST Standard)
+    # Li..Ne are read from the shared 118-element table in Periodic_Harmonic_Packing_Model
+
+    # 2. BASELINE HYDROSTATIC GRADIENT
+    # 3. GEOMETRIC SYMMETRY TENSORS (Vector Equilibrium)
+    # Both come from the single fit over all measured elements: the Period 2 anchor and
+    # gradient, and the packing tensors every period shares.
+    fitted = fitted_period_parameters(2)
+
+    # 4. PPT DETERMINISTIC PREDICTION
     geometries = [
         "Baseline Node", "Linear Dipole Lock", "Trigonal Buckle", "Planar Balance", 
         "Tetrahedral Lock", "Octahedral Fracture", "Gap Fill", "Boundary Lock"
     ]
-    
-    for el, n, geo, p, r in zip(elements, outer_nodes, geometries, ie_ppt_pred, real_ie):
-        print(f"{el:7} | {n:5} | {geo:24} | {p:8.3f} | {r:9.3f} | {p - r:+5.3f}")
-
-    corr = np.corrcoef(real_ie, ie_ppt_pred)[0,1]
-    mae = np.mean(np.abs(ie_ppt_pred - real_ie))
-    
-    print(f"\nStatistical Correlation: {corr:.4f}")
-    print(f"Mean Absolute Error:     {mae:.3f} eV")
-
-    # 6. HIGH-VISIBILITY VISUAL PROOF
-    plt.figure(figsize=(11, 6.5))
-    
-    # Gold markers for NIST
-    plt.plot(elements, real_ie, color='#FFD700', marker='o', linestyle='-', 
-             linewidth=3, markersize=10, label='Observed Reality (NIST)', 
-             markeredgecolor='white', markeredgewidth=1, zorder=3)
-
-    # Cyan markers for PPT
-    plt.plot(elements, ie_ppt_pred, color='#00FFFF', marker='^', linestyle='--', 
-             linewidth=2, markersize=10, label='PPT 3.0 Harmonic Packing',
-             markeredgecolor='white', markeredgewidth=1, zorder=4)
-
-    # Grey dotted line for baseline gradient
-    plt.plot(elements, ie_baseline, color='grey', linestyle=':', 
-             linewidth=1.5, label='Raw Pressure Gradient (No Geometry)', zorder=2)
-    
-    # Styling
-    plt.title('Period 2 Ionization: Quantum Orbitals vs. PPT Harmonic Packing', fontsize=14, pad=20)
-    plt.xlabel('Element (Number of Outer Displacement Nodes)', fontsize=12)
-    plt.ylabel('Shear Tension Required for Ionization (eV)', fontsize=12)
-    
+
     # Annotations mapping the "orbital" anomalies to geometric fractures
-    bbox_props = dict(boxstyle="round,pad=0.3", fc="white", ec="black", lw=1, alpha=0.8)
-    
-    plt.annotate('Trigonal Symmetry Break\n(Standard Model: 2p orbital)', xy=('B', ie_ppt_pred[2]), xytext=(-50, 40), 
-                 textcoords='offset points', arrowprops=dict(arrowstyle="->", color='#00FFFF'),
-                 bbox=bbox_props)
-    
-    plt.annotate('Octahedral Fracture\n(Standard Model: spin pairing)', xy=('O', ie_ppt_pred[5]), xytext=(-60, -55), 
-                 textcoords='offset points', arrowprops=dict(arrowstyle="->", color='#00FFFF'),
-                 bbox=bbox_props)
-
-    plt.legend(frameon=True, facecolor='white', framealpha=0.9, loc='upper left')
-    plt.grid(True, linestyle='--', alpha=0.3)
-    plt.tight_layout()
-    plt.show()
+    annotations = [
+        ('Trigonal Symmetry Break\n(Standard Model: 2p orbital)', 'B', (-50, 40)),
+        ('Octahedral Fracture\n(Standard Model: spin pairing)', 'O', (-60, -55)),
+    ]
+
+    return compute_period_packing_trend(2, fitted["anchor_tension"], fitted["pressure_gradient"],
+                                        fitted["packing_tensors"], geometries,
+                                        'Period 2 Ionization: Quantum Orbitals vs. PPT Harmonic Packing',
+                                        annotations, reference=reference_period2_parameters())
+
+
+@validation
+def plot_period2_packing_trend(plot=True):
+    print("--- PPT - Atoms: PPT 3.0: Period 2 Harmonic Packing Trend (High-Visibility) ---")
+
+    data = compute_period2_packing_trend()
+    print_period_packing_table(data)
+    if plot:
+        import matplotlib.pyplot as plt
+
+        render_period_packing_trend(data)
+        plt.show()
+
+    return period_packing_results(data)
 
 if __name__ == "__main__":
-    plot_period2_packing_trend()
\ No newline at end of file
+    plot_period2_packing_trend()
@@ -0,0 +1,372 @@
+import functools
+
+import numpy as np
+
+# PPT-Atoms Validation Suite v1.0.0
+# Module: Periodic_Harmonic_Packing_Model.py
+# Author: Vladimir Milosevic
+# Theory: Plasma Pressure Theory (PPT) 3.0
+# Description: One harmonic-packing ionization model for all 118 elements, fitted for every period at once.
+
+# 1. EXPERIMENTAL DATA (NIST first ionization energies, eV)
+# Z = 104..118 are theoretical estimates; MEASURED flags the experimental values.
+ELEMENTS = [
+    'H', 'He',
+    'Li', 'Be', 'B', 'C', 'N', 'O', 'F', 'Ne',
+    'Na', 'Mg', 'Al', 'Si', 'P', 'S', 'Cl', 'Ar',
+    'K', 'Ca', 'Sc', 'Ti', 'V', 'Cr', 'Mn', 'Fe', 'Co', 'Ni', 'Cu', 'Zn', 'Ga', 'Ge', 'As', 'Se', 'Br', 'Kr',
+    'Rb', 'Sr', 'Y', 'Zr', 'Nb', 'Mo', 'Tc', 'Ru', 'Rh', 'Pd', 'Ag', 'Cd', 'In', 'Sn', 'Sb', 'Te', 'I', 'Xe',
+    'Cs', 'Ba', 'La', 'Ce', 'Pr', 'Nd', 'Pm', 'Sm', 'Eu', 'Gd', 'Tb', 'Dy', 'Ho', 'Er', 'Tm', 'Yb',
+    'Lu', 'Hf', 'Ta', 'W', 'Re', 'Os', 'Ir', 'Pt', 'Au', 'Hg', 'Tl', 'Pb', 'Bi', 'Po', 'At', 'Rn',
+    'Fr', 'Ra', 'Ac', 'Th', 'Pa', 'U', 'Np', 'Pu', 'Am', 'Cm', 'Bk', 'Cf', 'Es', 'Fm', 'Md', 'No',
+    'Lr', 'Rf', 'Db', 'Sg', 'Bh', 'Hs', 'Mt', 'Ds', 'Rg', 'Cn', 'Nh', 'Fl', 'Mc', 'Lv', 'Ts', 'Og',
+]
+
+IONIZATION_ENERGY_EV = np.array([
+    13.598, 24.587,
+    5.392, 9.323, 8.298, 11.260, 14.534, 13.618, 17.422, 21.565,
+    5.139, 7.646, 5.986, 8.152, 10.487, 10.360, 12.968, 15.760,
+    4.341, 6.113, 6.561, 6.828, 6.746, 6.767, 7.434, 7.902, 7.881, 7.640, 7.726, 9.394,
+    5.999, 7.899, 9.789, 9.752, 11.814, 14.000,
+    4.177, 5.695, 6.217, 6.634, 6.759, 7.092, 7.28, 7.361, 7.459, 8.337, 7.576, 8.994,
+    5.786, 7.344, 8.608, 9.010, 10.451, 12.130,
+    3.894, 5.212, 5.577, 5.539, 5.473, 5.525, 5.582, 5.644, 5.670, 6.150, 5.864, 5.939, 6.022, 6.108, 6.184, 6.254,
+    5.426, 6.825, 7.550, 7.864, 7.834, 8.438, 8.967, 8.959, 9.226, 10.438,
+    6.108, 7.417, 7.286, 8.414, 9.318, 10.749,
+    4.073, 5.278, 5.380, 6.307, 5.89, 6.194, 6.266, 6.026, 5.974, 5.991, 6.198, 6.282, 6.368, 6.50, 6.58, 6.626,
+    4.96, 6.02, 6.8, 7.8, 7.7, 7.6, 8.7, 9.6, 10.6, 11.97,
+    7.306, 8.539, 5.579, 6.881, 7.7, 8.91,
+])
+
+MEASURED = np.arange(1, 119) <= 103
+
+# 2. GEOMETRIC SYMMETRY CLASSES
+# Outer-node packing states shared by every s/p shell (Period 2 naming),
+# then one class per d-node and f-node filling step.
+MAIN_GEOMETRIES = [
+    "Baseline Node", "Linear Dipole Lock", "Trigonal Buckle", "Planar Balance",
+    "Tetrahedral Lock", "Octahedral Fracture", "Gap Fill", "Boundary Lock",
+]
+D_GEOMETRIES = [f"d-Node Packing {i}" for i in range(1, 11)]
+F_GEOMETRIES = [f"f-Node Packing {i}" for i in range(1, 15)]
+GEOMETRIES = MAIN_GEOMETRIES + D_GEOMETRIES + F_GEOMETRIES
+
+# Block layout of each period (s, f, d, p), with La-Yb / Ac-No as the f rows
+PERIOD_LAYOUT = {
+    1: [("s", 2)],
+    2: [("s", 2), ("p", 6)],
+    3: [("s", 2), ("p", 6)],
+    4: [("s", 2), ("d", 10), ("p", 6)],
+    5: [("s", 2), ("d", 10), ("p", 6)],
+    6: [("s", 2), ("f", 14), ("d", 10), ("p", 6)],
+    7: [("s", 2), ("f", 14), ("d", 10), ("p", 6)],
+}
+
+
+def element_structure():
+    # Per-element period, position in the period (outer displacement nodes) and geometry class
+    period, position, geometry = [], [], []
+    for p, layout in PERIOD_LAYOUT.items():
+        k = 0
+        for block, size in layout:
+            for i in range(size):
+                k += 1
+                period.append(p)
+                position.append(k)
+                if block == "s":
+                    # Helium closes its shell: it packs like the noble Boundary Lock
+                    geometry.append(7 if (p == 1 and i == 1) else i)
+                elif block == "p":
+                    geometry.append(2 + i)
+                elif block == "d":
+                    geometry.append(len(MAIN_GEOMETRIES) + i)
+                else:
+                    geometry.append(len(MAIN_GEOMETRIES) + len(D_GEOMETRIES) + i)
+    return np.array(period), np.array(position), np.array(geometry)
+
+
+PERIOD, POSITION, GEOMETRY = element_structure()
+N_PERIODS = len(PERIOD_LAYOUT)
+
+
+# 3. BATCHED ALTERNATING LEAST SQUARES
+# IE = (anchor_p + gradient_p * (position - 1)) * tensor_g is bilinear: with the tensors fixed
+# every period is a 2-parameter weighted linear fit; with the baselines fixed every tensor has a
+# closed form. Both steps are evaluated for F weight vectors (fits/folds) at once.
+# Tensors are shared by every period, so each geometry class is fitted on several elements.
+# By default only the measured energies (Z <= 103) carry weight; Z = 104..118 are estimates.
+def fit_packing_model(weights=None, iterations=300, ridge=1e-9):
+    y = IONIZATION_ENERGY_EV
+    weights = MEASURED.astype(np.float64) if weights is None else np.asarray(weights, dtype=np.float64)
+    single = weights.ndim == 1
+    W = np.atleast_2d(weights)
+    F = W.shape[0]
+
+    groups, n_groups = GEOMETRY, len(GEOMETRIES)
+    p = PERIOD - 1
+    step = (POSITION - 1).astype(np.float64)
+
+    # Flat (fold, period) and (fold, group) indices for bincount reductions
+    fold = np.arange(F)[:, None]
+    fp_index = (fold * N_PERIODS + p[None, :]).ravel()
+    fg_index = (fold * n_groups + groups[None, :]).ravel()
+
+    def per_period(values):
+        return np.bincount(fp_index, weights=values.ravel(), minlength=F * N_PERIODS).reshape(F, N_PERIODS)
+
+    def per_group(values):
+        return np.bincount(fg_index, weights=values.ravel(), minlength=F * n_groups).reshape(F, n_groups)
+
+    tensors = np.ones((F, n_groups))
+    for _ in range(iterations):
+        # Baseline step: per (fold, period) 2x2 weighted normal equations
+        x = tensors[:, groups]
+        u, v = x, x * step
+        suu, suv, svv = per_period(W * u * u) + ridge, per_period(W * u * v), per_period(W * v * v) + ridge
+        suy, svy = per_period(W * u * y), per_period(W * v * y)
+        det = suu * svv - suv**2
+        anchor = (svv * suy - suv * svy) / det
+        gradient = (suu * svy - suv * suy) / det
+
+        # Tensor step: closed-form weighted projection of the data on each baseline
+        baseline = anchor[:, p] + gradient[:, p] * step
+        numerator, denominator = per_group(W * baseline * y), per_group(W * baseline**2)
+        tensors = np.where(denominator > 0, numerator / np.where(denominator > 0, denominator, 1), tensors)
+
+        # Scale normalisation: the Baseline Node tensor is pinned to 1.00
+        ref = tensors[:, :1]
+        ref = np.where(np.abs(ref) > 0, ref, 1)
+        tensors = tensors / ref
+        anchor = anchor * ref
+        gradient = gradient * ref
+
+    prediction = (anchor[:, p] + gradient[:, p] * step) * tensors[:, groups]
+    fit = {
+        "anchor_tension": anchor,
+        "pressure_gradient": gradient,
+        "packing_tensors": tensors,
+        "prediction": prediction,
+    }
+    if single:
+        fit = {key: value[0] for key, value in fit.items()}
+    return fit
+
+
+def degrees_of_freedom(weights=None):
+    # Data points minus fitted parameters: 2 per period plus one tensor per geometry class
+    # in use (less the pinned Baseline Node). A period with period_dof <= 0 is saturated:
+    # its anchor and gradient reproduce its elements exactly and its fit error says nothing.
+    weights = MEASURED.astype(np.float64) if weights is None else np.asarray(weights, dtype=np.float64)
+    used = weights > 0
+    period_points = np.bincount(PERIOD[used] - 1, minlength=N_PERIODS)
+    group_points = np.bincount(GEOMETRY[used], minlength=len(GEOMETRIES))
+    n_parameters = 2 * N_PERIODS + np.count_nonzero(group_points[1:])
+    return {
+        "n_points": int(used.sum()),
+        "n_parameters": int(n_parameters),
+        "dof": int(used.sum() - n_parameters),
+        "period_points": period_points,
+        "period_dof": period_points - 2,
+        "group_points": group_points,
+    }
+
+
+def cross_validatable(elements, weights=None):
+    # An element can be held out only if the remaining data still determine everything its
+    # prediction uses: at least 2 other points in its period (anchor + gradient) and, unless it
+    # is a pinned Baseline Node, at least one other element of its geometry class
+    dof = degrees_of_freedom(weights)
+    elements = np.asarray(elements)
+    period_left = dof["period_points"][PERIOD[elements] - 1] - 1
+    group_left = dof["group_points"][GEOMETRY[elements]] - 1
+    return (period_left >= 2) & ((GEOMETRY[elements] == 0) | (group_left >= 1))
+
+
+def leave_one_out(iterations=300, elements=None):
+    # Every fold refits the full model without one measured element. All folds are stacked
+    # along the weight axis and solved together in one vectorized ALS run. Elements whose
+    # fold would be saturated are not held out; they are reported under "skipped".
+    candidates = np.flatnonzero(MEASURED) if elements is None else np.asarray(elements)
+    valid = cross_validatable(candidates)
+    held_out, skipped = candidates[valid], candidates[~valid]
+    weights = np.tile(MEASURED.astype(np.float64), (held_out.size, 1))
+    weights[np.arange(held_out.size), held_out] = 0
+    folds = fit_packing_model(weights, iterations)
+
+    predicted = folds["prediction"][np.arange(held_out.size), held_out]
+    error = predicted - IONIZATION_ENERGY_EV[held_out]
+    return {
+        "elements": held_out,
+        "skipped": skipped,
+        "predicted": predicted,
+        "error": error,
+        "mae": float(np.mean(np.abs(error))) if error.size else float("nan"),
+        "rmse": float(np.sqrt(np.mean(error**2))) if error.size else float("nan"),
+    }
+
+
+# 4. SINGLE-PERIOD PRESENTATION (shared by the Period 2 / Period 3 validation scripts)
+def period_slice(period):
+    return np.nonzero(PERIOD == period)[0]
+
+
+@functools.lru_cache(maxsize=None)
+def _measured_fit():
+    # The default fit is shared by every period script; solved once per process
+    return fit_packing_model()
+
+
+def fitted_period_parameters(period):
+    # Anchor, gradient and per-element tensors of one period, taken from the single
+    # 118-element fit (tensors are shared across periods, not tuned to this one)
+    fit = _measured_fit()
+    idx = period_slice(period)
+    return {
+        "anchor_tension": float(fit["anchor_tension"][period - 1]),
+        "pressure_gradient": float(fit["pressure_gradient"][period - 1]),
+        "packing_tensors": fit["packing_tensors"][GEOMETRY[idx]].copy(),
+    }
+
+
+def compute_period_packing_trend(period, anchor_tension, pressure_gradient, packing_tensors,
+                                 geometries, title, annotations=(), corr_note="", reference=None):
+    # Pure computation: everything the table and the figure need, as plain picklable data.
+    # `reference` optionally holds another parameter set (e.g. hand-tuned values) that is
+    # evaluated on the same elements and reported alongside.
+    idx = period_slice(period)
+    outer_nodes = POSITION[idx]
+    real_ie = IONIZATION_ENERGY_EV[idx]
+
+    ie_baseline = anchor_tension + (pressure_gradient * (outer_nodes - 1))
+    ie_ppt_pred = ie_baseline * np.asarray(packing_tensors)
+
+    data = {
+        "elements": [ELEMENTS[i] for i in idx],
+        "outer_nodes": outer_nodes,
+        "geometries": list(geometries),
+        "real_ie": real_ie,
+        "ie_baseline": ie_baseline,
+        "ie_ppt_pred": ie_ppt_pred,
+        "corr": np.corrcoef(real_ie, ie_ppt_pred)[0,1],
+        "mae": np.mean(np.abs(ie_ppt_pred - real_ie)),
+        "corr_note": corr_note,
+        "title": title,
+        "annotations": list(annotations),
+        "anchor_tension": anchor_tension,
+        "pressure_gradient": pressure_gradient,
+        "packing_tensors": np.asarray(packing_tensors, dtype=np.float64),
+    }
+    if reference is not None:
+        reference_pred = ((reference["anchor_tension"] + reference["pressure_gradient"] * (outer_nodes - 1))
+                          * np.asarray(reference["packing_tensors"]))
+        data["reference_pred"] = reference_pred
+        data["reference_mae"] = np.mean(np.abs(reference_pred - real_ie))
+    return data
+
+
+def period_packing_results(data):
+    # One ValidationResult per element of a compute_period_packing_trend() table
+    from Validation_Result import ValidationResult
+
+    return [ValidationResult(None, element, predicted, real, "eV",
+                             {"anchor_tension": data["anchor_tension"], "pressure_gradient": data["pressure_gradient"],
+                              "outer_nodes": int(nodes), "packing_tensor": float(tensor)})
+            for element, nodes, tensor, predicted, real in zip(data["elements"], data["outer_nodes"],
+                                                               data["packing_tensors"], data["ie_ppt_pred"],
+                                                               data["real_ie"])]
+
+
+def print_period_packing_table(data):
+    # TERMINAL OUTPUT TABLE (with a hand-tuned reference column when one was evaluated)
+    reference = data.get("reference_pred")
+    extra = "   | Hand (eV)" if reference is not None else ""
+    print(f"\nElement | Nodes | PPT Geometric State      | PPT (eV) | NIST (eV) | Diff{extra}")
+    print("-" * (72 + len(extra)))
+    for i, (el, n, geo, p, r) in enumerate(zip(data["elements"], data["outer_nodes"], data["geometries"],
+                                               data["ie_ppt_pred"], data["real_ie"])):
+        row = f"{el:7} | {n:5} | {geo:24} | {p:8.3f} | {r:9.3f} | {p - r:+5.3f}"
+        if reference is not None:
+            row += f" | {reference[i]:9.3f}"
+        print(row)
+
+    print(f"\nStatistical Correlation: {data['corr']:.4f}{data['corr_note']}")
+    print(f"Mean Absolute Error:     {data['mae']:.3f} eV")
+    if reference is not None:
+        print(f"Hand-tuned MAE:          {data['reference_mae']:.3f} eV (reference only)")
+
+
+def render_period_packing_trend(data):
+    import matplotlib.pyplot as plt
+
+    elements = data["elements"]
+    ie_ppt_pred = data["ie_ppt_pred"]
+
+    # HIGH-VISIBILITY VISUAL PROOF
+    fig = plt.figure(figsize=(11, 6.5))
+
+    # Gold markers for NIST
+    plt.plot(elements, data["real_ie"], color='#FFD700', marker='o', linestyle='-',
+             linewidth=3, markersize=10, label='Observed Reality (NIST)',
+             markeredgecolor='white', markeredgewidth=1, zorder=3)
+
+    # Cyan markers for PPT
+    plt.plot(elements, ie_ppt_pred, color='#00FFFF', marker='^', linestyle='--',
+             linewidth=2, markersize=10, label='PPT 3.0 Harmonic Packing',
+             markeredgecolor='white', markeredgewidth=1, zorder=4)
+
+    # Grey dotted line for baseline gradient
+    plt.plot(elements, data["ie_baseline"], color='grey', linestyle=':',
+             linewidth=1.5, label='Raw Pressure Gradient (No Geometry)', zorder=2)
+
+    # Styling
+    plt.title(data["title"], fontsize=14, pad=20)
+    plt.xlabel('Element (Number of Outer Displacement Nodes)', fontsize=12)
+    plt.ylabel('Shear Tension Required for Ionization (eV)', fontsize=12)
+
+    # Annotations mapping the "orbital" anomalies to geometric fractures
+    bbox_props = dict(boxstyle="round,pad=0.3", fc="white", ec="black", lw=1, alpha=0.8)
+    for text, element, offset in data["annotations"]:
+        plt.annotate(text, xy=(element, ie_ppt_pred[elements.index(element)]), xytext=offset,
+                     textcoords='offset points', arrowprops=dict(arrowstyle="->", color='#00FFFF'),
+                     bbox=bbox_props)
+
+    plt.legend(frameon=True, facecolor='white', framealpha=0.9, loc='upper left')
+    plt.grid(True, linestyle='--', alpha=0.3)
+    plt.tight_layout()
+    return fig
+
+
+def run_periodic_model():
+    print("--- PPT - Atoms: PPT 3.0: Periodic Harmonic Packing Model (All 118 Elements) ---")
+
+    fit = fit_packing_model()
+    dof = degrees_of_freedom()
+    loo = leave_one_out()
+    error = fit["prediction"] - IONIZATION_ENERGY_EV
+
+    print(f"\nFit on {dof['n_points']} measured energies (Z <= 103), {dof['n_parameters']} parameters, "
+          f"{dof['dof']} degrees of freedom:")
+    print(f"{'Period':<6} | {'Points':<6} | {'DoF':<3} | {'Anchor (eV)':<11} | {'Gradient (eV)':<13} | {'Fit MAE (eV)':<12}")
+    print("-" * 66)
+    for p in range(1, N_PERIODS + 1):
+        idx = period_slice(p)
+        idx = idx[MEASURED[idx]]
+        period_dof = dof["period_dof"][p - 1]
+        mae = f"{np.mean(np.abs(error[idx])):<12.3f}" if period_dof > 0 else "saturated"
+        print(f"{p:<6} | {dof['period_points'][p - 1]:<6} | {period_dof:<3} | {fit['anchor_tension'][p - 1]:<11.3f} | "
+              f"{fit['pressure_gradient'][p - 1]:<13.3f} | {mae}")
+    print(f"Fit MAE (unsaturated periods): {np.mean(np.abs(error[MEASURED & (dof['period_dof'][PERIOD - 1] > 0)])):.3f} eV")
+    print(f"Estimate MAE (Z = 104..118, not fitted): {np.mean(np.abs(error[~MEASURED])):.3f} eV")
+
+    skipped = ", ".join(ELEMENTS[i] for i in loo["skipped"])
+    print(f"Leave-One-Out MAE / RMSE:    {loo['mae']:.3f} / {loo['rmse']:.3f} eV "
+          f"({loo['elements'].size} elements; not cross-validatable: {skipped or 'none'})")
+
+    print("\nShared Main-Group Packing Tensors:")
+    for name, tensor in zip(MAIN_GEOMETRIES, fit["packing_tensors"]):
+        print(f"   {name:<20}: {tensor:.3f}")
+    return fit
+
+
+if __name__ == "__main__":
+    run_periodic_model()
@@ -1,11 +1,14 @@
 import math
 
+from Validation_Result import ValidationResult, validation
+
 # PPT-Atoms Validation Suite v1.0.0
 # Script: Proton_Radius_Hydrostatic_Solver.py
 # Author: Vladimir Milosevic
 # Theory: Plasma Pressure Theory (PPT) 3.0
 # Description: Solves the Proton Radius Puzzle using fluid-dynamic hydrostatic compression derived from orbiter mass.
 
+@validation
 def solve_proton_radius():
     print("--- PPT - Atoms: PPT 3.0: The Proton Radius Hydrostatic Solver ---")
 
@@ -58,5 +61,9 @@ def solve_proton_radius():
     if error < 0.005:
         print("PUZZLE SOLVED: Standard mass perfectly dictates hydrostatic volume compression.")
 
+    return ValidationResult(None, "Muonic Proton Radius", r_muon_squeezed, real_muon_radius, "fm",
+                            {"r_measured_electron": r_measured_electron, "m_proton": m_proton,
+                             "m_electron": m_electron, "m_muon": m_muon})
+
 if __name__ == "__main__":
     solve_proton_radius()
\ No newline at end of file
@@ -1,5 +1,6 @@
 import numpy as np
-import matplotlib.pyplot as plt
+
+from Validation_Result import ValidationResult, validation
 
 # PPT-Atoms Validation Suite v1.0.0
 # Script: Relativistic_Mass_Hydrostatic_Bow_Shock_Final.py
@@ -7,13 +8,11 @@ import matplotlib.pyplot as plt
 # Theory: Plasma Pressure Theory (PPT) 3.0
 # Description: Maps relativistic mass increase to fluid-dynamic bow-shock compression.
 
-def calculate_bow_shock_displacement():
-    print("--- PPT - Atoms: PPT 3.0: Hydrostatic Bow Shock (Relativistic Mass) Solver ---")
-    
+def compute_bow_shock_displacement(n_points=1000):
     # 1. GENERATE VELOCITY RANGE
-    # We use a high resolution (1000 points) to capture the curve near c.
+    # We use a high resolution (1000 points by default) to capture the curve near c.
     # np.clip ensures we never hit exactly 1.0, avoiding division by zero.
-    v_raw = np.linspace(0, 0.999, 1000)
+    v_raw = np.linspace(0, 0.999, n_points)
     mach_numbers = np.clip(v_raw, 0, 1 - 1e-15) 
     
     # 2. THE STANDARD MODEL (Lorentz Transformation)
@@ -23,26 +22,23 @@ def calculate_bow_shock_displacement():
     # In PPT, 'c' is the wave-speed limit of the medium.
     # Mass increase is re-defined as added displacement volume from leading-edge compression.
     prandtl_glauert_factors = 1 / np.sqrt(1 - (mach_numbers**2))
-    
-    # --- TERMINAL VALIDATION OUTPUT ---
-    print("\nVelocity (v/c) | Standard Lorentz (γ) | PPT Prandtl-Glauert | Difference")
-    print("-" * 76)
-    
-    test_points = [0.1, 0.5, 0.8, 0.9, 0.95, 0.99]
-    for v in test_points:
-        # Find the index closest to our test velocity
-        idx = np.abs(mach_numbers - v).argmin()
-        lor = lorentz_factors[idx]
-        pg = prandtl_glauert_factors[idx]
-        print(f"{v:<14.2f} | {lor:<20.5f} | {pg:<19.5f} | {abs(lor-pg):.5f}")
 
-    print("\nMechanical Conclusion:")
-    print("Relativistic mass increase is a fluid-dynamic compressibility effect.")
-    print("The Lorentz Factor and the Prandtl-Glauert Factor are mathematically")
-    print("identical when c is treated as the medium's wave-propagation limit.")
+    return {
+        "mach_numbers": mach_numbers,
+        "lorentz_factors": lorentz_factors,
+        "prandtl_glauert_factors": prandtl_glauert_factors,
+    }
+
+
+def render_bow_shock_displacement(data):
+    import matplotlib.pyplot as plt
+
+    mach_numbers = data["mach_numbers"]
+    lorentz_factors = data["lorentz_factors"]
+    prandtl_glauert_factors = data["prandtl_glauert_factors"]
 
     # --- HIGH-VISIBILITY VISUAL PROOF ---
-    plt.figure(figsize=(11, 6.5))
+    fig = plt.figure(figsize=(11, 6.5))
     
     # Observed Reality / Lorentz (Gold)
     plt.plot(mach_numbers, lorentz_factors, color='#FFD700', linestyle='-', 
@@ -67,7 +63,45 @@ def calculate_bow_shock_displacement():
     plt.legend(frameon=True, facecolor='white', framealpha=0.9, loc='upper left')
     plt.grid(True, linestyle='--', alpha=0.3)
     plt.tight_layout()
-    plt.show()
+    return fig
+
+
+@validation
+def calculate_bow_shock_displacement(plot=True):
+    print("--- PPT - Atoms: PPT 3.0: Hydrostatic Bow Shock (Relativistic Mass) Solver ---")
+
+    data = compute_bow_shock_displacement()
+    mach_numbers = data["mach_numbers"]
+    lorentz_factors = data["lorentz_factors"]
+    prandtl_glauert_factors = data["prandtl_glauert_factors"]
+    
+    # --- TERMINAL VALIDATION OUTPUT ---
+    print("\nVelocity (v/c) | Standard Lorentz (γ) | PPT Prandtl-Glauert | Difference")
+    print("-" * 76)
+    
+    test_points = [0.1, 0.5, 0.8, 0.9, 0.95, 0.99]
+    results = []
+    for v in test_points:
+        # Find the index closest to our test velocity
+        idx = np.abs(mach_numbers - v).argmin()
+        lor = lorentz_factors[idx]
+        pg = prandtl_glauert_factors[idx]
+        print(f"{v:<14.2f} | {lor:<20.5f} | {pg:<19.5f} | {abs(lor-pg):.5f}")
+        # Reference is the Lorentz factor, prediction the Prandtl-Glauert factor
+        results.append(ValidationResult(None, f"{v:.2f}", pg, lor, "gamma", {"v_over_c": float(mach_numbers[idx])}))
+
+    print("\nMechanical Conclusion:")
+    print("Relativistic mass increase is a fluid-dynamic compressibility effect.")
+    print("The Lorentz Factor and the Prandtl-Glauert Factor are mathematically")
+    print("identical when c is treated as the medium's wave-propagation limit.")
+
+    if plot:
+        import matplotlib.pyplot as plt
+
+        render_bow_shock_displacement(data)
+        plt.show()
+
+    return results
 
 if __name__ == "__main__":
     calculate_bow_shock_displacement()
\ No newline at end of file
@@ -0,0 +1,259 @@
+import ast
+import functools
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import sqlite3
+import sys
+import time
+
+import numpy as np
+
+# PPT-Atoms Validation Suite v1.0.0
+# Module: Result_Cache.py
+# Author: Vladimir Milosevic
+# Theory: Plasma Pressure Theory (PPT) 3.0
+# Description: Content-addressed on-disk cache (SQLite index + object files) for solver results and figures, with LRU size eviction.
+
+DEFAULT_CACHE_DIR = ".ppt_cache"
+DEFAULT_MAX_BYTES = 512 * 2**20
+
+# Bumped whenever the stored layout or the key recipe changes
+CACHE_FORMAT = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key       TEXT PRIMARY KEY,
+    label     TEXT,
+    payload   TEXT NOT NULL,
+    size      INTEGER NOT NULL,
+    created   REAL NOT NULL,
+    accessed  REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS artifacts (
+    key     TEXT NOT NULL REFERENCES entries(key) ON DELETE CASCADE,
+    name    TEXT NOT NULL,
+    digest  TEXT NOT NULL,
+    PRIMARY KEY (key, name)
+);
+CREATE INDEX IF NOT EXISTS entries_accessed ON entries(accessed);
+"""
+
+
+# 1. CACHE KEYS
+def local_dependencies(path):
+    # The script plus every sibling module it imports (recursively): editing a shared
+    # model such as Periodic_Harmonic_Packing_Model.py invalidates every script built on it
+    directory = os.path.dirname(os.path.abspath(path))
+    seen, stack = [], [os.path.abspath(path)]
+    while stack:
+        current = stack.pop()
+        if current in seen:
+            continue
+        seen.append(current)
+        with open(current, "rb") as handle:
+            tree = ast.parse(handle.read(), filename=current)
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+                names = [node.module]
+            else:
+                continue
+            for name in names:
+                candidate = os.path.join(directory, name.split(".")[0] + ".py")
+                if os.path.isfile(candidate):
+                    stack.append(candidate)
+    return sorted(seen)
+
+
+def _canonical(value):
+    # JSON-stable form of solver parameters (NumPy scalars/arrays included)
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in sorted(value.items(), key=lambda item: str(item[0]))}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    if isinstance(value, np.ndarray):
+        return {"dtype": str(value.dtype), "shape": list(value.shape),
+                "sha256": hashlib.sha256(np.ascontiguousarray(value).tobytes()).hexdigest()}
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def cache_key(source_paths, params=None):
+    # sha256 over the source of every file involved, the input parameters and the
+    # interpreter/NumPy versions that produced the numbers
+    digest = hashlib.sha256()
+    digest.update(f"ppt-cache/{CACHE_FORMAT}/py{sys.version_info[0]}.{sys.version_info[1]}/np{np.__version__}".encode())
+    for path in sorted(source_paths):
+        with open(path, "rb") as handle:
+            digest.update(os.path.basename(path).encode() + b"\0" + handle.read() + b"\0")
+    digest.update(json.dumps(_canonical(params or {}), sort_keys=True, default=repr).encode())
+    return digest.hexdigest()
+
+
+def solver_key(path, params=None):
+    return cache_key(local_dependencies(path), params)
+
+
+# 2. STORE
+class ResultCache:
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = os.path.abspath(directory)
+        self.max_bytes = int(max_bytes)
+        os.makedirs(os.path.join(self.directory, "objects"), exist_ok=True)
+        self._db = sqlite3.connect(os.path.join(self.directory, "index.sqlite"), timeout=30)
+        self._db.execute("PRAGMA foreign_keys = ON")
+        self._db.executescript(_SCHEMA)
+
+    def close(self):
+        self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _object_path(self, digest):
+        return os.path.join(self.directory, "objects", digest[:2], digest)
+
+    def _put_object(self, source_path):
+        # Content-addressed: identical figures from different entries are stored once
+        digest = hashlib.sha256()
+        with open(source_path, "rb") as handle:
+            for block in iter(lambda: handle.read(2**20), b""):
+                digest.update(block)
+        digest = digest.hexdigest()
+        target = self._object_path(digest)
+        if not os.path.exists(target):
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            tmp = f"{target}.{os.getpid()}.tmp"
+            shutil.copyfile(source_path, tmp)
+            os.replace(tmp, target)
+        return digest, os.path.getsize(target)
+
+    def get(self, key, restore_dir=None):
+        # Payload (decoded JSON) or None; artifacts are copied into restore_dir on a hit
+        row = self._db.execute("SELECT payload FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        artifacts = self._db.execute("SELECT name, digest FROM artifacts WHERE key = ?", (key,)).fetchall()
+        if any(not os.path.exists(self._object_path(digest)) for _, digest in artifacts):
+            # An object file was removed behind the index's back: treat as a miss
+            self.delete(key)
+            return None
+        if restore_dir is not None:
+            os.makedirs(restore_dir, exist_ok=True)
+            for name, digest in artifacts:
+                shutil.copyfile(self._object_path(digest), os.path.join(restore_dir, name))
+        with self._db:
+            self._db.execute("UPDATE entries SET accessed = ? WHERE key = ?", (time.time(), key))
+        return json.loads(row[0])
+
+    def put(self, key, payload, artifacts=(), label=None):
+        # artifacts: paths of files (figures) produced for this entry, restored by basename
+        encoded = json.dumps(payload)
+        stored = [(os.path.basename(path),) + self._put_object(path) for path in artifacts]
+        size = len(encoded) + sum(nbytes for _, _, nbytes in stored)
+        now = time.time()
+        with self._db:
+            self._db.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self._db.execute("INSERT INTO entries VALUES (?, ?, ?, ?, ?, ?)",
+                             (key, label, encoded, size, now, now))
+            self._db.executemany("INSERT INTO artifacts VALUES (?, ?, ?)",
+                                 [(key, name, digest) for name, digest, _ in stored])
+        self.evict()
+
+    def delete(self, key):
+        with self._db:
+            self._db.execute("DELETE FROM entries WHERE key = ?", (key,))
+        self._collect_objects()
+
+    def total_bytes(self):
+        return self._db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+
+    def evict(self, max_bytes=None):
+        # Least-recently-used entries go first until the cache fits its size budget
+        max_bytes = self.max_bytes if max_bytes is None else max_bytes
+        total = self.total_bytes()
+        if total <= max_bytes:
+            return 0
+        evicted = 0
+        with self._db:
+            for key, size in self._db.execute("SELECT key, size FROM entries ORDER BY accessed").fetchall():
+                if total <= max_bytes:
+                    break
+                self._db.execute("DELETE FROM entries WHERE key = ?", (key,))
+                total -= size
+                evicted += 1
+        self._collect_objects()
+        return evicted
+
+    def _collect_objects(self):
+        live = {digest for (digest,) in self._db.execute("SELECT DISTINCT digest FROM artifacts")}
+        objects = os.path.join(self.directory, "objects")
+        for prefix in os.listdir(objects):
+            for name in os.listdir(os.path.join(objects, prefix)):
+                if name not in live and not name.endswith(".tmp"):
+                    os.remove(os.path.join(objects, prefix, name))
+
+    def clear(self):
+        with self._db:
+            self._db.execute("DELETE FROM entries")
+        self._collect_objects()
+
+    def stats(self):
+        n_entries, size = self._db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+        return {"entries": n_entries, "bytes": size, "max_bytes": self.max_bytes}
+
+
+# 3. FUNCTION MEMOIZATION
+def cached(directory=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+    # Memoizes a pure solver function on disk, keyed on its module source (and local
+    # imports) plus its arguments. Return values must be picklable.
+    def decorate(function):
+        source = getattr(sys.modules[function.__module__], "__file__", None)
+        # Interactive definitions have no file: their bytecode stands in for the source
+        sources = local_dependencies(source) if source else []
+        bytecode = None if source else function.__code__.co_code.hex()
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            key = cache_key(sources, {"function": function.__qualname__, "bytecode": bytecode,
+                                      "args": list(args), "kwargs": kwargs})
+            with ResultCache(directory, max_bytes) as cache:
+                hit = cache.get(key)
+                if hit is not None:
+                    return pickle.loads(bytes.fromhex(hit["pickle"]))
+                value = function(*args, **kwargs)
+                cache.put(key, {"pickle": pickle.dumps(value).hex()}, label=function.__qualname__)
+            return value
+
+        return wrapper
+
+    return decorate
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Inspect or clear the PPT-Atoms result cache.")
+    parser.add_argument("--cache", default=DEFAULT_CACHE_DIR, help="Cache directory")
+    parser.add_argument("--clear", action="store_true", help="Remove every cached entry")
+    args = parser.parse_args(argv)
+
+    with ResultCache(args.cache) as cache:
+        if args.clear:
+            cache.clear()
+        stats = cache.stats()
+    print(f"{args.cache}: {stats['entries']} entries, {stats['bytes'] / 2**20:.1f} MiB "
+          f"(limit {stats['max_bytes'] / 2**20:.0f} MiB)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
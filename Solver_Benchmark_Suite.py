@@ -0,0 +1,256 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import time
+
+import numpy as np
+
+# PPT-Atoms Validation Suite v1.0.0
+# Module: Solver_Benchmark_Suite.py
+# Author: Vladimir Milosevic
+# Theory: Plasma Pressure Theory (PPT) 3.0
+# Description: Times every solver's compute path separately from its plotting at several problem sizes and flags regressions against a stored baseline.
+
+DEFAULT_HISTORY = "benchmark_history.json"
+
+# Relative slowdown versus the baseline that counts as a regression (0.25 = 25 % slower)
+DEFAULT_THRESHOLD = 0.25
+
+# Minimum measured time per repeat; fast solvers are looped until they reach it
+MIN_SAMPLE_TIME = 0.05
+
+
+# 1. BENCHMARK CASES
+# Each factory takes a problem size and returns {stage: zero-argument callable}.
+# Inputs are prepared inside the factory so that only the solver itself is timed.
+def _silenced(function, *args, **kwargs):
+    # The validation scripts print their tables; benchmarks time the arithmetic only
+    def run():
+        with contextlib.redirect_stdout(io.StringIO()):
+            return function(*args, **kwargs)
+    return run
+
+
+def _drawn(render, *args):
+    # A render stage is only complete once Agg has rasterized the figure
+    def run():
+        import matplotlib.pyplot as plt
+        fig = render(*args) or plt.gcf()
+        fig.canvas.draw()
+        plt.close(fig)
+    return run
+
+
+def carbon12_case(size):
+    if size == 1:
+        from Carbon12_Alpha_Cluster_Solver import solve_carbon12_binding
+        return {"compute": _silenced(solve_carbon12_binding)}
+    from Parameter_Sweep_Engine import carbon12_evaluator
+    params = {"alpha_bond_overlap": np.linspace(0.0010, 0.0020, size)}
+    return {"compute": lambda: carbon12_evaluator(params)}
+
+
+def alpha_lattice_case(size):
+    # size = number of alpha clusters; beyond Ca-40 (10) they form an fcc ball of alpha matter
+    from Alpha_Cluster_Lattice_Solver import alpha_geometry, cluster_binding_energy, lattice_cluster
+    positions = alpha_geometry(size) if size <= 10 else lattice_cluster(size)
+    return {"compute": lambda: cluster_binding_energy(positions)}
+
+
+def island_case(size):
+    # size = Z_max of the (Z, N) tension grid (N_max = 5/3 Z_max, as in the solver)
+    from Flerovium_Island_of_Stability_Solver import (
+        compute_tension_surface,
+        render_tension_surface,
+        solve_island_of_stability,
+    )
+    n_max = size * 5 // 3
+    stages = {
+        "compute": lambda: compute_tension_surface(size, n_max),
+        "render": _drawn(render_tension_surface, compute_tension_surface(size, n_max)),
+    }
+    if size == 300:
+        stages["script"] = _silenced(solve_island_of_stability)
+    return stages
+
+
+def bond_angle_case(size):
+    from Molecular_Bond_Angle_Trend_Solver import (
+        calculate_ppt_angle,
+        compute_molecular_trend,
+        predict_angles,
+        render_molecular_trend,
+    )
+    if size == 3:
+        return {
+            "compute": lambda: [calculate_ppt_angle(name, m, n) for name, m, n in
+                                (("CH4", 12.011, 4), ("NH3", 14.007, 3), ("H2O", 15.999, 2))],
+            "render": _drawn(render_molecular_trend, compute_molecular_trend()),
+        }
+    rng = np.random.default_rng(size)
+    m_central = rng.uniform(10, 20, size)
+    nodes = rng.integers(2, 5, size)
+    return {"compute": lambda: predict_angles(m_central, nodes)}
+
+
+def cleavage_case(size):
+    from Fasifiable_Cleavage_And_Alpha_Decay import (
+        compute_decay_density,
+        compute_decay_topology,
+        render_decay_density,
+        render_decay_topology,
+        simulate_emission_histogram,
+    )
+    stages = {
+        "compute": lambda: compute_decay_topology(size, seed=2026),
+        "histogram": lambda: simulate_emission_histogram(size, "ppt", seed=2026),
+        "render_density": _drawn(render_decay_density, compute_decay_density(size, seed=2026)),
+    }
+    # Scatter rendering grows with the event count; beyond 10^5 points it is the problem being fixed
+    if size <= 10**5:
+        stages["render"] = _drawn(render_decay_topology, compute_decay_topology(size, seed=2026))
+    return stages
+
+
+def bow_shock_case(size):
+    from Relativistic_Mass_Hydrostatic_Bow_Shock import (
+        compute_bow_shock_displacement,
+        render_bow_shock_displacement,
+    )
+    return {
+        "compute": lambda: compute_bow_shock_displacement(size),
+        "render": _drawn(render_bow_shock_displacement, compute_bow_shock_displacement(size)),
+    }
+
+
+# name: (case factory, problem sizes, --quick sizes)
+BENCHMARKS = {
+    "carbon12_binding":     (carbon12_case,   [1, 10**4, 10**6],      [1, 10**4]),
+    "alpha_lattice":        (alpha_lattice_case, [10, 10**4, 10**5],    [10]),
+    "island_of_stability":  (island_case,     [300, 1200, 4800],      [300]),
+    "ppt_bond_angle":       (bond_angle_case, [3, 10**4, 10**6],      [3, 10**4]),
+    "cleavage_monte_carlo": (cleavage_case,   [10**3, 10**5, 10**6],  [10**3]),
+    "bow_shock_grid":       (bow_shock_case,  [10**3, 10**5, 10**6],  [10**3]),
+}
+
+
+# 2. TIMING
+def time_callable(function, repeat=5, min_time=MIN_SAMPLE_TIME):
+    # Best per-call time over `repeat` samples; each sample loops until it lasts min_time
+    start = time.perf_counter()
+    function()
+    single = time.perf_counter() - start
+    number = max(1, int(min_time / single)) if single > 0 else 1000
+    repeat = repeat if single * number * repeat < 10 else 1
+
+    best = single
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def run_benchmarks(names=None, quick=False, repeat=5):
+    # {"case[size]/stage": seconds}
+    results = {}
+    for name, (factory, sizes, quick_sizes) in BENCHMARKS.items():
+        if names and name not in names:
+            continue
+        for size in (quick_sizes if quick else sizes):
+            for stage, function in factory(size).items():
+                results[f"{name}[{size}]/{stage}"] = time_callable(function, repeat)
+    return results
+
+
+# 3. HISTORY AND REGRESSIONS
+def load_history(path):
+    if not os.path.exists(path):
+        return {"baseline": {}, "runs": []}
+    with open(path, encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def save_history(history, path):
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as handle:
+        json.dump(history, handle, indent=2)
+    os.replace(tmp, path)
+
+
+def compare_to_baseline(results, baseline, threshold=DEFAULT_THRESHOLD):
+    # Per benchmark: baseline, current, ratio and whether it regressed beyond the threshold
+    comparison = {}
+    for key, seconds in results.items():
+        reference = baseline.get(key)
+        ratio = seconds / reference if reference else None
+        comparison[key] = {
+            "baseline_s": reference,
+            "current_s": seconds,
+            "ratio": ratio,
+            "regression": ratio is not None and ratio > 1 + threshold,
+        }
+    return comparison
+
+
+def record_run(history, results, set_baseline=False):
+    history["runs"].append({
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.platform(),
+        "results": results,
+    })
+    # Benchmarks missing from the baseline (new cases or sizes) are adopted as they appear
+    for key, seconds in results.items():
+        if set_baseline or key not in history["baseline"]:
+            history["baseline"][key] = seconds
+    return history
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the PPT-Atoms solvers and flag regressions.")
+    parser.add_argument("benchmarks", nargs="*", help=f"Benchmarks to run (default: all of {', '.join(BENCHMARKS)})")
+    parser.add_argument("--history", default=DEFAULT_HISTORY, help="JSON history file")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Relative slowdown flagged as a regression (default: 0.25)")
+    parser.add_argument("--quick", action="store_true", help="Smallest problem sizes only")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing samples per benchmark")
+    parser.add_argument("--set-baseline", action="store_true", help="Store this run as the new baseline")
+    args = parser.parse_args(argv)
+    unknown = set(args.benchmarks) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f"unknown benchmark(s): {', '.join(sorted(unknown))}")
+
+    # Render stages are timed offscreen, whatever backend the user has configured
+    os.environ["MPLBACKEND"] = "Agg"
+    import matplotlib
+    matplotlib.use("Agg")
+
+    print("--- PPT - Atoms: PPT 3.0: Solver Benchmark Suite ---")
+    history = load_history(args.history)
+    results = run_benchmarks(args.benchmarks, args.quick, args.repeat)
+    comparison = compare_to_baseline(results, history["baseline"], args.threshold)
+
+    print(f"\n{'Benchmark':<48} | {'Time':>10} | {'Baseline':>10} | {'Ratio':>6}")
+    print("-" * 84)
+    for key, row in comparison.items():
+        baseline = f"{row['baseline_s'] * 1e3:8.3f}ms" if row["baseline_s"] else "-"
+        ratio = f"{row['ratio']:.2f}" if row["ratio"] else "-"
+        flag = "  << REGRESSION" if row["regression"] else ""
+        print(f"{key:<48} | {row['current_s'] * 1e3:8.3f}ms | {baseline:>10} | {ratio:>6}{flag}")
+
+    save_history(record_run(history, results, args.set_baseline), args.history)
+    regressions = [key for key, row in comparison.items() if row["regression"]]
+    print(f"\n{len(results)} benchmarks, {len(regressions)} regression(s) beyond "
+          f"{args.threshold:.0%}; history appended to {args.history}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,137 @@
+import numpy as np
+
+from Spectral_Transitions_Harmonic_Solver import (
+    E_GROUND_H,
+    HC_EV_NM,
+    load_transition_catalog,
+    transition_catalog,
+)
+
+# PPT-Atoms Validation Suite v1.0.0
+# Module: Spectral_Line_Matcher.py
+# Author: Vladimir Milosevic
+# Theory: Plasma Pressure Theory (PPT) 3.0
+# Description: Batch nearest-line matching of observed spectrograph line lists against the harmonic transition catalog.
+
+# Observed lines matched per batch
+DEFAULT_CHUNK_SIZE = 2**20
+
+
+def build_line_index(n_max=200, charges=(1,), E_base=E_GROUND_H):
+    # In-memory index: the energy-sorted catalog doubles as a (reversed) wavelength index
+    return transition_catalog(n_max, charges, E_base)
+
+
+def load_line_index(directory):
+    # Memory-mapped index from write_transition_catalog: binary search touches only
+    # O(log n) pages, so multi-billion-line catalogs never need to fit in RAM
+    catalog, _ = load_transition_catalog(directory)
+    return catalog
+
+
+def load_line_list(path, column=0):
+    # Observed line positions (nm), one per row of a text/CSV file
+    return np.atleast_1d(np.loadtxt(path, delimiter=',' if path.endswith('.csv') else None,
+                                    usecols=column, ndmin=1, comments='#'))
+
+
+def _match_chunk(index, observed_nm, tolerance_nm):
+    energy = index["energy_eV"]
+    n_lines = energy.shape[0]
+
+    # The catalog is sorted by energy, i.e. by descending wavelength: search in energy space
+    observed_energy = HC_EV_NM / observed_nm
+    right = np.searchsorted(energy, observed_energy, side='left')
+    left = right - 1
+
+    # The nearest line in wavelength is one of the two catalog lines bracketing the observation
+    left_c = np.clip(left, 0, n_lines - 1)
+    right_c = np.clip(right, 0, n_lines - 1)
+    residual_left = observed_nm - HC_EV_NM / np.asarray(energy[left_c])
+    residual_right = observed_nm - HC_EV_NM / np.asarray(energy[right_c])
+    residual_left[left < 0] = np.inf
+    residual_right[right >= n_lines] = np.inf
+
+    take_right = np.abs(residual_right) < np.abs(residual_left)
+    best = np.where(take_right, right_c, left_c)
+    residual = np.where(take_right, residual_right, residual_left)
+    matched = np.abs(residual) <= tolerance_nm
+
+    return best, residual, matched
+
+
+def match_lines(index, observed_nm, tolerance_nm=0.05, chunk_size=DEFAULT_CHUNK_SIZE):
+    # For every observed line: the nearest catalog transition (n_low, n_high, Z) and its
+    # residual (observed - predicted, nm). Lines outside the tolerance get index -1 / NaN.
+    observed_nm = np.asarray(observed_nm, dtype=np.float64)
+    tolerance_nm = np.broadcast_to(np.asarray(tolerance_nm, dtype=np.float64), observed_nm.shape)
+
+    n = observed_nm.size
+    result = {
+        "observed_nm": observed_nm,
+        "n_low": np.full(n, -1, dtype=np.int32),
+        "n_high": np.full(n, -1, dtype=np.int32),
+        "charge": np.full(n, -1, dtype=np.int32),
+        "residual_nm": np.full(n, np.nan),
+        "matched": np.zeros(n, dtype=bool),
+    }
+
+    for start in range(0, n, chunk_size):
+        window = slice(start, start + chunk_size)
+        best, residual, matched = _match_chunk(index, observed_nm[window], tolerance_nm[window])
+        hits = best[matched]
+        offset = np.nonzero(matched)[0] + start
+        result["n_low"][offset] = index["n_low"][hits]
+        result["n_high"][offset] = index["n_high"][hits]
+        result["charge"][offset] = index["charge"][hits]
+        result["residual_nm"][offset] = residual[matched]
+        result["matched"][window] = matched
+
+    return result
+
+
+def match_statistics(result):
+    matched = result["matched"]
+    residual = result["residual_nm"][matched]
+    return {
+        "n_observed": int(matched.size),
+        "n_matched": int(matched.sum()),
+        "match_fraction": float(matched.mean()) if matched.size else 0.0,
+        "mean_residual_nm": float(residual.mean()) if residual.size else float("nan"),
+        "rms_residual_nm": float(np.sqrt(np.mean(residual**2))) if residual.size else float("nan"),
+    }
+
+
+def run_line_matching():
+    print("--- PPT - Atoms: PPT 3.0: Harmonic Line Matcher (Observed Spectra) ---")
+
+    index = build_line_index(n_max=30, charges=(1, 2))
+
+    # Vacuum wavelengths (nm) of well-known H I and He II lines
+    observed = {
+        "H Lyman-Alpha": 121.567,
+        "H Lyman-Beta": 102.572,
+        "H Balmer-Alpha": 656.461,
+        "H Balmer-Beta": 486.264,
+        "He II 30.4 nm": 30.378,
+        "He II 468.6 nm": 468.702,
+    }
+
+    result = match_lines(index, np.array(list(observed.values())), tolerance_nm=1.0)
+
+    print(f"\n{'Observed Line':<16} | {'Obs (nm)':<9} | {'n_low':<5} | {'n_high':<6} | {'Z':<2} | {'Residual (nm)':<13}")
+    print("-" * 68)
+    for i, name in enumerate(observed):
+        if result["matched"][i]:
+            print(f"{name:<16} | {result['observed_nm'][i]:<9.3f} | {result['n_low'][i]:<5} | "
+                  f"{result['n_high'][i]:<6} | {result['charge'][i]:<2} | {result['residual_nm'][i]:+.4f}")
+        else:
+            print(f"{name:<16} | {result['observed_nm'][i]:<9.3f} | {'-':<5} | {'-':<6} | {'-':<2} | unmatched")
+
+    stats = match_statistics(result)
+    print(f"\nMatched {stats['n_matched']}/{stats['n_observed']} lines, RMS residual {stats['rms_residual_nm']:.4f} nm")
+    return result
+
+
+if __name__ == "__main__":
+    run_line_matching()
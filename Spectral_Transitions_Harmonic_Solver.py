@@ -1,11 +1,254 @@
+import json
+import os
+
 import numpy as np
 
+from Validation_Result import ValidationResult, validation
+
 # PPT-Atoms Validation Suite v1.0.0
 # Script: Spectral_Transitions_Harmonic_Solver.py
 # Author: Vladimir Milosevic
 # Theory: Plasma Pressure Theory (PPT) 3.0
 # Description: Calculates hydrogen spectral lines as harmonic pressure node transitions.
 
+# Ground state pinning pressure equivalent (eV)
+# This represents the maximum structural tension at the n=1 boundary
+E_GROUND_H = 13.605
+
+# Photon energy <-> vacuum wavelength conversion (eV * nm)
+HC_EV_NM = 1239.84198
+
+# Catalog columns written to disk: sorted float64 energies/wavelengths plus int32 indices
+CATALOG_COLUMNS = {
+    "energy_eV": np.float64,
+    "wavelength_nm": np.float64,
+    "n_low": np.int32,
+    "n_high": np.int32,
+    "charge": np.int32,
+}
+
+
+def transition_energy(n_low, n_high, E_base=E_GROUND_H, Z=1):
+    # Calculates the tension difference between two specific harmonic pressure boundaries.
+    # Hydrogen-like ions scale the pinning tension by the square of the core charge.
+    # Broadcasts over arrays; pairs with n_high <= n_low release no tension.
+    n_low = np.asarray(n_low, dtype=np.float64)
+    n_high = np.asarray(n_high, dtype=np.float64)
+    delta = (1 / n_low**2) - (1 / n_high**2)
+    energy = E_base * np.asarray(Z, dtype=np.float64)**2 * delta
+    energy = np.where(n_high > n_low, energy, 0.0)
+    return energy if energy.ndim else float(energy)
+
+
+def transition_wavelength(energy_eV):
+    # Vacuum wavelength (nm) of the released tension
+    return HC_EV_NM / np.asarray(energy_eV, dtype=np.float64)
+
+
+# --- TRANSITION CATALOG (every n_low < n_high <= n_max pair) ---
+def upper_triangle_block(row_start, row_stop, n_max):
+    # All (n_low, n_high) pairs for n_low in [row_start, row_stop) without a Python loop
+    rows = np.arange(row_start, row_stop, dtype=np.int64)
+    lengths = n_max - rows
+    starts = np.cumsum(lengths) - lengths
+    n_low = np.repeat(rows, lengths)
+    n_high = np.arange(lengths.sum(), dtype=np.int64) - np.repeat(starts, lengths) + np.repeat(rows + 1, lengths)
+    return n_low.astype(np.int32), n_high.astype(np.int32)
+
+
+def iter_catalog_blocks(n_max, charges=(1,), block_pairs=2**24):
+    # Row ranges of the upper triangle holding at most ~block_pairs pairs each
+    rows = np.arange(1, n_max, dtype=np.int64)
+    cumulative = np.cumsum(n_max - rows)
+    for Z in charges:
+        row_start = 1
+        while row_start < n_max:
+            done = cumulative[row_start - 2] if row_start > 1 else 0
+            row_stop = int(np.searchsorted(cumulative, done + block_pairs, side='right')) + 1
+            row_stop = min(max(row_stop, row_start + 1), n_max)
+            n_low, n_high = upper_triangle_block(row_start, row_stop, n_max)
+            yield int(Z), n_low, n_high
+            row_start = row_stop
+
+
+def catalog_size(n_max, charges=(1,)):
+    return len(charges) * n_max * (n_max - 1) // 2
+
+
+def transition_catalog(n_max, charges=(1,), E_base=E_GROUND_H):
+    # In-memory catalog for moderate n_max, sorted by energy
+    parts = []
+    for Z, n_low, n_high in iter_catalog_blocks(n_max, charges):
+        parts.append((transition_energy(n_low, n_high, E_base, Z), n_low, n_high,
+                      np.full(n_low.size, Z, dtype=np.int32)))
+    energy, n_low, n_high, charge = (np.concatenate(column) for column in zip(*parts))
+    order = np.argsort(energy, kind='stable')
+    energy = energy[order]
+    return {
+        "energy_eV": energy,
+        "wavelength_nm": transition_wavelength(energy),
+        "n_low": n_low[order],
+        "n_high": n_high[order],
+        "charge": charge[order],
+    }
+
+
+def _log_energy_bins(energy, log_min, bin_width, n_bins):
+    bins = ((np.log(energy) - log_min) / bin_width).astype(np.int64)
+    return np.clip(bins, 0, n_bins - 1)
+
+
+def write_transition_catalog(directory, n_max, charges=(1,), E_base=E_GROUND_H,
+                             block_pairs=2**24, bucket_pairs=2**26, n_fine_bins=2**20):
+    # Streams a sorted catalog to <directory>/<column>.npy without materialising it in RAM.
+    # External distribution sort in three passes over upper-triangular blocks:
+    #   1. histogram every block's energies into fine log-energy bins
+    #   2. scatter each block into contiguous energy buckets of the memory-mapped output
+    #   3. sort every bucket in place (buckets are already in energy order)
+    os.makedirs(directory, exist_ok=True)
+    total = catalog_size(n_max, charges)
+
+    Z_min, Z_max = min(charges), max(charges)
+    e_min = E_base * Z_min**2 * (1 / (n_max - 1)**2 - 1 / n_max**2)
+    e_max = E_base * Z_max**2
+    log_min = np.log(e_min)
+    bin_width = (np.log(e_max) - log_min) / n_fine_bins * (1 + 1e-12)
+
+    # Pass 1: fine histogram
+    fine_counts = np.zeros(n_fine_bins, dtype=np.int64)
+    for Z, n_low, n_high in iter_catalog_blocks(n_max, charges, block_pairs):
+        energy = transition_energy(n_low, n_high, E_base, Z)
+        fine_counts += np.bincount(_log_energy_bins(energy, log_min, bin_width, n_fine_bins),
+                                   minlength=n_fine_bins)
+
+    # Merge adjacent fine bins into buckets of at most ~bucket_pairs entries
+    cumulative = np.cumsum(fine_counts)
+    fine_to_bucket = np.unique((cumulative - fine_counts) // bucket_pairs, return_inverse=True)[1].astype(np.int64)
+    n_buckets = int(fine_to_bucket.max()) + 1
+    bucket_sizes = np.bincount(fine_to_bucket, weights=fine_counts, minlength=n_buckets).astype(np.int64)
+    bucket_offsets = np.cumsum(bucket_sizes) - bucket_sizes
+
+    columns = {
+        name: np.lib.format.open_memmap(os.path.join(directory, f"{name}.npy"), mode='w+',
+                                        dtype=dtype, shape=(total,))
+        for name, dtype in CATALOG_COLUMNS.items()
+    }
+
+    # Pass 2: scatter every block into its buckets
+    cursor = np.zeros(n_buckets, dtype=np.int64)
+    for Z, n_low, n_high in iter_catalog_blocks(n_max, charges, block_pairs):
+        energy = transition_energy(n_low, n_high, E_base, Z)
+        bucket = fine_to_bucket[_log_energy_bins(energy, log_min, bin_width, n_fine_bins)]
+        order = np.argsort(bucket, kind='stable')
+        bucket = bucket[order]
+        counts = np.bincount(bucket, minlength=n_buckets)
+        first = np.cumsum(counts) - counts
+        positions = bucket_offsets[bucket] + cursor[bucket] + (np.arange(bucket.size) - first[bucket])
+        cursor += counts
+
+        columns["energy_eV"][positions] = energy[order]
+        columns["n_low"][positions] = n_low[order]
+        columns["n_high"][positions] = n_high[order]
+        columns["charge"][positions] = Z
+
+    # Pass 3: sort each bucket in place and derive its wavelengths
+    for offset, size in zip(bucket_offsets, bucket_sizes):
+        if size == 0:
+            continue
+        window = slice(int(offset), int(offset + size))
+        order = np.argsort(columns["energy_eV"][window], kind='stable')
+        for name in ("energy_eV", "n_low", "n_high", "charge"):
+            columns[name][window] = np.asarray(columns[name][window])[order]
+        columns["wavelength_nm"][window] = transition_wavelength(columns["energy_eV"][window])
+
+    for column in columns.values():
+        column.flush()
+
+    meta = {"n_max": int(n_max), "charges": [int(Z) for Z in charges], "E_base": float(E_base),
+            "n_transitions": int(total), "sorted_by": "energy_eV"}
+    with open(os.path.join(directory, "catalog.json"), "w", encoding="utf-8") as handle:
+        json.dump(meta, handle, indent=2)
+    return meta
+
+
+def load_transition_catalog(directory, mmap_mode='r'):
+    # Memory-mapped view of a catalog written by write_transition_catalog
+    with open(os.path.join(directory, "catalog.json"), encoding="utf-8") as handle:
+        meta = json.load(handle)
+    catalog = {name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode=mmap_mode)
+               for name in CATALOG_COLUMNS}
+    return catalog, meta
+
+
+# --- SYNTHETIC SPECTRUM (FFT line broadening) ---
+C_KM_S = 299792.458
+
+# Lines binned onto the grid per batch
+SPECTRUM_CHUNK_SIZE = 2**22
+
+
+def log_wavelength_grid(lambda_min_nm, lambda_max_nm, resolution_kms=1.0):
+    # Uniform in ln(lambda): a Doppler width (constant in velocity) is then one fixed kernel
+    d_ln = resolution_kms / C_KM_S
+    n_points = int(np.ceil(np.log(lambda_max_nm / lambda_min_nm) / d_ln)) + 1
+    return lambda_min_nm * np.exp(np.arange(n_points) * d_ln), d_ln
+
+
+def voigt_kernel_transform(n_fft, d_ln, doppler_kms, lorentz_kms):
+    # Fourier transform of a unit-area Voigt profile on the velocity axis:
+    # Gaussian (sigma = doppler) times Lorentzian (HWHM = lorentz) -- no Faddeeva function needed
+    frequency = np.fft.rfftfreq(n_fft, d=d_ln * C_KM_S)  # cycles per km/s
+    gaussian = np.exp(-2 * np.pi**2 * doppler_kms**2 * frequency**2)
+    lorentzian = np.exp(-2 * np.pi * lorentz_kms * np.abs(frequency))
+    return gaussian * lorentzian
+
+
+def bin_line_strengths(grid_size, lambda_min_nm, d_ln, wavelength_nm, strengths):
+    # Linear (cloud-in-cell) deposit of each line onto the two nearest grid points
+    position = np.log(np.asarray(wavelength_nm, dtype=np.float64) / lambda_min_nm) / d_ln
+    inside = (position >= 0) & (position <= grid_size - 1)
+    position, strengths = position[inside], np.asarray(strengths, dtype=np.float64)[inside]
+    lower = np.minimum(position.astype(np.int64), grid_size - 2)
+    frac = position - lower
+    binned = np.bincount(lower, weights=strengths * (1 - frac), minlength=grid_size)
+    binned += np.bincount(lower + 1, weights=strengths * frac, minlength=grid_size)
+    return binned[:grid_size]
+
+
+def synthesize_spectrum(wavelength_nm, strengths=None, lambda_min_nm=90.0, lambda_max_nm=2000.0,
+                        resolution_kms=1.0, doppler_kms=10.0, lorentz_kms=0.0,
+                        chunk_size=SPECTRUM_CHUNK_SIZE):
+    # Binned line strengths convolved with one Voigt kernel by FFT:
+    # O(L) binning + O(G log G) convolution, independent of how many lines share a pixel.
+    grid, d_ln = log_wavelength_grid(lambda_min_nm, lambda_max_nm, resolution_kms)
+    n_lines = len(wavelength_nm)
+    binned = np.zeros(grid.size)
+    for start in range(0, n_lines, chunk_size):
+        window = slice(start, start + chunk_size)
+        chunk_strengths = np.ones(len(wavelength_nm[window])) if strengths is None else strengths[window]
+        binned += bin_line_strengths(grid.size, lambda_min_nm, d_ln, wavelength_nm[window], chunk_strengths)
+
+    # Zero-pad to a power of two at least twice the grid to keep wrap-around off the band
+    n_fft = 1 << int(np.ceil(np.log2(2 * grid.size)))
+    kernel = voigt_kernel_transform(n_fft, d_ln, doppler_kms, lorentz_kms)
+    spectrum = np.fft.irfft(np.fft.rfft(binned, n_fft) * kernel, n_fft)[:grid.size]
+
+    # Per-pixel flux density: unit-strength lines integrate to 1 over ln(lambda)
+    return grid, spectrum / d_ln
+
+
+def synthesize_catalog_spectrum(catalog, lambda_min_nm=90.0, lambda_max_nm=2000.0, strengths=None, **kwargs):
+    # The catalog is energy-sorted, so the requested band is one contiguous slice:
+    # only those lines are read from a memory-mapped catalog
+    energy = catalog["energy_eV"]
+    lo = np.searchsorted(energy, HC_EV_NM / lambda_max_nm, side='left')
+    hi = np.searchsorted(energy, HC_EV_NM / lambda_min_nm, side='right')
+    band_strengths = None if strengths is None else strengths[lo:hi]
+    return synthesize_spectrum(catalog["wavelength_nm"][lo:hi], band_strengths,
+                               lambda_min_nm, lambda_max_nm, **kwargs)
+
+
+@validation
 def calculate_harmonic_transition():
     print("--- PPT - Atoms: PPT 3.0: Harmonic Node Transition Solver (Hydrogen) ---")
     
@@ -26,13 +269,7 @@ def calculate_harmonic_transition():
     print(f"   PPT Predicted Energy: {E_lyman_alpha:.3f} eV")
     print("   Experimental Value:   10.20 eV")
     
-    # 2. GENERAL TRANSITION FUNCTION
-    def transition_energy(n_low, n_high, E_base):
-        # Calculates the tension difference between two specific harmonic pressure boundaries
-        if n_high > n_low:
-            return E_base * ((1 / n_low**2) - (1 / n_high**2))
-        return 0
-
+    # 2. GENERAL TRANSITION FUNCTION (module-level transition_energy)
     print("\n2. General Series Validation (Tension Release Matrix):")
     
     # Lyman Beta (n=3 -> n=1)
@@ -43,5 +280,12 @@ def calculate_harmonic_transition():
     e_balmer_alpha = transition_energy(2, 3, E_ground_H)
     print(f"   n=3 -> n=2 (Balmer-Alpha):  {e_balmer_alpha:.2f} eV  (Exp:  1.89 eV)")
 
+    parameters = {"E_ground_H": E_ground_H}
+    return [
+        ValidationResult(None, "Lyman-Alpha", E_lyman_alpha, 10.20, "eV", parameters),
+        ValidationResult(None, "n=3 -> n=1 (Lyman-Beta)", e_lyman_beta, 12.09, "eV", parameters),
+        ValidationResult(None, "n=3 -> n=2 (Balmer-Alpha)", e_balmer_alpha, 1.89, "eV", parameters),
+    ]
+
 if __name__ == "__main__":
-    calculate_harmonic_transition()
\ No newline at end of file
+    calculate_harmonic_transition()
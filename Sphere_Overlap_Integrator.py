@@ -0,0 +1,228 @@
+import functools
+
+import numpy as np
+
+from Alpha_Cluster_Lattice_Solver import neighbour_pairs
+from Nuclide_Chart_Binding_Engine import COMPRESSION_HE4, R_NUCLEON
+
+# PPT-Atoms Validation Suite v1.0.0
+# Module: Sphere_Overlap_Integrator.py
+# Author: Vladimir Milosevic
+# Theory: Plasma Pressure Theory (PPT) 3.0
+# Description: Union / overlap volume of arbitrary nucleon-sphere arrangements: closed-form lenses when only pairs overlap, adaptive voxel integration otherwise, memoized per geometry.
+
+DEFAULT_RTOL = 1e-4
+
+# Cells per axis of the coarsest voxel grid, and the deepest octree refinement
+BASE_CELLS = 8
+MAX_DEPTH = 8
+
+# Cells x spheres distance blocks are evaluated in chunks of this many cells
+CHUNK_CELLS = 2**15
+
+
+# 1. CLOSED FORM
+def sphere_volume(radii):
+    return (4/3) * np.pi * np.asarray(radii, dtype=np.float64)**3
+
+
+def lens_volume(distance, r1, r2):
+    # Intersection of two spheres (radii r1, r2) whose centres are d apart
+    d = np.asarray(distance, dtype=np.float64)
+    r1 = np.asarray(r1, dtype=np.float64)
+    r2 = np.asarray(r2, dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        lens = np.pi * (r1 + r2 - d)**2 * (d**2 + 2 * d * (r1 + r2) - 3 * (r1 - r2)**2) / (12 * d)
+    contained = sphere_volume(np.minimum(r1, r2))
+    return np.where(d >= r1 + r2, 0.0, np.where(d <= np.abs(r1 - r2), contained, lens))
+
+
+def overlapping_pairs(centers, radii):
+    i, j, distance = neighbour_pairs(centers, 2 * float(np.max(radii)))
+    touching = distance < radii[i] + radii[j]
+    return i[touching], j[touching], distance[touching]
+
+
+def _triple_overlap(centers, radii, i, j):
+    # True when some point lies inside three spheres, i.e. inclusion-exclusion over
+    # pairs is no longer exact. Exact for equal radii (three balls of radius R share a
+    # point iff the smallest circle enclosing their centres has radius <= R); with
+    # unequal radii any three mutually overlapping spheres count as a triple overlap.
+    neighbours = [set() for _ in range(len(centers))]
+    for a, b in zip(i.tolist(), j.tolist()):
+        neighbours[a].add(b)
+        neighbours[b].add(a)
+    equal = np.allclose(radii, radii[0])
+    for a, b in zip(i.tolist(), j.tolist()):
+        for c in neighbours[a] & neighbours[b]:
+            if c <= b:
+                continue
+            if not equal:
+                return True
+            if _enclosing_radius(centers[[a, b, c]]) < radii[0]:
+                return True
+    return False
+
+
+def _enclosing_radius(triangle):
+    # Smallest enclosing circle of three points: half the longest side for a right or
+    # obtuse triangle, otherwise the circumradius
+    sides = np.linalg.norm(triangle - np.roll(triangle, 1, axis=0), axis=1)
+    longest = np.sort(sides)
+    if longest[2]**2 >= longest[0]**2 + longest[1]**2:
+        return longest[2] / 2
+    area = 0.5 * np.linalg.norm(np.cross(triangle[1] - triangle[0], triangle[2] - triangle[0]))
+    return np.prod(sides) / (4 * area)
+
+
+# 2. ADAPTIVE VOXEL INTEGRATION
+def _classify(cells, half, centers, radii):
+    # Deepest penetration of each cell centre into any sphere (r - d, negative outside all)
+    depth = np.empty(len(cells))
+    for start in range(0, len(cells), CHUNK_CELLS):
+        block = cells[start:start + CHUNK_CELLS]
+        delta = block[:, None, :] - centers[None, :, :]
+        distance = np.sqrt(np.einsum('ijk,ijk->ij', delta, delta))
+        depth[start:start + CHUNK_CELLS] = np.max(radii - distance, axis=1)
+    return depth
+
+
+_CHILD_OFFSETS = np.array([(x, y, z) for x in (-1, 1) for y in (-1, 1) for z in (-1, 1)], dtype=np.float64)
+
+
+def voxel_union_volume(centers, radii, rtol=DEFAULT_RTOL, base_cells=BASE_CELLS, max_depth=MAX_DEPTH):
+    # Octree over the bounding cube: cells fully inside a sphere are counted exactly, cells
+    # outside every sphere are dropped, and only boundary cells are split into 8 children.
+    # Boundary cells are estimated by treating the nearest sphere surface as a plane through
+    # the cell, which converges far faster than centre sampling; refinement stops when two
+    # successive estimates agree to rtol.
+    lo = np.min(centers - radii[:, None], axis=0)
+    hi = np.max(centers + radii[:, None], axis=0)
+    side = float(np.max(hi - lo))
+    half = side / (2 * base_cells)
+    axis = (np.arange(base_cells) + 0.5) * (2 * half)
+    gx, gy, gz = np.meshgrid(axis, axis, axis, indexing='ij')
+    cells = lo + np.column_stack((gx.ravel(), gy.ravel(), gz.ravel()))
+
+    covered, previous, estimate = 0.0, None, 0.0
+    for depth in range(max_depth + 1):
+        penetration = _classify(cells, half, centers, radii)
+        reach = half * np.sqrt(3)
+        cell_volume = (2 * half)**3
+        covered += np.count_nonzero(penetration >= reach) * cell_volume
+        boundary = np.abs(penetration) < reach
+        filled = np.clip(0.5 + penetration[boundary] / (2 * half), 0.0, 1.0)
+        estimate = covered + float(np.sum(filled)) * cell_volume
+        boundary_volume = np.count_nonzero(boundary) * cell_volume
+        if previous is not None and abs(estimate - previous) <= rtol * estimate:
+            break
+        if depth == max_depth:
+            break
+        previous = estimate
+        half /= 2
+        cells = (cells[boundary][:, None, :] + _CHILD_OFFSETS[None, :, :] * half).reshape(-1, 3)
+    return {"volume": estimate, "boundary": boundary_volume, "depth": depth}
+
+
+# 3. MEMOIZED UNION VOLUME
+def _geometry_key(centers, radii):
+    # Translation-invariant and order-invariant key: sphere rows sorted after centring
+    rows = np.column_stack((centers - centers.mean(axis=0), radii))
+    scale = float(np.max(radii))
+    rows = np.round(rows / scale, 12) + 0.0
+    rows = rows[np.lexsort(rows.T[::-1])]
+    return rows.tobytes(), len(rows), scale
+
+
+@functools.lru_cache(maxsize=4096)
+def _union_volume_cached(key, n_spheres, scale, rtol, method):
+    rows = np.frombuffer(key, dtype=np.float64).reshape(n_spheres, 4) * scale
+    centers, radii = rows[:, :3], rows[:, 3]
+    total = float(np.sum(sphere_volume(radii)))
+    i, j, distance = overlapping_pairs(centers, radii)
+    pairwise = float(np.sum(lens_volume(distance, radii[i], radii[j])))
+
+    if method == "auto":
+        method = "voxel" if _triple_overlap(centers, radii, i, j) else "lens"
+    if method == "lens":
+        return {"volume": total - pairwise, "method": "lens", "pairs": int(i.size), "boundary": 0.0}
+    voxel = voxel_union_volume(centers, radii, rtol)
+    return {"volume": voxel["volume"], "method": "voxel", "pairs": int(i.size),
+            "boundary": voxel["boundary"], "depth": voxel["depth"]}
+
+
+def union_volume(centers, radii, rtol=DEFAULT_RTOL, method="auto"):
+    # method: "auto" (lenses while only pairs overlap, voxels otherwise), "lens" or "voxel".
+    # Identical geometries (up to translation and sphere order) are computed once.
+    centers = np.atleast_2d(np.asarray(centers, dtype=np.float64))
+    radii = np.broadcast_to(np.asarray(radii, dtype=np.float64), (len(centers),))
+    key, n_spheres, scale = _geometry_key(centers, radii)
+    return dict(_union_volume_cached(key, n_spheres, scale, float(rtol), method))
+
+
+def overlap_fraction(centers, radii, rtol=DEFAULT_RTOL, method="auto"):
+    # Volume crushed out of the raw spheres: 1 - V_union / sum(V_i)
+    radii = np.broadcast_to(np.asarray(radii, dtype=np.float64), (len(np.atleast_2d(centers)),))
+    union = union_volume(centers, radii, rtol, method)
+    return 1 - union["volume"] / float(np.sum(sphere_volume(radii)))
+
+
+def cache_info():
+    return _union_volume_cached.cache_info()
+
+
+def clear_cache():
+    _union_volume_cached.cache_clear()
+
+
+# 4. THE HELIUM-4 PACKING FRACTION
+def tetrahedron_positions(edge):
+    return np.array([[1, 1, 1], [1, -1, -1], [-1, 1, -1], [-1, -1, 1]], dtype=np.float64) * edge / np.sqrt(8)
+
+
+def separation_for_fraction(target=COMPRESSION_HE4, r_nucleon=R_NUCLEON, iterations=60, rtol=DEFAULT_RTOL):
+    # Nucleon-nucleon distance of the He-4 tetrahedron whose overlap equals `target`.
+    # The overlap shrinks monotonically as the tetrahedron opens up, so bisection applies;
+    # every probe geometry is memoized, so repeated fits revisit them for free.
+    lo, hi = 0.0, 2 * r_nucleon
+    for _ in range(iterations):
+        mid = 0.5 * (lo + hi)
+        if overlap_fraction(tetrahedron_positions(mid), r_nucleon, rtol) > target:
+            lo = mid
+        else:
+            hi = mid
+    return 0.5 * (lo + hi)
+
+
+def run_overlap_derivation():
+    print("--- PPT - Atoms: PPT 3.0: Sphere Overlap Integrator (He-4 Packing Fraction) ---")
+
+    # 1. SEPARATION THAT REPRODUCES Phi_ppt
+    separation = separation_for_fraction()
+    tetrahedron = tetrahedron_positions(separation)
+    union = union_volume(tetrahedron, R_NUCLEON)
+    print(f"1. Nucleon Radius:                 {R_NUCLEON * 1e15:.4f} fm")
+    print(f"2. Tetrahedral Separation (2.223%): {separation * 1e15:.4f} fm = {separation / R_NUCLEON:.4f} r_n")
+    print(f"3. Overlap Method:                 {union['method']} ({union['pairs']} pairwise lenses)")
+    print(f"   Three-sphere overlaps begin below sqrt(3) r_n = {np.sqrt(3):.4f} r_n")
+
+    # 2. CROSS-CHECK: closed form against voxel integration
+    voxel = overlap_fraction(tetrahedron, R_NUCLEON, method="voxel")
+    print(f"4. Lens Overlap Fraction:          {overlap_fraction(tetrahedron, R_NUCLEON) * 100:.4f}%")
+    print(f"5. Voxel Overlap Fraction:         {voxel * 100:.4f}%")
+
+    # 3. TIGHTER PACKINGS (three-sphere overlaps need the numerical integrator)
+    print(f"\n{'Separation (r_n)':<17} | {'Overlap':>9} | Method")
+    print("-" * 40)
+    for ratio in (1.9, 1.8, separation / R_NUCLEON, 1.7, 1.5, 1.2):
+        positions = tetrahedron_positions(ratio * R_NUCLEON)
+        result = union_volume(positions, R_NUCLEON)
+        fraction = overlap_fraction(positions, R_NUCLEON)
+        print(f"{ratio:<17.4f} | {fraction * 100:>8.4f}% | {result['method']}")
+
+    info = cache_info()
+    print(f"\nMemoized geometries: {info.currsize} ({info.hits} repeat queries served from memory)")
+
+
+if __name__ == "__main__":
+    run_overlap_derivation()
@@ -0,0 +1,278 @@
+import argparse
+import functools
+import importlib
+import inspect
+import json
+import os
+import re
+import sys
+import threading
+import time
+import tracemalloc
+
+# PPT-Atoms Validation Suite v1.0.0
+# Module: Stage_Profiler.py
+# Author: Vladimir Milosevic
+# Theory: Plasma Pressure Theory (PPT) 3.0
+# Description: Per-stage wall/CPU/tracemalloc instrumentation for the solvers, with automatic stages from their numbered comments and Chrome-trace export.
+
+# "# 1. THE UNIFIED CONSTANTS", "# --- 2. THE GEOMETRIC BASE ---", "# 3. EMPIRICAL TESTING"
+STAGE_COMMENT = re.compile(r"^\s*#\s*(?:-+\s*)?(\d+)\.\s+(.*?)\s*(?:-+)?\s*$")
+
+_state = threading.local()
+_ENABLED = False
+_MEMORY = False
+_RECORDS = []
+_LOCK = threading.Lock()
+
+
+# 1. SWITCHES
+def enable(memory=True):
+    # memory=True starts tracemalloc, which slows allocation-heavy code noticeably
+    global _ENABLED, _MEMORY
+    _ENABLED, _MEMORY = True, memory
+    if memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+
+def disable():
+    global _ENABLED
+    _ENABLED = False
+    if _MEMORY and tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+
+def is_enabled():
+    return _ENABLED
+
+
+def reset():
+    with _LOCK:
+        _RECORDS.clear()
+
+
+def records():
+    with _LOCK:
+        return list(_RECORDS)
+
+
+# 2. STAGE RECORDING
+def _stack():
+    stack = getattr(_state, "stack", None)
+    if stack is None:
+        stack = _state.stack = []
+    return stack
+
+
+def _open(name):
+    stack = _stack()
+    frame = {"name": name, "depth": len(stack)}
+    if _MEMORY and tracemalloc.is_tracing():
+        current, peak = tracemalloc.get_traced_memory()
+        # The peak counter is global: hand the parent what it has seen so far, then restart it
+        if stack:
+            stack[-1]["max_traced"] = max(stack[-1]["max_traced"], peak)
+        if hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+        frame["base_traced"] = frame["max_traced"] = current
+    frame["cpu_ns"] = time.process_time_ns()
+    frame["wall_ns"] = time.perf_counter_ns()
+    stack.append(frame)
+
+
+def _close():
+    wall_end = time.perf_counter_ns()
+    cpu_end = time.process_time_ns()
+    stack = _stack()
+    if not stack:
+        # Unbalanced close (e.g. after a failed _open): nothing to record
+        return None
+    frame = stack.pop()
+    peak_bytes = None
+    if "base_traced" in frame and tracemalloc.is_tracing():
+        frame["max_traced"] = max(frame["max_traced"], tracemalloc.get_traced_memory()[1])
+        peak_bytes = frame["max_traced"] - frame["base_traced"]
+        if stack:
+            stack[-1]["max_traced"] = max(stack[-1]["max_traced"], frame["max_traced"])
+    record = {
+        "name": frame["name"],
+        "depth": frame["depth"],
+        "start_ns": frame["wall_ns"],
+        "wall_s": (wall_end - frame["wall_ns"]) / 1e9,
+        "cpu_s": (cpu_end - frame["cpu_ns"]) / 1e9,
+        "peak_bytes": peak_bytes,
+        "thread": threading.get_ident(),
+    }
+    with _LOCK:
+        _RECORDS.append(record)
+    return record
+
+
+class _Stage:
+    __slots__ = ("name",)
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        _open(self.name)
+        return self
+
+    def __exit__(self, *exc_info):
+        _close()
+        return False
+
+
+class _NullStage:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+def stage(name):
+    # `with stage("2. THE GEOMETRIC BASE"):` -- a shared no-op object while profiling is off
+    return _Stage(name) if _ENABLED else _NULL_STAGE
+
+
+def profiled(name=None):
+    # Decorator form; disabled cost is one global check per call
+    def decorate(function):
+        label = name or function.__qualname__
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not _ENABLED:
+                return function(*args, **kwargs)
+            with _Stage(label):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+# 3. AUTOMATIC STAGES FROM NUMBERED COMMENTS
+def comment_stages(function):
+    # [(first source line, "N. TITLE"), ...] for every numbered stage comment in the function
+    lines, first = inspect.getsourcelines(function)
+    stages = []
+    for offset, line in enumerate(lines):
+        match = STAGE_COMMENT.match(line)
+        if match:
+            stages.append((first + offset, f"{match.group(1)}. {match.group(2)}"))
+    return stages
+
+
+def run_with_stages(function, *args, **kwargs):
+    # Runs an unmodified solver and opens/closes one stage per numbered comment block.
+    # Only line events of the solver's own frame are traced; everything it calls runs untraced.
+    if not _ENABLED:
+        return function(*args, **kwargs)
+
+    # Decorated solvers (e.g. Validation_Result.validation) are traced in their own body
+    target = inspect.unwrap(function)
+    code = target.__code__
+    boundaries = comment_stages(target)
+    starts = [line for line, _ in boundaries]
+    current = {"index": None}
+
+    def local_trace(frame, event, arg):
+        if event == "line":
+            index = None
+            for i, start in enumerate(starts):
+                if frame.f_lineno >= start:
+                    index = i
+            if index != current["index"]:
+                if current["index"] is not None:
+                    _close()
+                # Lines before the first numbered comment (e.g. a loop header wrapping the
+                # stages) belong to no stage: close the open one without starting another
+                if index is not None:
+                    _open(f"{function.__name__}: {boundaries[index][1]}")
+                current["index"] = index
+        return local_trace
+
+    def global_trace(frame, event, arg):
+        return local_trace if frame.f_code is code else None
+
+    previous = sys.gettrace()
+    with _Stage(function.__qualname__):
+        sys.settrace(global_trace)
+        try:
+            return function(*args, **kwargs)
+        finally:
+            sys.settrace(previous)
+            if current["index"] is not None:
+                _close()
+
+
+# 4. REPORTING
+def print_summary(stage_records=None):
+    # Records are appended as stages close; print them in start order so nesting reads top-down
+    print(f"{'Stage':<64} | {'Wall (ms)':>10} | {'CPU (ms)':>10} | {'Peak (KiB)':>10}")
+    print("-" * 104)
+    for record in sorted(stage_records or records(), key=lambda r: r["start_ns"]):
+        label = ("  " * record["depth"] + record["name"])[:64]
+        peak = f"{record['peak_bytes'] / 1024:10.1f}" if record["peak_bytes"] is not None else f"{'-':>10}"
+        print(f"{label:<64} | {record['wall_s'] * 1e3:10.3f} | {record['cpu_s'] * 1e3:10.3f} | {peak}")
+
+
+def chrome_trace(stage_records=None):
+    # Complete ("X") events, loadable in chrome://tracing or Perfetto
+    stage_records = stage_records or records()
+    origin = min((r["start_ns"] for r in stage_records), default=0)
+    events = []
+    for record in stage_records:
+        args = {"cpu_ms": record["cpu_s"] * 1e3}
+        if record["peak_bytes"] is not None:
+            args["peak_kib"] = record["peak_bytes"] / 1024
+        events.append({
+            "name": record["name"],
+            "cat": "stage",
+            "ph": "X",
+            "ts": (record["start_ns"] - origin) / 1e3,
+            "dur": record["wall_s"] * 1e6,
+            "pid": os.getpid(),
+            "tid": record["thread"],
+            "args": args,
+        })
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def export_chrome_trace(path, stage_records=None):
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(chrome_trace(stage_records), handle)
+    return path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Profile a solver stage by stage from its numbered comments.")
+    parser.add_argument("target", help="'module:function', e.g. Carbon12_Alpha_Cluster_Solver:solve_carbon12_binding")
+    parser.add_argument("-o", "--output", default="stage_trace.json", help="Chrome-trace JSON file")
+    parser.add_argument("--no-memory", action="store_true", help="Skip tracemalloc (lower overhead)")
+    args = parser.parse_args(argv)
+
+    module_name, _, attr = args.target.partition(":")
+    function = getattr(importlib.import_module(module_name), attr)
+
+    enable(memory=not args.no_memory)
+    try:
+        run_with_stages(function)
+    finally:
+        disable()
+
+    print("\n--- PPT - Atoms: PPT 3.0: Stage Profile ---")
+    print_summary()
+    print(f"\nChrome trace written to: {export_chrome_trace(args.output)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
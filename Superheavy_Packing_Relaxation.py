@@ -0,0 +1,288 @@
+import argparse
+import functools
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from Alpha_Cluster_Lattice_Solver import lens_volume, neighbour_pairs
+from Flerovium_Island_of_Stability_Solver import PHI_CONJUGATE
+from Nuclide_Chart_Binding_Engine import COMPRESSION_HE4, JOULES_TO_MEV, R_NUCLEON, UNIVERSAL_PRESSURE
+from Sphere_Overlap_Integrator import separation_for_fraction, tetrahedron_positions
+
+# PPT-Atoms Validation Suite v1.0.0
+# Module: Superheavy_Packing_Relaxation.py
+# Author: Vladimir Milosevic
+# Theory: Plasma Pressure Theory (PPT) 3.0
+# Description: Relaxes A nucleon spheres under the medium's external pressure against overlap repulsion (FIRE minimiser, cell-list forces) and scans (Z, N) candidates in a process pool.
+
+# Extra overlap stiffness of every proton in a contact: s_ij = 1 + PROTON_STIFFNESS * (q_i + q_j) / 2.
+# A free model parameter (not a fitted PPT constant); sweep it with --proton-stiffness.
+PROTON_STIFFNESS = 0.5
+
+# Neighbour lists hold pairs closer than 2 r + SKIN and are rebuilt once any sphere moves SKIN / 2
+SKIN = 0.3
+
+# Convergence: largest residual force (units of P r^2) and the FIRE step budget
+FORCE_TOLERANCE = 1e-5
+MAX_STEPS = 20000
+
+# FIRE minimiser (Bitzek et al. 2006) settings. A nucleon with ~8 contacts is a spring of
+# stiffness ~ 8 k pi d / 2 ~ 125 P r, so steps above ~0.15 start to oscillate.
+FIRE_DT = 0.02
+FIRE_DT_MAX = 0.1
+FIRE_N_MIN = 5
+FIRE_F_INC = 1.1
+FIRE_F_DEC = 0.5
+FIRE_ALPHA = 0.1
+FIRE_F_ALPHA = 0.99
+
+
+# 1. THE PACKING ENERGY (units: nucleon radius r = 1, medium pressure P = 1)
+# U = V_env + k * sum_ij s_ij * lens(d_ij)
+#   V_env: envelope the medium has to displace, a sphere of radius R = sqrt(5/3) * R_g
+#   lens:  pairwise overlap volume, dV/dd = -pi (4 r^2 - d^2) / 4
+def envelope_volume(positions):
+    centred = positions - positions.mean(axis=0)
+    radius = np.sqrt(5 / 3 * np.mean(np.einsum('ij,ij->i', centred, centred)))
+    return (4/3) * np.pi * radius**3, radius, centred
+
+
+def confinement_forces(positions):
+    # -dV_env/dx_i = -(20 pi / 3) R (x_i - c) / A: the medium pulls every nucleon inward
+    volume, radius, centred = envelope_volume(positions)
+    return -(20 * np.pi / 3) * radius * centred / len(positions), volume
+
+
+def overlap_forces(positions, i, j, pair_stiffness):
+    # Pairs are pushed apart by k s_ij pi (4 - d^2) / 4 along their axis while they overlap
+    delta = positions[i] - positions[j]
+    distance = np.sqrt(np.einsum('ij,ij->i', delta, delta))
+    touching = distance < 2
+    i, j, delta, distance = i[touching], j[touching], delta[touching], distance[touching]
+    stiffness = pair_stiffness[touching] if np.ndim(pair_stiffness) else pair_stiffness
+    magnitude = stiffness * np.pi * (4 - distance**2) / 4
+    pair_force = (magnitude / distance)[:, None] * delta
+    forces = np.empty_like(positions)
+    for axis in range(3):
+        forces[:, axis] = (np.bincount(i, pair_force[:, axis], minlength=len(positions))
+                           - np.bincount(j, pair_force[:, axis], minlength=len(positions)))
+    lens = lens_volume(distance, 1.0)
+    return forces, float(np.sum(stiffness * lens)), float(np.sum(lens)), int(distance.size)
+
+
+@functools.lru_cache(maxsize=None)
+def calibrate_stiffness(target=COMPRESSION_HE4):
+    # Overlap stiffness k at which the pressure-balanced He-4 tetrahedron holds exactly the
+    # Phi_ppt overlap (separation from Sphere_Overlap_Integrator). Forces are linear in k,
+    # so one radial force balance on a vertex fixes it. Protons play no role here.
+    positions = tetrahedron_positions(separation_for_fraction(target, 1.0))
+    i, j, _ = neighbour_pairs(positions, 2.0)
+    repulsion = overlap_forces(positions, i, j, 1.0)[0]
+    confinement = confinement_forces(positions)[0]
+    radial = positions[0] / np.linalg.norm(positions[0])
+    return float(-(confinement[0] @ radial) / (repulsion[0] @ radial))
+
+
+# 2. INITIAL PACKING
+def initial_packing(Z, N, seed=0):
+    # A uniform random ball at nucleon density 1 (heavily overlapping, so relaxation only
+    # expands) with protons on randomly chosen spheres
+    rng = np.random.default_rng(seed)
+    A = Z + N
+    direction = rng.normal(size=(A, 3))
+    direction /= np.linalg.norm(direction, axis=1)[:, None]
+    radius = A ** (1 / 3) * rng.random(A) ** (1 / 3)
+    charge = np.zeros(A)
+    charge[rng.permutation(A)[:Z]] = 1.0
+    return direction * radius[:, None], charge
+
+
+# 3. FIRE RELAXATION
+def relax_packing(positions, charge, stiffness=None, proton_stiffness=PROTON_STIFFNESS,
+                  force_tolerance=FORCE_TOLERANCE, max_steps=MAX_STEPS):
+    # Minimises U with FIRE: velocity-Verlet steps whose velocity is mixed toward the force
+    # and zeroed whenever it runs uphill. Forces come from a Verlet-skin cell list.
+    k = calibrate_stiffness() if stiffness is None else stiffness
+    x = np.array(positions, dtype=np.float64)
+    v = np.zeros_like(x)
+    dt, alpha, uphill_free = FIRE_DT, FIRE_ALPHA, 0
+
+    def pairs_at(x):
+        i, j, _ = neighbour_pairs(x, 2 + SKIN)
+        return i, j, k * (1 + proton_stiffness * (charge[i] + charge[j]) / 2), x.copy()
+
+    def forces_at(x):
+        repulsion = overlap_forces(x, i, j, stiffness_ij)[0]
+        return repulsion + confinement_forces(x)[0]
+
+    i, j, stiffness_ij, anchor = pairs_at(x)
+    force = forces_at(x)
+    steps, converged = 0, False
+    for steps in range(1, max_steps + 1):
+        power = float(np.sum(force * v))
+        if power > 0:
+            force_norm = np.linalg.norm(force)
+            v = (1 - alpha) * v + alpha * np.linalg.norm(v) * force / max(force_norm, 1e-300)
+            uphill_free += 1
+            if uphill_free > FIRE_N_MIN:
+                dt, alpha = min(dt * FIRE_F_INC, FIRE_DT_MAX), alpha * FIRE_F_ALPHA
+        else:
+            v[:] = 0.0
+            dt, alpha, uphill_free = dt * FIRE_F_DEC, FIRE_ALPHA, 0
+
+        v += 0.5 * dt * force
+        x += dt * v
+        if np.max(np.sum((x - anchor)**2, axis=1)) > (SKIN / 2)**2:
+            i, j, stiffness_ij, anchor = pairs_at(x)
+        force = forces_at(x)
+        v += 0.5 * dt * force
+
+        if np.max(np.abs(force)) < force_tolerance:
+            converged = True
+            break
+    return x, steps, converged, float(np.max(np.abs(force)))
+
+
+def packing_summary(positions, charge, stiffness=None, proton_stiffness=PROTON_STIFFNESS, r_nucleon=R_NUCLEON):
+    # Physical observables of a relaxed packing. The binding energy is the crushed (pairwise
+    # lens) volume times the medium pressure, E = rho c^2 dV, as in the cluster solvers.
+    k = calibrate_stiffness() if stiffness is None else stiffness
+    i, j, _ = neighbour_pairs(positions, 2.0)
+    stiffness_ij = k * (1 + proton_stiffness * (charge[i] + charge[j]) / 2)
+    _, weighted, defect, contacts = overlap_forces(positions, i, j, stiffness_ij)
+    envelope, radius, _ = envelope_volume(positions)
+    A = len(positions)
+    binding = UNIVERSAL_PRESSURE * defect * r_nucleon**3 / JOULES_TO_MEV
+    return {
+        "A": A,
+        "energy": envelope + weighted,
+        "contacts": contacts,
+        "contacts_per_nucleon": 2 * contacts / A,
+        "overlap_fraction": defect / (A * (4/3) * np.pi),
+        "envelope_radius_fm": radius * r_nucleon * 1e15,
+        "binding_MeV": binding,
+        "binding_per_nucleon_MeV": binding / A,
+    }
+
+
+def relax_nucleus(Z, N, seed=0, restarts=1, proton_stiffness=PROTON_STIFFNESS, stiffness=None,
+                  force_tolerance=FORCE_TOLERANCE, max_steps=MAX_STEPS, return_positions=False):
+    # Large packings have many local minima: relax from `restarts` random starts
+    # (seeds seed, seed + 1, ...) and keep the lowest packing energy. The lowest-U packing is
+    # not the most strongly bound one, so B/A is also summarised over all restarts.
+    best, per_nucleon = None, []
+    for start in range(seed, seed + restarts):
+        positions, charge = initial_packing(Z, N, start)
+        positions, steps, converged, residual = relax_packing(positions, charge, stiffness, proton_stiffness,
+                                                              force_tolerance, max_steps)
+        result = {"Z": Z, "N": N, "seed": start, "steps": steps, "converged": converged, "max_force": residual}
+        result.update(packing_summary(positions, charge, stiffness, proton_stiffness))
+        per_nucleon.append(result["binding_per_nucleon_MeV"])
+        if return_positions:
+            result["positions_m"] = positions * R_NUCLEON
+            result["charge"] = charge
+        if best is None or result["energy"] < best["energy"]:
+            best = result
+    best["restarts"] = restarts
+    best["binding_per_nucleon_mean_MeV"] = float(np.mean(per_nucleon))
+    # Sample spread between random starts; undefined (nan) for a single start
+    best["binding_per_nucleon_spread_MeV"] = float(np.std(per_nucleon, ddof=1)) if restarts > 1 else float("nan")
+    return best
+
+
+# 4. BATCHED (Z, N) CANDIDATES
+def _relax_candidate(candidate, options):
+    Z, N = candidate
+    return relax_nucleus(Z, N, **options)
+
+
+def relax_candidates(candidates, jobs=None, **options):
+    # One relaxation per (Z, N) across a process pool; results keep the input order.
+    # The He-4 stiffness calibration is done once here and shipped to the workers.
+    candidates = [(int(Z), int(N)) for Z, N in candidates]
+    options.setdefault("stiffness", calibrate_stiffness())
+    jobs = jobs or min(len(candidates), os.cpu_count() or 1)
+    work = functools.partial(_relax_candidate, options=options)
+    if jobs == 1:
+        return [work(candidate) for candidate in candidates]
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(work, candidates))
+
+
+def island_scan(Z_values, N_values, jobs=None, **options):
+    # Relaxes the whole Z x N grid and ranks each Z's isotopes by mean B/A over the restarts.
+    # The leader only counts as the geometric island candidate when its mean - spread band
+    # clears every other isotope's mean + spread band, and it is not the last N scanned.
+    candidates = [(Z, N) for Z in Z_values for N in N_values]
+    results = relax_candidates(candidates, jobs, **options)
+    best = {}
+    for Z in dict.fromkeys(result["Z"] for result in results):
+        isotopes = sorted((result for result in results if result["Z"] == Z),
+                          key=lambda result: result["binding_per_nucleon_mean_MeV"], reverse=True)
+        leader, others = isotopes[0], isotopes[1:]
+        floor = leader["binding_per_nucleon_mean_MeV"] - leader["binding_per_nucleon_spread_MeV"]
+        ceiling = max((other["binding_per_nucleon_mean_MeV"] + other["binding_per_nucleon_spread_MeV"]
+                       for other in others), default=-np.inf)
+        scanned = [result["N"] for result in isotopes]
+        best[Z] = dict(leader, resolved=bool(others) and bool(floor > ceiling),
+                       at_edge=len(scanned) > 1 and leader["N"] in (min(scanned), max(scanned)))
+    return results, best
+
+
+def _parse_range(text):
+    # "114" or "178:190" (inclusive) or "178:190:2"
+    parts = [int(part) for part in text.split(":")]
+    if len(parts) == 1:
+        return [parts[0]]
+    step = parts[2] if len(parts) == 3 else 1
+    return list(range(parts[0], parts[1] + 1, step))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Relax 3-D nucleon packings of (Z, N) candidates under PPT pressure.")
+    parser.add_argument("--Z", default="114", help="Proton number(s): 114 or 112:116")
+    parser.add_argument("--N", default="180:188:2", help="Neutron number(s): 184 or 178:190:2")
+    parser.add_argument("--proton-stiffness", type=float, default=PROTON_STIFFNESS)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--restarts", type=int, default=4, help="Random starts per nucleus (lowest energy kept)")
+    parser.add_argument("--jobs", type=int, default=None, help="Worker processes (default: one per candidate/CPU)")
+    args = parser.parse_args(argv)
+
+    print("--- PPT - Atoms: PPT 3.0: Superheavy Packing Relaxation ---")
+    k = calibrate_stiffness()
+    print(f"Overlap stiffness k = {k:.4f} P (He-4 tetrahedron at Phi_ppt = {COMPRESSION_HE4 * 100:.3f}%)")
+    print(f"Proton stiffness factor = {args.proton_stiffness:.3f}\n")
+
+    Z_values, N_values = _parse_range(args.Z), _parse_range(args.N)
+    results, best = island_scan(Z_values, N_values, args.jobs, seed=args.seed, restarts=args.restarts,
+                                proton_stiffness=args.proton_stiffness)
+
+    # Packing columns describe the lowest-energy restart; the last column spans all restarts
+    print(f"{'Nucleus':<9} | {'Contacts/A':>10} | {'Overlap':>8} | {'R_env (fm)':>10} | "
+          f"{'B (MeV)':>9} | {'B/A (MeV)':>9} | {'B/A mean +/- spread':>19} | Steps")
+    print("-" * 100)
+    for result in results:
+        flag = "" if result["converged"] else " (not converged)"
+        print(f"Z={result['Z']:<3} N={result['N']:<3} | {result['contacts_per_nucleon']:>10.2f} | "
+              f"{result['overlap_fraction'] * 100:>7.3f}% | {result['envelope_radius_fm']:>10.3f} | "
+              f"{result['binding_MeV']:>9.1f} | {result['binding_per_nucleon_MeV']:>9.4f} | "
+              f"{result['binding_per_nucleon_mean_MeV']:>9.4f} +/- {result['binding_per_nucleon_spread_MeV']:<6.4f} | "
+              f"{result['steps']}{flag}")
+
+    print(f"\n{'Z':>3} | {'3-D packing N':>24} | {'Golden rule N':>13}")
+    print("-" * 47)
+    for Z, result in best.items():
+        if not result["resolved"]:
+            packing = "unresolved (in spread)"
+        elif result["at_edge"]:
+            packing = f"{result['N']} (scan edge)"
+        else:
+            packing = str(result["N"])
+        print(f"{Z:>3} | {packing:>24} | {Z + round(Z * PHI_CONJUGATE):>13}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,4 @@
-import numpy as np
+from Validation_Result import ValidationResult, validation
 
 # PPT-Atoms Validation Suite v1.0.0
 # Script: U235_Fission_Cavitation_Solver.py
@@ -6,6 +6,7 @@ import numpy as np
 # Theory: Plasma Pressure Theory (PPT) 3.0
 # Description: Models nuclear fission as macroscopic hydrostatic cavitation (volume collapse) in the universal medium.
 
+@validation
 def solve_fission_cavitation():
     print("--- PPT - Atoms: PPT 3.0: U-235 Fission Hydrostatic Cavitation Solver ---")
     
@@ -66,5 +67,10 @@ def solve_fission_cavitation():
     if 14.0 < Yield_kilotons < 18.0:
         print("\nMACRO VALIDATION SUCCESSFUL: Fluid-dynamic cavitation maps perfectly to nuclear yields.")
 
+    # The historical ~15.0 kt yield is the reference
+    return ValidationResult(None, "U-235 Macro Yield (1 kg)", Yield_kilotons, historical_yield, "kt TNT",
+                            {"rho_medium_nuclear": rho_medium_nuclear, "E_U235_MeV": E_U235_MeV,
+                             "E_Ba141_MeV": E_Ba141_MeV, "E_Kr92_MeV": E_Kr92_MeV})
+
 if __name__ == "__main__":
     solve_fission_cavitation()
\ No newline at end of file
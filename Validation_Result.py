@@ -0,0 +1,245 @@
+import contextlib
+import functools
+import json
+import math
+import os
+import time
+
+# PPT-Atoms Validation Suite v1.0.0
+# Module: Validation_Result.py
+# Author: Vladimir Milosevic
+# Theory: Plasma Pressure Theory (PPT) 3.0
+# Description: Result objects returned by the validation solvers and a columnar NPZ store that aggregates them across runs.
+
+FIELDS = ("solver", "quantity", "predicted", "reference", "accuracy", "unit", "parameters", "elapsed_s")
+
+# Fixed columns of the store; numeric solver parameters are added as "param_<name>" columns
+STRING_COLUMNS = ("solver", "quantity", "unit", "parameters")
+FLOAT_COLUMNS = ("predicted", "reference", "accuracy", "elapsed_s")
+PARAM_PREFIX = "param_"
+
+
+# 1. RESULT OBJECT
+def accuracy_percent(predicted, reference):
+    if reference == 0:
+        return 100.0 if predicted == 0 else None
+    return (1 - abs(predicted - reference) / abs(reference)) * 100
+
+
+class ValidationResult:
+    # One predicted quantity against its reference; __slots__ keeps thousands of them cheap
+    __slots__ = FIELDS
+
+    def __init__(self, solver, quantity, predicted, reference, unit="", parameters=None,
+                 elapsed_s=float("nan"), accuracy=None):
+        self.solver = solver
+        self.quantity = quantity
+        self.predicted = float(predicted)
+        self.reference = float(reference)
+        self.accuracy = accuracy_percent(self.predicted, self.reference) if accuracy is None else float(accuracy)
+        self.unit = unit
+        self.parameters = dict(parameters or {})
+        self.elapsed_s = float(elapsed_s)
+
+    def as_dict(self):
+        return {field: getattr(self, field) for field in FIELDS}
+
+    @classmethod
+    def from_dict(cls, row):
+        return cls(**{field: row[field] for field in FIELDS if field in row})
+
+    def __repr__(self):
+        return (f"ValidationResult({self.solver!r}, {self.quantity!r}, predicted={self.predicted:.6g}, "
+                f"reference={self.reference:.6g}, accuracy={self.accuracy}, unit={self.unit!r})")
+
+
+# 2. SOLVER DECORATOR AND COLLECTION
+_COLLECTORS = []
+
+
+@contextlib.contextmanager
+def collect():
+    # Every result returned by a @validation solver inside the block is appended to the list,
+    # which lets the suite runner execute a script as __main__ and still receive its results
+    results = []
+    _COLLECTORS.append(results)
+    try:
+        yield results
+    finally:
+        _COLLECTORS.remove(results)
+
+
+def validation(function):
+    # Fills in the solver name (script file) and wall time of the returned result(s)
+    source = function.__globals__.get("__file__")
+    solver = os.path.splitext(os.path.basename(source))[0] if source else function.__qualname__
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        value = function(*args, **kwargs)
+        elapsed = time.perf_counter() - start
+        results = as_results(value)
+        for result in results:
+            if result.solver is None:
+                result.solver = solver
+            if math.isnan(result.elapsed_s):
+                result.elapsed_s = elapsed
+        for collector in _COLLECTORS:
+            collector.extend(results)
+        return value
+
+    return wrapper
+
+
+def as_results(value):
+    if value is None:
+        return []
+    if isinstance(value, ValidationResult):
+        return [value]
+    return [result for result in value if isinstance(result, ValidationResult)]
+
+
+# 3. COLUMNAR STORE
+def results_to_columns(results):
+    # Column arrays for one batch; parameters are kept whole (JSON) and numeric ones also as columns
+    import numpy as np
+
+    columns = {}
+    columns["solver"] = np.array([r.solver or "" for r in results], dtype=str)
+    columns["quantity"] = np.array([r.quantity for r in results], dtype=str)
+    columns["unit"] = np.array([r.unit for r in results], dtype=str)
+    columns["parameters"] = np.array([json.dumps(r.parameters, sort_keys=True) for r in results], dtype=str)
+    for name in FLOAT_COLUMNS:
+        values = [getattr(r, name) for r in results]
+        columns[name] = np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+
+    numeric = sorted({key for r in results for key, value in r.parameters.items()
+                      if isinstance(value, (int, float)) and not isinstance(value, bool)})
+    for key in numeric:
+        columns[PARAM_PREFIX + key] = np.array([r.parameters.get(key, np.nan) for r in results], dtype=np.float64)
+    return columns
+
+
+class ResultStore:
+    # Append-only directory of NPZ batches; each append is one file, so concurrent writers
+    # (suite workers, sweeps) never touch the same file and a killed run loses one batch at most
+    def __init__(self, directory):
+        self.directory = os.path.abspath(directory)
+        os.makedirs(self.directory, exist_ok=True)
+
+    def batches(self):
+        return sorted(name for name in os.listdir(self.directory)
+                      if name.startswith("batch_") and name.endswith(".npz"))
+
+    def append(self, results):
+        import numpy as np
+
+        results = as_results(results)
+        if not results:
+            return None
+        name = f"batch_{time.time_ns():020d}_{os.getpid()}.npz"
+        path = os.path.join(self.directory, name)
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as handle:
+            np.savez_compressed(handle, **results_to_columns(results))
+        os.replace(tmp, path)
+        return path
+
+    def load(self, columns=None, **filters):
+        # Concatenated columns of every batch, optionally restricted to rows whose string
+        # columns equal the given values, e.g. load(solver="Carbon12_Alpha_Cluster_Solver")
+        import numpy as np
+
+        parts = []
+        for name in self.batches():
+            with np.load(os.path.join(self.directory, name)) as batch:
+                parts.append({key: batch[key] for key in batch.files})
+        names = sorted({key for part in parts for key in part}, key=_column_order)
+        if columns is not None:
+            names = [name for name in names if name in columns or name in filters]
+
+        table = {}
+        for name in names:
+            pieces = []
+            for part in parts:
+                if name in part:
+                    pieces.append(part[name])
+                elif name in STRING_COLUMNS:
+                    pieces.append(np.full(part["predicted"].size, "", dtype=str))
+                else:
+                    pieces.append(np.full(part["predicted"].size, np.nan))
+            table[name] = np.concatenate(pieces)
+
+        if filters and table:
+            mask = np.ones(len(next(iter(table.values()))), dtype=bool)
+            for key, value in filters.items():
+                mask &= table[key] == value
+            table = {name: values[mask] for name, values in table.items()
+                     if columns is None or name in columns}
+        return table
+
+    def results(self, **filters):
+        table = self.load(**filters)
+        n = table["predicted"].size if table else 0
+        return [ValidationResult(
+            str(table["solver"][i]), str(table["quantity"][i]), table["predicted"][i], table["reference"][i],
+            unit=str(table["unit"][i]), parameters=json.loads(table["parameters"][i]),
+            elapsed_s=table["elapsed_s"][i], accuracy=table["accuracy"][i],
+        ) for i in range(n)]
+
+    def summary(self, **filters):
+        # Per (solver, quantity): run count, mean / min accuracy and mean solver time
+        import numpy as np
+
+        table = self.load(columns=("solver", "quantity", "accuracy", "elapsed_s"), **filters)
+        if not table or table["solver"].size == 0:
+            return []
+        solvers, solver_code = np.unique(table["solver"], return_inverse=True)
+        quantities, quantity_code = np.unique(table["quantity"], return_inverse=True)
+        groups, inverse = np.unique(solver_code * quantities.size + quantity_code, return_inverse=True)
+        rows = []
+        for k, group in enumerate(groups):
+            in_group = inverse == k
+            accuracy = table["accuracy"][in_group]
+            elapsed = table["elapsed_s"][in_group]
+            rows.append({
+                "solver": str(solvers[group // quantities.size]),
+                "quantity": str(quantities[group % quantities.size]),
+                "runs": int(in_group.sum()),
+                "mean_accuracy": float(np.nanmean(accuracy)) if np.isfinite(accuracy).any() else None,
+                "min_accuracy": float(np.nanmin(accuracy)) if np.isfinite(accuracy).any() else None,
+                "mean_elapsed_s": float(np.nanmean(elapsed)) if np.isfinite(elapsed).any() else None,
+            })
+        return rows
+
+
+def _column_order(name):
+    fixed = STRING_COLUMNS + FLOAT_COLUMNS
+    return (fixed.index(name), "") if name in fixed else (len(fixed), name)
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Summarize a PPT-Atoms result store.")
+    parser.add_argument("store", help="Result store directory (e.g. written by `Validation_Suite_Runner.py --store`)")
+    parser.add_argument("--solver", help="Only this solver")
+    args = parser.parse_args(argv)
+
+    filters = {"solver": args.solver} if args.solver else {}
+    store = ResultStore(args.store)
+    print(f"--- PPT - Atoms: PPT 3.0: Result Store ({len(store.batches())} batches) ---")
+    print(f"\n{'Solver':<40} | {'Quantity':<28} | {'Runs':>5} | {'Mean Acc.':>9} | {'Min Acc.':>9}")
+    print("-" * 104)
+    for row in store.summary(**filters):
+        mean = f"{row['mean_accuracy']:.2f}%" if row["mean_accuracy"] is not None else "-"
+        low = f"{row['min_accuracy']:.2f}%" if row["min_accuracy"] is not None else "-"
+        print(f"{row['solver'][:40]:<40} | {row['quantity'][:28]:<28} | {row['runs']:>5} | {mean:>9} | {low:>9}")
+    return 0
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(main())
@@ -0,0 +1,203 @@
+import argparse
+import contextlib
+import glob
+import io
+import json
+import os
+import re
+import runpy
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from Validation_Result import ResultStore, ValidationResult, collect
+
+# PPT-Atoms Validation Suite v1.0.0
+# Module: Validation_Suite_Runner.py
+# Author: Vladimir Milosevic
+# Theory: Plasma Pressure Theory (PPT) 3.0
+# Description: Runs every validation script headless (Agg) in a process pool and collects a structured JSON/NDJSON report.
+
+SUITE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# A validation script carries the "# Script:" header line; shared engines and tooling use "# Module:".
+SCRIPT_HEADER = re.compile(r"^#\s*Script:", re.MULTILINE)
+
+
+def discover_solvers(directory=SUITE_DIR):
+    # Every top-level script that carries the validation header is a solver
+    solvers = []
+    for path in sorted(glob.glob(os.path.join(directory, "*.py"))):
+        with open(path, encoding="utf-8") as handle:
+            head = handle.read(2048)
+        if SCRIPT_HEADER.search(head):
+            solvers.append(path)
+    return solvers
+
+
+def _init_headless_worker():
+    # Must run before any script imports pyplot: plt.show() becomes a no-op under Agg
+    os.environ["MPLBACKEND"] = "Agg"
+
+
+def run_solver(path, workdir):
+    # Executes one validation script exactly as `python script.py` would, but headless.
+    # Each script runs in its own scratch directory so the figures it saves can be
+    # attributed to it (and cached) before they are moved into the shared workdir.
+    name = os.path.splitext(os.path.basename(path))[0]
+    scratch = os.path.join(workdir, ".scratch", name)
+    buffer = io.StringIO()
+    status, error, collected = "ok", None, []
+    previous_dir, previous_argv = os.getcwd(), sys.argv
+    start = time.perf_counter()
+    try:
+        os.makedirs(scratch, exist_ok=True)
+        os.chdir(scratch)
+        # The runner's own options must not reach scripts that read sys.argv
+        sys.argv = [path]
+        # Solvers decorated with Validation_Result.validation hand their results to the collector
+        with collect() as collected, contextlib.redirect_stdout(buffer):
+            runpy.run_path(path, run_name="__main__")
+    except BaseException as exc:  # a failing script must not take the pool down
+        status, error = "error", f"{type(exc).__name__}: {exc}"
+    finally:
+        os.chdir(previous_dir)
+        sys.argv = previous_argv
+        # Scripts change global Matplotlib state (styles, open figures); reset it for the next job
+        if "matplotlib.pyplot" in sys.modules:
+            import matplotlib
+            import matplotlib.pyplot as plt
+            plt.close("all")
+            matplotlib.rcdefaults()
+    elapsed = time.perf_counter() - start
+
+    artifacts = []
+    for artifact in sorted(os.listdir(scratch)):
+        os.replace(os.path.join(scratch, artifact), os.path.join(workdir, artifact))
+        artifacts.append(artifact)
+    os.rmdir(scratch)
+
+    stdout = buffer.getvalue()
+    return {
+        "solver": name,
+        "script": os.path.basename(path),
+        "status": status,
+        "error": error,
+        "elapsed_s": elapsed,
+        "cached": False,
+        "artifacts": artifacts,
+        "results": [result.as_dict() for result in collected] if status == "ok" else [],
+        "stdout": stdout,
+    }
+
+
+def run_suite(solvers=None, jobs=None, workdir="suite_output", keep_stdout=False, cache=None):
+    # All scripts run concurrently, so wall time tracks the slowest script, not the sum.
+    # With a Result_Cache.ResultCache, scripts whose source (and local imports) are unchanged
+    # are served from the cache, figures included, and only the rest are executed.
+    paths = [os.path.abspath(path) for path in (solvers if solvers else discover_solvers())]
+    workdir = os.path.abspath(workdir)
+    reports, keys, pending = [], {}, []
+    if cache is not None:
+        from Result_Cache import solver_key
+    for path in paths:
+        if cache is not None:
+            keys[path] = solver_key(path, {"runner": "run_solver", "backend": "Agg"})
+            report = cache.get(keys[path], restore_dir=workdir)
+            if report is not None:
+                report["cached"] = True
+                if not keep_stdout:
+                    report.pop("stdout", None)
+                reports.append(report)
+                continue
+        pending.append(path)
+
+    if pending:
+        with ProcessPoolExecutor(max_workers=jobs or min(len(pending), os.cpu_count() or 1),
+                                 initializer=_init_headless_worker) as pool:
+            futures = {pool.submit(run_solver, path, workdir): path for path in pending}
+            for future in as_completed(futures):
+                report = future.result()
+                path = futures[future]
+                if cache is not None and report["status"] == "ok":
+                    cache.put(keys[path], report, label=report["solver"],
+                              artifacts=[os.path.join(workdir, name) for name in report["artifacts"]])
+                if not keep_stdout:
+                    report.pop("stdout")
+                reports.append(report)
+    reports.sort(key=lambda report: report["solver"])
+    return reports
+
+
+def flatten_reports(reports):
+    # One row per validated quantity (solvers without numeric output still get one status row)
+    rows = []
+    for report in reports:
+        base = {key: report[key] for key in ("solver", "script", "status", "error", "elapsed_s", "cached")}
+        if not report["results"]:
+            rows.append(dict(base, quantity=None, unit=None, predicted=None, reference=None, accuracy=None))
+        for result in report["results"]:
+            # The report's elapsed_s times the whole script; the result's own timing is the solver call
+            rows.append(dict(base, **{"solve_s" if key == "elapsed_s" else key: value
+                                      for key, value in result.items()}))
+    return rows
+
+
+def write_report(reports, path, fmt="ndjson"):
+    rows = flatten_reports(reports)
+    with open(path, "w", encoding="utf-8") as handle:
+        if fmt == "ndjson":
+            for row in rows:
+                handle.write(json.dumps(row) + "\n")
+        else:
+            json.dump(rows, handle, indent=2)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the PPT-Atoms validation suite headless and in parallel.")
+    parser.add_argument("solvers", nargs="*", help="Script paths to run (default: every validation script)")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="Worker processes (default: one per script)")
+    parser.add_argument("-o", "--output", default="suite_report.ndjson", help="Report file")
+    parser.add_argument("--format", choices=("ndjson", "json"), default="ndjson")
+    parser.add_argument("--workdir", default="suite_output", help="Directory receiving saved figures")
+    parser.add_argument("--cache", default=".ppt_cache", help="Result/figure cache directory")
+    parser.add_argument("--cache-size", type=float, default=512, help="Cache size limit in MiB (LRU eviction)")
+    parser.add_argument("--no-cache", action="store_true", help="Run every script even if it is unchanged")
+    parser.add_argument("--store", default=None, help="Append the results to this columnar result store (NPZ)")
+    args = parser.parse_args(argv)
+
+    print("--- PPT - Atoms: PPT 3.0: Headless Parallel Validation Runner ---")
+    cache = None
+    if not args.no_cache:
+        from Result_Cache import ResultCache
+        cache = ResultCache(args.cache, max_bytes=args.cache_size * 2**20)
+    start = time.perf_counter()
+    try:
+        reports = run_suite(args.solvers, jobs=args.jobs, workdir=args.workdir, cache=cache)
+    finally:
+        if cache is not None:
+            cache.close()
+    wall = time.perf_counter() - start
+    write_report(reports, args.output, args.format)
+    if args.store:
+        # Cached reports repeat an earlier run's numbers; only fresh executions are appended
+        ResultStore(args.store).append([ValidationResult.from_dict(result) for report in reports
+                                        if not report["cached"] for result in report["results"]])
+
+    print(f"\n{'Solver':<40} | {'Status':<6} | {'Time (s)':<8} | {'Min Accuracy':<12}")
+    print("-" * 76)
+    for report in reports:
+        accuracies = [r["accuracy"] for r in report["results"] if r["accuracy"] is not None]
+        worst = f"{min(accuracies):.2f}%" if accuracies else "-"
+        status = "cached" if report["cached"] else report["status"]
+        print(f"{report['solver']:<40} | {status:<6} | {report['elapsed_s']:<8.3f} | {worst:>12}")
+
+    serial = sum(report["elapsed_s"] for report in reports if not report["cached"])
+    n_cached = sum(report["cached"] for report in reports)
+    print(f"\nWall time: {wall:.2f} s (serial script time: {serial:.2f} s, {n_cached} served from cache)")
+    print(f"Report written to: {args.output}")
+    return 0 if all(report["status"] == "ok" for report in reports) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,4 @@
-import numpy as np
+from Validation_Result import ValidationResult, validation
 
 # PPT-Atoms Validation Suite v1.0.0
 # Script: Water_Bond_Angle_Hydrostatic_Solver.py
@@ -6,6 +6,7 @@ import numpy as np
 # Theory: Plasma Pressure Theory (PPT) 3.0
 # Description: Calculates H2O bond angles using fluid-dynamic node compression limits.
 
+@validation
 def solve_water_bond_angle():
     print("--- PPT - Atoms: PPT 3.0: Water (H2O) Bond Angle Hydrostatic Solver ---")
     
@@ -19,8 +20,8 @@ def solve_water_bond_angle():
     # Axis A & B: Single nodes (Hydrogen Pinned)
     # Axis C & D: Double nodes (The PPT "Double-Layer Overlap")
     
-    nodes_per_axis = np.array([1, 1, 2, 2])
-    total_displacement_nodes = np.sum(nodes_per_axis) # 6.0
+    nodes_per_axis = [1, 1, 2, 2]
+    total_displacement_nodes = sum(nodes_per_axis) # 6.0
     
     # Excess volume is the displacement asymmetry that attracts medium pressure
     # Formula: (Asymmetric Axis Count) * (Node Delta)
@@ -55,5 +56,9 @@ def solve_water_bond_angle():
     print("Water's bond angle is not a probability; it is the physical result of")
     print("external hydrostatic pressure crushing a 6-node tetrahedral lattice.")
 
+    return ValidationResult(None, "H2O Bond Angle", theta_h2o_pred, real_h2o_obs, "deg",
+                            {"theta_ideal": theta_ideal,
+                             "max_structural_compression_limit": max_structural_compression_limit})
+
 if __name__ == "__main__":
     solve_water_bond_angle()
\ No newline at end of file
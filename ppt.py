@@ -0,0 +1,145 @@
+import argparse
+import importlib
+import sys
+
+# PPT-Atoms Validation Suite v1.0.0
+# Module: ppt.py
+# Author: Vladimir Milosevic
+# Theory: Plasma Pressure Theory (PPT) 3.0
+# Description: Single entry point for every solver and tool; modules are imported only when their command runs, and Matplotlib only with --plot.
+
+# Plotting behaviour of a registered solver
+NO_PLOT = "none"        # never draws
+OPTIONAL_PLOT = "plot"  # takes plot=True/False; the table is printed either way
+PLOT_ONLY = "figure"    # output is the figure itself, so it needs --plot
+
+# name: ('module:function', plotting, description)
+# Nothing here is imported until the solver is run: `ppt list` and `ppt run carbon12` never load Matplotlib.
+SOLVERS = {
+    "helium4":             ("Helium4_Nuclear_Binding_Solver:solve_alpha_binding_energy", NO_PLOT,
+                            "He-4 binding energy from tetrahedral node compression"),
+    "carbon12":            ("Carbon12_Alpha_Cluster_Solver:solve_carbon12_binding", NO_PLOT,
+                            "C-12 binding energy of the triangular alpha-cluster lattice"),
+    "alpha_chain":         ("Alpha_Cluster_Lattice_Solver:solve_alpha_conjugate_chain", NO_PLOT,
+                            "Be-8 .. Ca-40 binding energies from alpha-cluster contact geometry"),
+    "sphere_overlap":      ("Sphere_Overlap_Integrator:run_overlap_derivation", NO_PLOT,
+                            "He-4 tetrahedral separation behind the 2.223% overlap fraction"),
+    "u235_fission":        ("U235_Fission_Cavitation_Solver:solve_fission_cavitation", NO_PLOT,
+                            "U-235 fission energy as hydrostatic cavitation"),
+    "proton_radius":       ("Proton_Radius_Hydrostatic_Solver:solve_proton_radius", NO_PLOT,
+                            "Muonic proton radius from probe displacement"),
+    "hydrogen_ionization": ("Ionization_Energy_Hydrostatic_Solver:solve_ionization_displacement", NO_PLOT,
+                            "Hydrogen ionization energy"),
+    "helium_ionization":   ("Helium_Ionization_Alpha_Lock_Solver:solve_helium_ionization", NO_PLOT,
+                            "Helium first ionization energy (alpha lock)"),
+    "lithium_ionization":  ("Lithium_Ionization_Geometric_Solver:solve_lithium_ionization", NO_PLOT,
+                            "Lithium first ionization energy (volumetric shielding)"),
+    "water_bond_angle":    ("Water_Bond_Angle_Hydrostatic_Solver:solve_water_bond_angle", NO_PLOT,
+                            "H2O bond angle from node compression"),
+    "spectral_transitions": ("Spectral_Transitions_Harmonic_Solver:calculate_harmonic_transition", NO_PLOT,
+                             "Hydrogen spectral lines as harmonic transitions"),
+    "spectral_lines":      ("Spectral_Line_Matcher:run_line_matching", NO_PLOT,
+                            "Match observed wavelengths against the harmonic line catalogue"),
+    "nuclide_chart":       ("Nuclide_Chart_Binding_Engine:run_chart_validation", NO_PLOT,
+                            "Vectorized binding energies across a nuclide table (optional CSV argument)"),
+    "periodic_model":      ("Periodic_Harmonic_Packing_Model:run_periodic_model", NO_PLOT,
+                            "Harmonic packing fit of all 118 ionization energies"),
+    "uncertainty":         ("Constants_Uncertainty_Propagation:run_uncertainty_propagation", NO_PLOT,
+                            "Monte Carlo propagation of constant uncertainties"),
+    "anisotropy":          ("Anisotropy_Statistics_Engine:run_anisotropy_falsification", NO_PLOT,
+                            "Streaming anisotropy statistics of alpha emission directions"),
+    "parameter_sweeps":    ("Parameter_Sweep_Engine:run_parameter_sweeps", NO_PLOT,
+                            "Resumable parameter sweeps of the solver constants"),
+    "island_of_stability": ("Flerovium_Island_of_Stability_Solver:solve_island_of_stability", OPTIONAL_PLOT,
+                            "Flerovium magic neutron number (--plot: tension surface)"),
+    "period2_trend":       ("Period2_Harmonic_Packing_Trend:plot_period2_packing_trend", OPTIONAL_PLOT,
+                            "Period 2 ionization trend from harmonic packing"),
+    "period3_trend":       ("Period3_Harmonic_Packing_Trend:plot_period3_packing_trend", OPTIONAL_PLOT,
+                            "Period 3 ionization trend from harmonic packing"),
+    "bond_angle_trend":    ("Molecular_Bond_Angle_Trend_Solver:plot_molecular_trend", OPTIONAL_PLOT,
+                            "CH4 / NH3 / H2O bond angle trend"),
+    "bow_shock":           ("Relativistic_Mass_Hydrostatic_Bow_Shock:calculate_bow_shock_displacement", OPTIONAL_PLOT,
+                            "Lorentz factor as Prandtl-Glauert compressibility"),
+    "half_life":           ("Deterministic_Half_Life_Acoustic_Solver:simulate_ppt_decay_corrected", OPTIONAL_PLOT,
+                            "Tritium / C-14 half-lives as acoustic fatigue"),
+    "decay_topology":      ("Fasifiable_Cleavage_And_Alpha_Decay:plot_decay_topology", PLOT_ONLY,
+                            "Tetrahedral cleavage vs isotropic emission figure"),
+}
+
+# Tools with their own argument parsers: `ppt <tool> ...` hands the remaining arguments to main(argv)
+TOOLS = {
+    "suite":   ("Validation_Suite_Runner:main", "Run every validation script headless and write a report"),
+    "render":  ("Figure_Render_Pipeline:main", "Render every figure offscreen in a worker pool"),
+    "bench":   ("Solver_Benchmark_Suite:main", "Benchmark the solvers against the stored baseline"),
+    "profile": ("Stage_Profiler:main", "Per-stage profile of a solver with Chrome-trace output"),
+    "cache":   ("Result_Cache:main", "Inspect or clear the result cache"),
+    "relax":   ("Superheavy_Packing_Relaxation:main", "Relax 3-D nucleon packings of (Z, N) candidates"),
+    "fission": ("Fission_Channel_Energy_Matrix:main", "Energy release of every fission channel of the given parents"),
+}
+
+
+def resolve(spec):
+    module_name, _, attr = spec.partition(":")
+    return getattr(importlib.import_module(module_name), attr)
+
+
+def plot_conflict(name, plot):
+    plotting = SOLVERS[name][1]
+    if plot and plotting == NO_PLOT:
+        return f"{name} has no figure"
+    if not plot and plotting == PLOT_ONLY:
+        return f"{name} only produces a figure; pass --plot"
+    return None
+
+
+def run_solver(name, args=(), plot=False):
+    conflict = plot_conflict(name, plot)
+    if conflict:
+        raise ValueError(conflict)
+    spec, plotting, _ = SOLVERS[name]
+    function = resolve(spec)
+    if plotting == OPTIONAL_PLOT:
+        return function(*args, plot=plot)
+    return function(*args)
+
+
+def list_commands():
+    print("Solvers (ppt run <name> [--plot]):")
+    for name, (_, plotting, description) in SOLVERS.items():
+        marker = {NO_PLOT: " ", OPTIONAL_PLOT: "+", PLOT_ONLY: "*"}[plotting]
+        print(f"  {name:<22}{marker} {description}")
+    print("\n  + accepts --plot   * figure only (requires --plot)")
+    print("\nTools (ppt <tool> --help):")
+    for name, (_, description) in TOOLS.items():
+        print(f"  {name:<22}  {description}")
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if argv and argv[0] in TOOLS:
+        return resolve(TOOLS[argv[0]][0])(argv[1:])
+
+    parser = argparse.ArgumentParser(prog="ppt", description="PPT-Atoms solvers and tools.",
+                                     epilog=f"tools: {', '.join(TOOLS)} (see `ppt <tool> --help`)")
+    commands = parser.add_subparsers(dest="command")
+    commands.add_parser("list", help="List solvers and tools")
+    run = commands.add_parser("run", help="Run one solver")
+    run.add_argument("solver", help="Solver name (see `ppt list`)")
+    run.add_argument("args", nargs="*", help="Positional arguments passed to the solver")
+    run.add_argument("--plot", action="store_true", help="Also draw the solver's figure (imports Matplotlib)")
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        if args.solver not in SOLVERS:
+            parser.error(f"unknown solver {args.solver!r} (see `ppt list`)")
+        conflict = plot_conflict(args.solver, args.plot)
+        if conflict:
+            parser.error(conflict)
+        run_solver(args.solver, args.args, args.plot)
+        return 0
+    list_commands()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The suite is a flat directory of scripts: make its modules importable from tests/
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
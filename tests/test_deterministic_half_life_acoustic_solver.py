@@ -0,0 +1,21 @@
+import warnings
+
+import numpy as np
+import pytest
+
+from Deterministic_Half_Life_Acoustic_Solver import evaluate_isotope_table, lock_factor_from_half_life
+
+
+def test_exact_half_life_scores_full_accuracy():
+    result = evaluate_isotope_table(lock_factor_from_half_life([1e-9, 1.0, 4.468e9]), [1e-9, 1.0, 4.468e9])
+    assert result["accuracy"] == pytest.approx([100.0, 100.0, 100.0])
+
+
+def test_huge_mismatch_gives_finite_accuracy_without_warning():
+    # ln(pred / real) ~ 2900 used to overflow expm1 to inf and report -inf accuracy
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        result = evaluate_isotope_table([5000.0, 60.0], [1e-9, 1e20])
+    assert np.all(np.isfinite(result["accuracy"]))
+    assert result["accuracy"][0] < -1e300
+    assert result["accuracy"][1] == pytest.approx(0.0)
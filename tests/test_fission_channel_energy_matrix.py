@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+
+from Fission_Channel_Energy_Matrix import (
+    binding_grid,
+    channel,
+    fission_channels,
+    fold_yields,
+    grid_size,
+    semf_binding,
+)
+
+
+def test_reference_channel_matches_cavitation_solver():
+    # U235_Fission_Cavitation_Solver: Ba-141 + Kr-92 (+ 2n) releases 172.20 MeV
+    channels = fission_channels([(92, 235)])
+    dV_shift, energy = channel(channels, 0, 2, 56, 141)
+    assert energy == pytest.approx(172.20, abs=5e-3)
+    assert dV_shift == pytest.approx(1.3347e-45, rel=1e-4)
+    # Either fragment may be named first
+    assert channel(channels, 0, 2, 36, 92)[1] == pytest.approx(energy)
+
+
+def test_semf_channels_use_semf_parent():
+    # A channel with SEMF fragments must not subtract the tabulated parent
+    channels = fission_channels([(92, 235)])
+    nu, Z1, A1 = 2, 40, 100
+    Z2, A2 = 92 - Z1, 235 - nu - A1
+    expected = semf_binding(Z1, A1 - Z1) + semf_binding(Z2, A2 - Z2) - semf_binding(92, 143)
+    assert channel(channels, 0, nu, Z1, A1)[1] == pytest.approx(expected, rel=1e-9)
+    assert channels["parent_offset_MeV"][0] == pytest.approx(1783.8 - semf_binding(92, 143))
+
+
+def test_parents_outside_grid_are_rejected():
+    grid, tabulated = binding_grid()
+    with pytest.raises(ValueError):
+        fission_channels([(100, 262)], grid, tabulated)
+    assert grid_size([(100, 262)]) == {"Z_max": 100, "N_max": 162}
+    channels = fission_channels([(100, 262)])
+    assert np.isfinite(fold_yields(channels)["mean_MeV"]).all()
@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+from Molecular_Bond_Angle_Trend_Solver import iter_molecule_table, predict_molecule_table
+
+
+@pytest.fixture
+def columns():
+    rng = np.random.default_rng(0)
+    n = 1003
+    return {
+        "m_central": rng.uniform(10, 20, n),
+        "num_h_nodes": rng.integers(1, 5, n).astype(np.float64),
+        "observed_angle": rng.uniform(100, 110, n),
+    }
+
+
+@pytest.mark.parametrize("save", [np.savez, np.savez_compressed])
+def test_npz_is_streamed_in_chunks(tmp_path, columns, save):
+    path = str(tmp_path / "molecules.npz")
+    save(path, **columns)
+    chunks = list(iter_molecule_table(path, chunk_rows=100))
+    assert [len(chunk["m_central"]) for chunk in chunks] == [100] * 10 + [3]
+    for name, column in columns.items():
+        assert np.array_equal(np.concatenate([chunk[name] for chunk in chunks]), column)
+
+
+def test_npz_and_csv_tables_agree(tmp_path, columns):
+    npz_path = str(tmp_path / "molecules.npz")
+    csv_path = str(tmp_path / "molecules.csv")
+    np.savez_compressed(npz_path, **columns)
+    with open(csv_path, "w", encoding="utf-8") as handle:
+        handle.write("m_central,num_h_nodes,observed_angle\n")
+        np.savetxt(handle, np.column_stack(list(columns.values())), delimiter=",", fmt="%.17g")
+
+    from_npz = predict_molecule_table(npz_path, str(tmp_path / "npz.out"), chunk_rows=128)
+    from_csv = predict_molecule_table(csv_path, str(tmp_path / "csv.out"), chunk_rows=128)
+    assert from_npz == from_csv
+    assert (tmp_path / "npz.out").read_text() == (tmp_path / "csv.out").read_text()
@@ -0,0 +1,41 @@
+import pytest
+
+import Stage_Profiler
+
+
+def looped_solver():
+    total = 0
+    for k in range(2):
+        # 1. FIRST STAGE
+        total += k
+        # 2. SECOND STAGE
+        total *= 2
+    return total
+
+
+@pytest.fixture
+def profiler():
+    Stage_Profiler.reset()
+    Stage_Profiler.enable(memory=False)
+    yield Stage_Profiler
+    Stage_Profiler.disable()
+    Stage_Profiler.reset()
+
+
+def test_stages_inside_a_loop_reopen_on_every_pass(profiler):
+    assert profiler.run_with_stages(looped_solver) == 2
+    names = [record["name"] for record in sorted(profiler.records(), key=lambda r: r["start_ns"])]
+    assert names == [
+        "looped_solver",
+        "looped_solver: 1. FIRST STAGE",
+        "looped_solver: 2. SECOND STAGE",
+        "looped_solver: 1. FIRST STAGE",
+        "looped_solver: 2. SECOND STAGE",
+        # The loop header closes stage 2; the return line below it reopens it
+        "looped_solver: 2. SECOND STAGE",
+    ]
+    assert profiler._stack() == []
+
+
+def test_unbalanced_close_is_ignored(profiler):
+    assert profiler._close() is None
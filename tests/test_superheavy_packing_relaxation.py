@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+
+from Nuclide_Chart_Binding_Engine import COMPRESSION_HE4
+from Superheavy_Packing_Relaxation import island_scan, relax_candidates, relax_nucleus
+
+
+def test_helium4_relaxes_back_to_the_calibrated_overlap():
+    # Without the proton term every contact has the He-4 stiffness, so the relaxed
+    # tetrahedron must land on Phi_ppt and the 28.76 MeV binding energy
+    result = relax_nucleus(2, 2, proton_stiffness=0.0)
+    assert result["converged"]
+    assert result["contacts"] == 6
+    assert result["overlap_fraction"] == pytest.approx(COMPRESSION_HE4, rel=1e-6)
+    assert result["binding_MeV"] == pytest.approx(28.76, abs=5e-3)
+
+
+def test_restarts_keep_the_lowest_energy_and_report_the_spread():
+    runs = [relax_nucleus(6, 6, seed=seed) for seed in range(3)]
+    result = relax_nucleus(6, 6, seed=0, restarts=3)
+    assert result["energy"] == pytest.approx(min(run["energy"] for run in runs))
+    per_nucleon = [run["binding_per_nucleon_MeV"] for run in runs]
+    assert result["binding_per_nucleon_mean_MeV"] == pytest.approx(np.mean(per_nucleon))
+    assert result["binding_per_nucleon_spread_MeV"] == pytest.approx(np.std(per_nucleon, ddof=1))
+    assert np.isnan(relax_nucleus(6, 6)["binding_per_nucleon_spread_MeV"])
+
+
+def test_process_pool_matches_serial():
+    candidates = [(2, 2), (4, 4), (6, 6)]
+    serial = relax_candidates(candidates, jobs=1, restarts=2)
+    pooled = relax_candidates(candidates, jobs=2, restarts=2)
+    for one, other in zip(serial, pooled):
+        assert one.keys() == other.keys()
+        for key in one:
+            assert one[key] == pytest.approx(other[key], nan_ok=True)
+
+
+def test_single_start_scan_names_no_island():
+    _, best = island_scan([6], [6, 8], jobs=1)
+    assert not best[6]["resolved"]